@@ -23,8 +23,8 @@ def is_inside_reaper():
 
 
 from .tools import (
-    connect, connect_to_default_machine, dist_api_is_enabled, inside_reaper,
-    reconnect
+    batch, connect, connect_to_default_machine, dist_api_is_enabled,
+    inside_reaper, reconnect, stats
 )
 from . import reascript_api
 from .config import configure_reaper
@@ -2,8 +2,8 @@ from .core.reaper import *
 from .core import *
 from . import reascript_api as reascript_api
 from .tools import (
-    connect, connect_to_default_machine, dist_api_is_enabled, inside_reaper,
-    reconnect
+    batch, connect, connect_to_default_machine, dist_api_is_enabled,
+    inside_reaper, reconnect, stats
 )
 import sys
 
@@ -39,8 +39,10 @@ __all__ = [
     "Take",
     # core.project
     "Marker",
+    "MarkerList",
     "Project",
     "Region",
+    "RegionList",
     "TimeSelection",
     # core.track
     "AutomationItem",
@@ -102,9 +104,11 @@ __all__ = [
     'defer',
     'at_exit',
     # tools
+    'batch',
     'connect',
     'connect_to_default_machine',
     'dist_api_is_enabled',
     'inside_reaper',
     'reconnect',
+    'stats',
 ]
@@ -0,0 +1,51 @@
+"""
+``asyncio`` interface of the ``reapy`` dist API.
+
+Examples
+--------
+>>> import asyncio
+>>> import reapy, reapy.aio
+>>> async def main():
+...     async with await reapy.aio.connect() as client:
+...         n_tracks = await client.RPR.CountTracks(0)
+...         ids = await asyncio.gather(*(
+...             client.RPR.GetTrack(0, i) for i in range(n_tracks)
+...         ))
+...         return await asyncio.gather(*(
+...             client.get(reapy.Track(id), "name") for id in ids
+...         ))
+>>> asyncio.run(main())
+['Drums', 'Bass', 'Lead']
+"""
+
+from reapy.tools.network.async_client import (
+    AsyncClient, get_reapy_server_port
+)
+import typing as ty
+
+
+async def connect(host: str = "localhost",
+                  port: ty.Optional[int] = None) -> AsyncClient:
+    """
+    Connect to REAPER.
+
+    Unlike ``reapy.connect``, it does not select a machine for
+    ``reapy`` objects: calls are sent through the returned client.
+
+    Parameters
+    ----------
+    host : str, optional
+        Host of the machine running REAPER (default="localhost").
+    port : int, optional
+        Port of the ``reapy`` server. If None, it is read from the
+        REAPER web interface of ``host``.
+
+    Returns
+    -------
+    AsyncClient
+        Connected client.
+    """
+    ...
+
+
+__all__ = ["AsyncClient", "connect"]
@@ -0,0 +1,26 @@
+"""
+Benchmarks of the ``reapy`` dist API and core objects.
+
+Benchmarks run against a real ``reapy`` server hosted by a fake
+REAPER (see ``reapy.testing.FakeReaperServer``), so that they measure
+``reapy`` itself and can run without REAPER. They cover call latency,
+throughput of ``reapy.map`` and ``inside_reaper`` contexts, message
+encoding, ``TrackList`` iteration, MIDI note reads and audio sample
+transfers.
+
+Results are compared to a baseline stored on the host to detect
+regressions. From the command line (the first run saves the
+baseline)::
+
+    python -m reapy.benchmarks
+
+Examples
+--------
+>>> from reapy import benchmarks
+>>> results = benchmarks.run(["call_latency", "map_throughput"])
+>>> baseline = benchmarks.load_baseline()
+>>> print(benchmarks.format_report(benchmarks.compare(results, baseline)))
+"""
+
+from .baseline import compare, format_report, load_baseline, save_baseline
+from .suite import BENCHMARKS, run
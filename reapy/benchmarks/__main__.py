@@ -0,0 +1,70 @@
+"""
+Run benchmarks and report regressions against baseline.
+
+Exits with status 1 if a regression is found. Timings depend on the
+host, so the first run on a machine creates the baseline instead.
+"""
+
+import argparse
+import sys
+
+from reapy import benchmarks
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m reapy.benchmarks", description=__doc__.strip()
+    )
+    parser.add_argument(
+        "names", nargs="*", metavar="NAME",
+        help="benchmarks to run (default: all of {})".format(
+            ", ".join(benchmarks.BENCHMARKS)
+        )
+    )
+    parser.add_argument(
+        "-b", "--baseline", metavar="PATH",
+        help="baseline file (default: baseline.json in the benchmarks "
+             "subdirectory of reapy.config.CACHE_DIRECTORY)"
+    )
+    parser.add_argument(
+        "-r", "--repeat", type=int, default=5,
+        help="number of timed runs of each benchmark (default: 5)"
+    )
+    parser.add_argument(
+        "-s", "--save", metavar="PATH",
+        help="save results as baseline to PATH"
+    )
+    parser.add_argument(
+        "-t", "--tolerance", type=float, default=.25,
+        help="relative slowdown reported as regression (default: 0.25)"
+    )
+    parser.add_argument(
+        "-u", "--update", action="store_true",
+        help="overwrite baseline file with results"
+    )
+    return parser.parse_args(args)
+
+
+def main(args=None):
+    args = parse_args(args)
+    results = benchmarks.run(args.names or None, args.repeat)
+    try:
+        baseline = benchmarks.load_baseline(args.baseline)
+    except FileNotFoundError:
+        baseline = None
+    comparisons = benchmarks.compare(results, baseline or {}, args.tolerance)
+    print(benchmarks.format_report(comparisons))
+    if baseline is None or args.update:
+        if baseline is None:
+            print("No baseline found, saving results as baseline.")
+        try:
+            benchmarks.save_baseline(results, args.baseline)
+        except FileNotFoundError as e:
+            sys.exit("Can't save baseline: {}".format(e))
+    if args.save:
+        benchmarks.save_baseline(results, args.save)
+    return int(any(c.is_regression for c in comparisons))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
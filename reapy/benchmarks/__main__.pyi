@@ -0,0 +1,22 @@
+"""
+Run benchmarks and report regressions against baseline.
+
+Exits with status 1 if a regression is found. Timings depend on the
+host, so the first run on a machine creates the baseline instead.
+"""
+
+import argparse
+import sys
+import typing as ty
+
+from reapy import benchmarks
+
+
+def parse_args(
+    args: ty.Optional[ty.List[str]] = None
+) -> argparse.Namespace:
+    ...
+
+
+def main(args: ty.Optional[ty.List[str]] = None) -> int:
+    ...
@@ -0,0 +1,149 @@
+"""
+Compare benchmark results to a stored baseline.
+
+Timings depend on the host, so no baseline is shipped with ``reapy``.
+The default baseline is stored per user in the ``reapy`` cache
+directory (see ``reapy.config.CACHE_DIRECTORY``) and is created by the
+first run of ``python -m reapy.benchmarks``.
+"""
+
+import collections
+import json
+import os
+import platform
+import sys
+
+import reapy
+
+
+Comparison = collections.namedtuple(
+    "Comparison", ("name", "time", "baseline_time", "ratio", "is_regression")
+)
+
+
+def compare(results, baseline, tolerance=.25):
+    """
+    Compare benchmark results to a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        Times per operation, by benchmark name (see ``run``).
+    baseline : dict
+        Baseline times per operation, by benchmark name.
+    tolerance : float, optional
+        Relative slowdown above which a result is a regression
+        (default=0.25, i.e. 25% slower than baseline).
+
+    Returns
+    -------
+    comparisons : list of Comparison
+        One comparison per result, in the same order. ``ratio`` is
+        the ratio of result time to baseline time, or None if either
+        of them is missing.
+    """
+    comparisons = []
+    for name, time in results.items():
+        baseline_time = baseline.get(name)
+        ratio = None
+        if time is not None and baseline_time:
+            ratio = time / baseline_time
+        is_regression = ratio is not None and ratio > 1 + tolerance
+        comparisons.append(
+            Comparison(name, time, baseline_time, ratio, is_regression)
+        )
+    return comparisons
+
+
+def format_report(comparisons):
+    """
+    Return comparisons as a text table.
+
+    Parameters
+    ----------
+    comparisons : list of Comparison
+        Comparisons returned by ``compare``.
+
+    Returns
+    -------
+    str
+    """
+    def format_time(time):
+        return "-" if time is None else "{:.3f}".format(time * 1e6)
+
+    lines = ["{:<28} {:>12} {:>12} {:>7}".format(
+        "benchmark", "us/op", "baseline", "ratio"
+    )]
+    for c in comparisons:
+        line = "{:<28} {:>12} {:>12} {:>7}".format(
+            c.name, format_time(c.time), format_time(c.baseline_time),
+            "-" if c.ratio is None else "{:.2f}".format(c.ratio)
+        )
+        if c.is_regression:
+            line += "  REGRESSION"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def _get_baseline_path(path=None):
+    """Return ``path`` or default baseline path."""
+    if path is not None:
+        return path
+    directory = reapy.config.CACHE_DIRECTORY
+    if directory is None:
+        raise FileNotFoundError(
+            "No baseline path given and reapy.config.CACHE_DIRECTORY "
+            "is None."
+        )
+    return os.path.join(directory, "benchmarks", "baseline.json")
+
+
+def load_baseline(path=None):
+    """
+    Load baseline times per operation.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of baseline file. Defaults to ``baseline.json`` in the
+        ``benchmarks`` subdirectory of ``reapy.config.CACHE_DIRECTORY``.
+
+    Returns
+    -------
+    baseline : dict
+        Times per operation in seconds, by benchmark name.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the baseline file doesn't exist.
+    """
+    with open(_get_baseline_path(path)) as f:
+        return json.load(f)["results"]
+
+
+def save_baseline(results, path=None):
+    """
+    Save benchmark results as baseline.
+
+    Parameters
+    ----------
+    results : dict
+        Times per operation, by benchmark name (see ``run``).
+    path : str, optional
+        Path of baseline file. Defaults to the path used by
+        ``load_baseline``. Missing directories are created.
+    """
+    path = _get_baseline_path(path)
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    baseline = {
+        "reapy_version": reapy.__version__,
+        "python_version": platform.python_version(),
+        "platform": sys.platform,
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(baseline, f, indent=4, sort_keys=True)
+        f.write("\n")
@@ -0,0 +1,114 @@
+"""
+Compare benchmark results to a stored baseline.
+
+Timings depend on the host, so no baseline is shipped with ``reapy``.
+The default baseline is stored per user in the ``reapy`` cache
+directory (see ``reapy.config.CACHE_DIRECTORY``) and is created by the
+first run of ``python -m reapy.benchmarks``.
+"""
+
+import collections
+import json
+import os
+import platform
+import sys
+import typing as ty
+
+import reapy
+
+
+class Comparison(ty.NamedTuple):
+    name: str
+    time: ty.Optional[float]
+    baseline_time: ty.Optional[float]
+    ratio: ty.Optional[float]
+    is_regression: bool
+
+
+def compare(
+    results: ty.Dict[str, ty.Optional[float]],
+    baseline: ty.Dict[str, float],
+    tolerance: float = .25
+) -> ty.List[Comparison]:
+    """
+    Compare benchmark results to a baseline.
+
+    Parameters
+    ----------
+    results : dict
+        Times per operation, by benchmark name (see ``run``).
+    baseline : dict
+        Baseline times per operation, by benchmark name.
+    tolerance : float, optional
+        Relative slowdown above which a result is a regression
+        (default=0.25, i.e. 25% slower than baseline).
+
+    Returns
+    -------
+    comparisons : list of Comparison
+        One comparison per result, in the same order. ``ratio`` is
+        the ratio of result time to baseline time, or None if either
+        of them is missing.
+    """
+    ...
+
+
+def format_report(comparisons: ty.List[Comparison]) -> str:
+    """
+    Return comparisons as a text table.
+
+    Parameters
+    ----------
+    comparisons : list of Comparison
+        Comparisons returned by ``compare``.
+
+    Returns
+    -------
+    str
+    """
+    ...
+
+
+def _get_baseline_path(path: ty.Optional[str] = None) -> str:
+    """Return ``path`` or default baseline path."""
+    ...
+
+
+def load_baseline(path: ty.Optional[str] = None) -> ty.Dict[str, float]:
+    """
+    Load baseline times per operation.
+
+    Parameters
+    ----------
+    path : str, optional
+        Path of baseline file. Defaults to ``baseline.json`` in the
+        ``benchmarks`` subdirectory of ``reapy.config.CACHE_DIRECTORY``.
+
+    Returns
+    -------
+    baseline : dict
+        Times per operation in seconds, by benchmark name.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the baseline file doesn't exist.
+    """
+    ...
+
+
+def save_baseline(
+    results: ty.Dict[str, ty.Optional[float]], path: ty.Optional[str] = None
+) -> None:
+    """
+    Save benchmark results as baseline.
+
+    Parameters
+    ----------
+    results : dict
+        Times per operation, by benchmark name (see ``run``).
+    path : str, optional
+        Path of baseline file. Defaults to the path used by
+        ``load_baseline``. Missing directories are created.
+    """
+    ...
@@ -0,0 +1,188 @@
+"""Define benchmarks of the dist API and core objects."""
+
+import time
+
+import reapy
+import reapy.reascript_api as RPR
+from reapy.tools import binary
+from reapy.tools.network import codec
+from reapy.testing import FakeReaperServer
+
+
+#: Benchmarks, by name. Values are ``(function, n_operations)``.
+BENCHMARKS = {}
+#: Number of tracks of the benchmark project.
+N_TRACKS = 1000
+#: Number of notes of the benchmark MIDI take.
+N_NOTES = 10000
+#: Number of samples read from the benchmark audio accessor.
+N_SAMPLES = 1024 ** 2
+
+
+def _benchmark(n_operations):
+    """Register benchmark timed over ``n_operations`` operations."""
+    def register(function):
+        BENCHMARKS[function.__name__] = function, n_operations
+        return function
+    return register
+
+
+@reapy.inside_reaper()
+def _create_fixtures():
+    """
+    Create benchmark project in the fake REAPER.
+
+    Returns
+    -------
+    fixtures : dict
+        Objects used by benchmarks: ``"accessor"`` (audio accessor of
+        the first track) and ``"take"`` (MIDI take with ``N_NOTES``
+        notes).
+    """
+    project = reapy.Project()
+    for i in range(N_TRACKS):
+        project.add_track(i, "Track {}".format(i + 1))
+    track = project.tracks[0]
+    take = track.add_midi_item(0, N_NOTES / 4).active_take
+    take.set_notes({
+        "start": [i / 4 for i in range(N_NOTES)],
+        "end": [(i + 1) / 4 for i in range(N_NOTES)],
+        "pitch": [36 + i % 48 for i in range(N_NOTES)],
+    })
+    return {"accessor": track.add_audio_accessor(), "take": take}
+
+
+def _get_message():
+    """Return typical result message (100 track IDs)."""
+    return {
+        "id": 0, "type": "result",
+        "value": ["(MediaTrack*)0x{:016X}".format(i) for i in range(100)]
+    }
+
+
+def _time(function, n_operations, repeat, fixtures):
+    """Return best time per operation of ``repeat`` runs, in seconds."""
+    function(n_operations, fixtures)  # Warm up (e.g. fetch API names)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(n_operations, fixtures)
+        best = min(best, time.perf_counter() - start)
+    return best / n_operations
+
+
+@_benchmark(N_SAMPLES)
+def audio_samples_shared_memory(n, fixtures):
+    """Read audio samples through shared memory (per sample)."""
+    fixtures["accessor"].get_samples_array(0, n, shared_memory=True)
+
+
+@_benchmark(N_SAMPLES)
+def audio_samples_socket(n, fixtures):
+    """Read audio samples through the socket (per sample)."""
+    fixtures["accessor"].get_samples_array(0, n, shared_memory=False)
+
+
+@_benchmark(1000)
+def binary_decode(n, fixtures):
+    """Decode binary result messages (per message)."""
+    data = binary.dumps(_get_message())
+    for _ in range(n):
+        codec.loads(data)
+
+
+@_benchmark(1000)
+def binary_encode(n, fixtures):
+    """Encode binary result messages (per message)."""
+    message = _get_message()
+    for _ in range(n):
+        binary.dumps(message)
+
+
+@_benchmark(300)
+def call_latency(n, fixtures):
+    """Call ``RPR.GetTrack`` with one request per call (per call)."""
+    for i in range(n):
+        RPR.GetTrack(0, i)
+
+
+@_benchmark(3000)
+def hold_throughput(n, fixtures):
+    """Call ``RPR.GetTrack`` in an ``inside_reaper`` context (per call)."""
+    with reapy.inside_reaper():
+        for i in range(n):
+            RPR.GetTrack(0, i % N_TRACKS)
+
+
+@_benchmark(1000)
+def json_decode(n, fixtures):
+    """Decode JSON result messages (per message)."""
+    data = codec.dumps(_get_message(), "json")
+    for _ in range(n):
+        codec.loads(data)
+
+
+@_benchmark(1000)
+def json_encode(n, fixtures):
+    """Encode JSON result messages (per message)."""
+    message = _get_message()
+    for _ in range(n):
+        codec.dumps(message, "json")
+
+
+@_benchmark(10000)
+def map_throughput(n, fixtures):
+    """Call ``RPR.GetTrack`` with ``reapy.map`` (per call)."""
+    indices = [i % N_TRACKS for i in range(n)]
+    reapy.map(RPR.GetTrack, [0] * n, indices)
+
+
+@_benchmark(N_NOTES)
+def midi_note_reads(n, fixtures):
+    """Read notes with ``NoteList.to_arrays`` (per note)."""
+    fixtures["take"].notes.to_arrays()
+
+
+@_benchmark(N_TRACKS)
+def track_list_iteration(n, fixtures):
+    """Iterate over ``Project.tracks`` (per track)."""
+    for track in reapy.Project().tracks:
+        pass
+
+
+def run(names=None, repeat=5):
+    """
+    Run benchmarks against a fake REAPER server.
+
+    Parameters
+    ----------
+    names : iterable of str, optional
+        Names of benchmarks to run (see ``BENCHMARKS``). By default,
+        all benchmarks are run.
+    repeat : int, optional
+        Number of timed runs of each benchmark (default=5). The best
+        one is kept.
+
+    Returns
+    -------
+    results : dict
+        Best time per operation in seconds, by benchmark name. It is
+        None for benchmarks that couldn't run (e.g. NumPy is not
+        installed).
+    """
+    names = list(BENCHMARKS) if names is None else list(names)
+    for name in names:
+        if name not in BENCHMARKS:
+            raise KeyError("Unknown benchmark: {}".format(name))
+    results = {}
+    with FakeReaperServer():
+        fixtures = _create_fixtures()
+        for name in names:
+            function, n_operations = BENCHMARKS[name]
+            try:
+                results[name] = _time(
+                    function, n_operations, repeat, fixtures
+                )
+            except ImportError:
+                results[name] = None
+    return results
@@ -0,0 +1,135 @@
+"""Define benchmarks of the dist API and core objects."""
+
+import time
+import typing as ty
+
+import reapy
+import reapy.reascript_api as RPR
+from reapy.tools.network import codec
+from reapy.testing import FakeReaperServer
+
+
+Benchmark = ty.Callable[[int, ty.Dict[str, ty.Any]], None]
+
+BENCHMARKS: ty.Dict[str, ty.Tuple[Benchmark, int]]
+N_TRACKS: int
+N_NOTES: int
+N_SAMPLES: int
+
+
+def _benchmark(
+    n_operations: int
+) -> ty.Callable[[Benchmark], Benchmark]:
+    """Register benchmark timed over ``n_operations`` operations."""
+    ...
+
+
+def _create_fixtures() -> ty.Dict[str, ty.Any]:
+    """
+    Create benchmark project in the fake REAPER.
+
+    Returns
+    -------
+    fixtures : dict
+        Objects used by benchmarks: ``"accessor"`` (audio accessor of
+        the first track) and ``"take"`` (MIDI take with ``N_NOTES``
+        notes).
+    """
+    ...
+
+
+def _get_message() -> ty.Dict[str, ty.Any]:
+    """Return typical result message (100 track IDs)."""
+    ...
+
+
+def _time(
+    function: Benchmark,
+    n_operations: int,
+    repeat: int,
+    fixtures: ty.Dict[str, ty.Any]
+) -> float:
+    """Return best time per operation of ``repeat`` runs, in seconds."""
+    ...
+
+
+def audio_samples_shared_memory(
+    n: int, fixtures: ty.Dict[str, ty.Any]
+) -> None:
+    """Read audio samples through shared memory (per sample)."""
+    ...
+
+
+def audio_samples_socket(n: int, fixtures: ty.Dict[str, ty.Any]) -> None:
+    """Read audio samples through the socket (per sample)."""
+    ...
+
+
+def binary_decode(n: int, fixtures: ty.Dict[str, ty.Any]) -> None:
+    """Decode binary result messages (per message)."""
+    ...
+
+
+def binary_encode(n: int, fixtures: ty.Dict[str, ty.Any]) -> None:
+    """Encode binary result messages (per message)."""
+    ...
+
+
+def call_latency(n: int, fixtures: ty.Dict[str, ty.Any]) -> None:
+    """Call ``RPR.GetTrack`` with one request per call (per call)."""
+    ...
+
+
+def hold_throughput(n: int, fixtures: ty.Dict[str, ty.Any]) -> None:
+    """Call ``RPR.GetTrack`` in an ``inside_reaper`` context (per call)."""
+    ...
+
+
+def json_decode(n: int, fixtures: ty.Dict[str, ty.Any]) -> None:
+    """Decode JSON result messages (per message)."""
+    ...
+
+
+def json_encode(n: int, fixtures: ty.Dict[str, ty.Any]) -> None:
+    """Encode JSON result messages (per message)."""
+    ...
+
+
+def map_throughput(n: int, fixtures: ty.Dict[str, ty.Any]) -> None:
+    """Call ``RPR.GetTrack`` with ``reapy.map`` (per call)."""
+    ...
+
+
+def midi_note_reads(n: int, fixtures: ty.Dict[str, ty.Any]) -> None:
+    """Read notes with ``NoteList.to_arrays`` (per note)."""
+    ...
+
+
+def track_list_iteration(n: int, fixtures: ty.Dict[str, ty.Any]) -> None:
+    """Iterate over ``Project.tracks`` (per track)."""
+    ...
+
+
+def run(
+    names: ty.Optional[ty.Iterable[str]] = None, repeat: int = 5
+) -> ty.Dict[str, ty.Optional[float]]:
+    """
+    Run benchmarks against a fake REAPER server.
+
+    Parameters
+    ----------
+    names : iterable of str, optional
+        Names of benchmarks to run (see ``BENCHMARKS``). By default,
+        all benchmarks are run.
+    repeat : int, optional
+        Number of timed runs of each benchmark (default=5). The best
+        one is kept.
+
+    Returns
+    -------
+    results : dict
+        Best time per operation in seconds, by benchmark name. It is
+        None for benchmarks that couldn't run (e.g. NumPy is not
+        installed).
+    """
+    ...
@@ -18,19 +18,47 @@ from .shared_library import get_python_shared_library
 
 __all__ = [
     'add_web_interface',
+    'CACHE_DIRECTORY',
     'configure_reaper',
     'create_new_web_interface',
     'delete_web_interface',
     'disable_dist_api',
     'enable_dist_api',
     'enable_python',
+    'CLIENT_POOL_SIZE',
     'REAPY_SERVER_PORT',
+    'SERVER_HOLD_TIME_BUDGET',
+    'SERVER_TICK_TIME_BUDGET',
+    'SHARED_MEMORY_SIZE',
+    'TRACE_BUFFER_SIZE',
+    'TRACE_CALLS',
     'WEB_INTERFACE_PORT'
 ]
 
 
+#: Directory where ``reapy`` caches data of REAPER instances (e.g.
+#: ReaScript API names). Set to None to disable caching.
+CACHE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.cache', 'reapy')
 REAPY_SERVER_PORT = 2306
 WEB_INTERFACE_PORT = 2307
+#: Maximum number of connections opened to each machine, so that
+#: several threads can issue calls in parallel.
+CLIENT_POOL_SIZE = 4
+#: Time in seconds a client in an ``inside_reaper`` context can hold
+#: the server per defer tick while other clients are connected.
+SERVER_HOLD_TIME_BUDGET = .1
+#: Time in seconds the server spends processing requests per defer
+#: tick, if enough requests are pending.
+SERVER_TICK_TIME_BUDGET = .005
+#: Size in bytes of the shared buffers used by each connection to a
+#: server on the same host, in each direction. They are allocated on
+#: first large message. Larger messages go through the socket. Set to
+#: 0 to disable shared memory.
+SHARED_MEMORY_SIZE = 16 * 1024 ** 2
+#: Whether dist API calls are traced (see ``reapy.stats``).
+TRACE_CALLS = False
+#: Maximum number of call traces kept. Oldest ones are dropped.
+TRACE_BUFFER_SIZE = 100000
 
 
 class CaseInsensitiveDict(OrderedDict):
@@ -10,8 +10,15 @@ import shutil
 
 import typing as ty
 
+CACHE_DIRECTORY: ty.Optional[str]
 REAPY_SERVER_PORT = 2306
 WEB_INTERFACE_PORT = 2307
+CLIENT_POOL_SIZE = 4
+SERVER_HOLD_TIME_BUDGET = .1
+SERVER_TICK_TIME_BUDGET = .005
+SHARED_MEMORY_SIZE = 16 * 1024 ** 2
+TRACE_CALLS = False
+TRACE_BUFFER_SIZE = 100000
 
 T1 = ty.TypeVar('T1')
 T2 = ty.TypeVar('T2')
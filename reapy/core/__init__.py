@@ -5,7 +5,9 @@ from .envelope import Envelope, EnvelopeList
 from .fx import FX, FXList, FXParam, FXParamsList
 from .item import CC, CCList, Item, Note, NoteList, Source, Take
 from .map import map
-from .project import Marker, Project, Region, TimeSelection
+from .project import (
+    Marker, MarkerList, Project, Region, RegionList, TimeSelection
+)
 from .track import AutomationItem, Send, Track, TrackList
 from .window import MIDIEditor, ToolTip, Window
 
@@ -36,8 +38,10 @@ __all__ = [
     "map",
     # core.project
     "Marker",
+    "MarkerList",
     "Project",
     "Region",
+    "RegionList",
     "TimeSelection",
     # core.track
     "AutomationItem",
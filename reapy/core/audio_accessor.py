@@ -1,6 +1,87 @@
+import ctypes as ct
+import queue
+import threading
+
 import reapy
 import reapy.reascript_api as RPR
 from reapy.core import ReapyObject
+from reapy.tools.network import machines
+from reapy.tools.network.shared_memory import SharedBuffer
+
+
+def _read_samples_into(
+    accessor_id, sample_rate, n_channels, start, n_samples_per_channel,
+    array
+):
+    """
+    Fill NumPy array with audio samples.
+
+    Unlike ``RPR.GetAudioAccessorSamples``, REAPER writes directly
+    into the array memory instead of a Python list. Can only be used
+    from inside REAPER.
+    """
+    from reapy.reascript_api import _RPR
+    f = ct.CFUNCTYPE(
+        ct.c_int, ct.c_uint64, ct.c_int, ct.c_int, ct.c_double, ct.c_int,
+        ct.c_void_p
+    )(_RPR._ft["GetAudioAccessorSamples"])
+    return f(
+        _RPR.rpr_packp("AudioAccessor*", accessor_id),
+        ct.c_int(int(sample_rate)),
+        ct.c_int(n_channels),
+        ct.c_double(start),
+        ct.c_int(n_samples_per_channel),
+        ct.c_void_p(array.ctypes.data)
+    )
+
+
+def _iter_prefetched_blocks(
+    accessor, blocks, n_channels, sample_rate, prefetch
+):
+    """
+    Yield sample blocks fetched from a background thread.
+
+    The thread takes its connection from the client pool of the
+    selected machine (see ``ClientPool``), so that the selected client
+    can still be used while blocks are being transferred, unless all
+    connections of the pool are already in use.
+    """
+    pool = machines.get_selected_pool()
+    fetched = queue.Queue(maxsize=prefetch)
+    stop = threading.Event()
+
+    def put(x):
+        # Gives up as soon as the consumer has stopped iterating
+        while not stop.is_set():
+            try:
+                fetched.put(x, timeout=.1)
+                return
+            except queue.Full:
+                pass
+
+    def fetch():
+        try:
+            client = pool.get_client()
+            for block_start, block_size in blocks:
+                if stop.is_set():  # Iterator has been closed
+                    return
+                args = block_start, block_size, n_channels, sample_rate
+                input = {"args": args, "kwargs": {}}
+                put(client.request(accessor._get_samples_array, input))
+        except Exception as e:
+            put(e)
+
+    thread = threading.Thread(target=fetch, daemon=True)
+    thread.start()
+    try:
+        for _ in blocks:
+            block = fetched.get()
+            if isinstance(block, Exception):
+                raise block
+            yield block
+    finally:
+        stop.set()
+        thread.join()
 
 
 class AudioAccessor(ReapyObject):
@@ -49,6 +130,11 @@ class AudioAccessor(ReapyObject):
         samples : list
             List of length n_samples*n_channels.
 
+        See also
+        --------
+        AudioAccessor.get_samples_array
+            Faster alternative based on NumPy arrays.
+
         Examples
         --------
         To separate channels use:
@@ -64,6 +150,98 @@ class AudioAccessor(ReapyObject):
         )[1]
         return samples
 
+    @reapy.inside_reaper()
+    def _get_samples_array(
+        self, start, n_samples_per_channel, n_channels, sample_rate
+    ):
+        import numpy as np
+        samples = np.zeros((n_samples_per_channel, n_channels))
+        _read_samples_into(
+            self.id, sample_rate, n_channels, start, n_samples_per_channel,
+            samples
+        )
+        return samples
+
+    @reapy.inside_reaper()
+    def _read_samples_into_shared_buffer(
+        self, path, start, n_samples_per_channel, n_channels, sample_rate
+    ):
+        import numpy as np
+        with SharedBuffer(path) as buffer:
+            samples = np.ndarray(
+                (n_samples_per_channel, n_channels), buffer=buffer.buf
+            )
+            _read_samples_into(
+                self.id, sample_rate, n_channels, start,
+                n_samples_per_channel, samples
+            )
+            del samples  # Buffer can't be closed while still exported
+
+    def get_samples_array(
+        self, start, n_samples_per_channel, n_channels=1, sample_rate=44100,
+        shared_memory=None
+    ):
+        """
+        Return audio samples as a NumPy array.
+
+        Unlike ``AudioAccessor.get_samples``, samples are never
+        converted to Python floats: REAPER writes them directly in the
+        array memory, and from outside REAPER they are sent as raw
+        bytes. This requires NumPy to be installed both inside and
+        outside REAPER.
+
+        Parameters
+        ----------
+        start : float
+            Start time in seconds.
+        n_samples_per_channel : int
+            Number of required samples per channel
+        n_channels : int, optional
+            Number of required channels (default=1).
+        sample_rate : float, optional
+            Required sample rate (default=44100).
+        shared_memory : bool or None, optional
+            Only used from outside REAPER. Whether samples should be
+            transferred through a shared memory buffer instead of the
+            network. This only works when REAPER runs on the same
+            host. If None (default), shared memory is used when
+            REAPER runs on the same host.
+
+        Returns
+        -------
+        samples : numpy.ndarray
+            Array of ``float64`` with shape
+            ``(n_samples_per_channel, n_channels)``.
+
+        See also
+        --------
+        AudioAccessor.get_samples
+
+        Examples
+        --------
+        >>> samples = audio_accessor.get_samples_array(0, 1024, 2)
+        >>> samples.shape
+        (1024, 2)
+        >>> first_channel = samples[:, 0]
+        """
+        import numpy as np
+        args = start, n_samples_per_channel, n_channels, sample_rate
+        if reapy.is_inside_reaper():
+            return self._get_samples_array(*args)
+        if shared_memory is None:
+            shared_memory = machines.get_selected_client().is_local
+        if not shared_memory:
+            return self._get_samples_array(*args)
+        size = 8 * n_samples_per_channel * n_channels
+        buffer = SharedBuffer.create(size)
+        try:
+            self._read_samples_into_shared_buffer(buffer.path, *args)
+            samples = np.frombuffer(buffer.buf, count=size // 8).copy()
+        finally:
+            buffer.close()
+            buffer.unlink()
+        return samples.reshape((n_samples_per_channel, n_channels))
+
     @property
     def has_state_changed(self):
         """
@@ -81,6 +259,70 @@ class AudioAccessor(ReapyObject):
         """
         return RPR.GetAudioAccessorHash(self.id, "")[1]
 
+    def iter_blocks(
+        self, block_size=65536, n_channels=1, sample_rate=44100, start=None,
+        end=None, prefetch=2
+    ):
+        """
+        Iterate over audio samples in fixed-size blocks.
+
+        From outside REAPER, next blocks are fetched in the background
+        while the current one is being processed. Requires NumPy (see
+        ``AudioAccessor.get_samples_array``).
+
+        Parameters
+        ----------
+        block_size : int, optional
+            Number of samples per channel in each block
+            (default=65536).
+        n_channels : int, optional
+            Number of required channels (default=1).
+        sample_rate : float, optional
+            Required sample rate (default=44100).
+        start : float, optional
+            Start time in seconds. Defaults to
+            ``AudioAccessor.start_time``.
+        end : float, optional
+            End time in seconds. Defaults to
+            ``AudioAccessor.end_time``.
+        prefetch : int, optional
+            Maximum number of blocks fetched in advance (default=2).
+            Only used from outside REAPER.
+
+        Yields
+        ------
+        block : numpy.ndarray
+            Array of ``float64`` with shape
+            ``(block_size, n_channels)``. The last block may be
+            shorter.
+
+        Examples
+        --------
+        >>> accessor = track.add_audio_accessor()
+        >>> peak = 0
+        >>> for block in accessor.iter_blocks(65536, 2, 48000):
+        ...     peak = max(peak, abs(block).max())
+        ...
+        """
+        if start is None:
+            start = self.start_time
+        if end is None:
+            end = self.end_time
+        n_samples = max(0, int(round((end - start) * sample_rate)))
+        blocks = [
+            (start + i / sample_rate, min(block_size, n_samples - i))
+            for i in range(0, n_samples, block_size)
+        ]
+        if reapy.is_inside_reaper():
+            for block_start, size in blocks:
+                yield self._get_samples_array(
+                    block_start, size, n_channels, sample_rate
+                )
+        else:
+            yield from _iter_prefetched_blocks(
+                self, blocks, n_channels, sample_rate, prefetch
+            )
+
     @property
     def start_time(self):
         """
@@ -1,8 +1,49 @@
+import ctypes as ct
+import queue
+import threading
+
 import reapy
 import reapy.reascript_api as RPR
 from reapy.core import ReapyObject
+from reapy.tools.network import machines
+from reapy.tools.network.shared_memory import SharedBuffer
 import typing as ty
 
+if ty.TYPE_CHECKING:
+    import numpy as np
+
+
+def _read_samples_into(
+    accessor_id: str, sample_rate: float, n_channels: int, start: float,
+    n_samples_per_channel: int, array: 'np.ndarray'
+) -> int:
+    """
+    Fill NumPy array with audio samples.
+
+    Unlike ``RPR.GetAudioAccessorSamples``, REAPER writes directly
+    into the array memory instead of a Python list. Can only be used
+    from inside REAPER.
+    """
+    ...
+
+
+def _iter_prefetched_blocks(
+    accessor: 'AudioAccessor',
+    blocks: ty.List[ty.Tuple[float, int]],
+    n_channels: int,
+    sample_rate: float,
+    prefetch: int
+) -> ty.Iterator['np.ndarray']:
+    """
+    Yield sample blocks fetched from a background thread.
+
+    The thread takes its connection from the client pool of the
+    selected machine (see ``ClientPool``), so that the selected client
+    can still be used while blocks are being transferred, unless all
+    connections of the pool are already in use.
+    """
+    ...
+
 
 class AudioAccessor(ReapyObject):
     id: bytes
@@ -53,6 +94,11 @@ class AudioAccessor(ReapyObject):
         samples : list
             List of length n_samples*n_channels.
 
+        See also
+        --------
+        AudioAccessor.get_samples_array
+            Faster alternative based on NumPy arrays.
+
         Examples
         --------
         To separate channels use:
@@ -63,6 +109,70 @@ class AudioAccessor(ReapyObject):
         """
         ...
 
+    def _get_samples_array(self, start: float, n_samples_per_channel: int,
+                           n_channels: int,
+                           sample_rate: float) -> 'np.ndarray':
+        ...
+
+    def _read_samples_into_shared_buffer(
+        self, path: str, start: float, n_samples_per_channel: int,
+        n_channels: int, sample_rate: float
+    ) -> None:
+        ...
+
+    def get_samples_array(
+        self,
+        start: float,
+        n_samples_per_channel: int,
+        n_channels: int = 1,
+        sample_rate: float = 44100,
+        shared_memory: ty.Optional[bool] = None
+    ) -> 'np.ndarray':
+        """
+        Return audio samples as a NumPy array.
+
+        Unlike ``AudioAccessor.get_samples``, samples are never
+        converted to Python floats: REAPER writes them directly in the
+        array memory, and from outside REAPER they are sent as raw
+        bytes. This requires NumPy to be installed both inside and
+        outside REAPER.
+
+        Parameters
+        ----------
+        start : float
+            Start time in seconds.
+        n_samples_per_channel : int
+            Number of required samples per channel
+        n_channels : int, optional
+            Number of required channels (default=1).
+        sample_rate : float, optional
+            Required sample rate (default=44100).
+        shared_memory : bool or None, optional
+            Only used from outside REAPER. Whether samples should be
+            transferred through a shared memory buffer instead of the
+            network. This only works when REAPER runs on the same
+            host. If None (default), shared memory is used when
+            REAPER runs on the same host.
+
+        Returns
+        -------
+        samples : numpy.ndarray
+            Array of ``float64`` with shape
+            ``(n_samples_per_channel, n_channels)``.
+
+        See also
+        --------
+        AudioAccessor.get_samples
+
+        Examples
+        --------
+        >>> samples = audio_accessor.get_samples_array(0, 1024, 2)
+        >>> samples.shape
+        (1024, 2)
+        >>> first_channel = samples[:, 0]
+        """
+        ...
+
     @property
     def has_state_changed(self) -> bool:
         """
@@ -80,6 +190,58 @@ class AudioAccessor(ReapyObject):
         """
         ...
 
+    def iter_blocks(
+        self,
+        block_size: int = 65536,
+        n_channels: int = 1,
+        sample_rate: float = 44100,
+        start: ty.Optional[float] = None,
+        end: ty.Optional[float] = None,
+        prefetch: int = 2
+    ) -> ty.Iterator['np.ndarray']:
+        """
+        Iterate over audio samples in fixed-size blocks.
+
+        From outside REAPER, next blocks are fetched in the background
+        while the current one is being processed. Requires NumPy (see
+        ``AudioAccessor.get_samples_array``).
+
+        Parameters
+        ----------
+        block_size : int, optional
+            Number of samples per channel in each block
+            (default=65536).
+        n_channels : int, optional
+            Number of required channels (default=1).
+        sample_rate : float, optional
+            Required sample rate (default=44100).
+        start : float, optional
+            Start time in seconds. Defaults to
+            ``AudioAccessor.start_time``.
+        end : float, optional
+            End time in seconds. Defaults to
+            ``AudioAccessor.end_time``.
+        prefetch : int, optional
+            Maximum number of blocks fetched in advance (default=2).
+            Only used from outside REAPER.
+
+        Yields
+        ------
+        block : numpy.ndarray
+            Array of ``float64`` with shape
+            ``(block_size, n_channels)``. The last block may be
+            shorter.
+
+        Examples
+        --------
+        >>> accessor = track.add_audio_accessor()
+        >>> peak = 0
+        >>> for block in accessor.iter_blocks(65536, 2, 48000):
+        ...     peak = max(peak, abs(block).max())
+        ...
+        """
+        ...
+
     @property
     def start_time(self) -> float:
         """
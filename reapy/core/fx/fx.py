@@ -6,18 +6,32 @@ from reapy.core import ReapyObject, ReapyObjectList
 from reapy.errors import DistError, UndefinedFXParamError
 
 
+class _FXFunctions:
+
+    """
+    ``TrackFX_*`` or ``TakeFX_*`` API functions, by name without prefix.
+
+    Functions are looked up in ``reapy.reascript_api`` on access, so
+    that they run on the currently selected machine.
+    """
+
+    def __init__(self, prefix):
+        self.prefix = prefix
+
+    def __getitem__(self, name):
+        try:
+            return getattr(RPR, self.prefix + name)
+        except AttributeError:
+            raise KeyError(name)
+
+
 class FX(ReapyObject):
 
     """FX on a Track or a Take."""
 
     _class_name = "FX"
     functions = {
-        prefix: {
-            name.replace(prefix, ""): function
-            for name, function in RPR.__dict__.items()
-            if name.startswith(prefix)
-        }
-        for prefix in ("TrackFX_", "TakeFX_")
+        prefix: _FXFunctions(prefix) for prefix in ("TrackFX_", "TakeFX_")
     }
 
     def __init__(self, parent=None, index=None, parent_id=None):
@@ -7,11 +7,27 @@ from reapy.errors import DistError, UndefinedFXParamError
 import typing as ty
 
 
+class _FXFunctions:
+    """
+    ``TrackFX_*`` or ``TakeFX_*`` API functions, by name without prefix.
+
+    Functions are looked up in ``reapy.reascript_api`` on access, so
+    that they run on the currently selected machine.
+    """
+    prefix: str
+
+    def __init__(self, prefix: str) -> None:
+        ...
+
+    def __getitem__(self, name: str) -> ty.Callable[..., ty.Any]:
+        ...
+
+
 class FX(ReapyObject):
     """FX on a Track or a Take."""
 
     _class_name: str
-    functions: ty.Dict[str, ty.Dict[str, ty.Callable[..., ty.Any]]]
+    functions: ty.Dict[str, _FXFunctions]
     parent_id: str
     index: int
 
@@ -21,7 +37,7 @@ class FX(ReapyObject):
                  parent_id: ty.Optional[str] = None) -> None:
         ...
 
-    def _get_functions(self) -> ty.Dict[str, ty.Callable[..., ty.Any]]:
+    def _get_functions(self) -> _FXFunctions:
         ...
 
     @property
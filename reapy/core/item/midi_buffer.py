@@ -0,0 +1,236 @@
+"""Decode and encode packed MIDI buffers.
+
+Packed buffers are used by ``RPR.MIDI_GetAllEvts`` and
+``RPR.MIDI_SetAllEvts``. Each event is made of a 32-bit signed
+offset in MIDI ticks from the previous event, an 8-bit flag (&1
+for selected, &2 for muted), a 32-bit message length and the
+message itself. All integers are little-endian.
+
+The last event of a buffer is an All-Notes-Off message (CC123)
+marking the end of the take source.
+"""
+
+import struct
+
+
+_HEADER = struct.Struct("<iBi")
+
+#: Initial size of buffers passed to ``RPR.MIDI_GetAllEvts``.
+BUFFER_SIZE = 1024 ** 2
+#: Size above which ``RPR.MIDI_GetAllEvts`` is not retried.
+MAX_BUFFER_SIZE = 256 * 1024 ** 2
+
+#: All-Notes-Off message marking the end of a take source.
+END_OF_SOURCE = b"\xb0\x7b\x00"
+
+NOTE_COLUMNS = (
+    "start_ppq", "end_ppq", "channel", "pitch", "velocity", "selected",
+    "muted"
+)
+CC_COLUMNS = (
+    "position_ppq", "channel_message", "channel", "msg2", "msg3",
+    "selected", "muted"
+)
+
+
+def decode_events(buffer):
+    """
+    Decode packed MIDI buffer.
+
+    Parameters
+    ----------
+    buffer : bytes
+        Packed MIDI buffer.
+
+    Returns
+    -------
+    list of (int, int, bytes)
+        Position in MIDI ticks, flags and message of each event.
+    """
+    events = []
+    ppq, i, n = 0, 0, len(buffer)
+    while i < n:
+        offset, flags, length = _HEADER.unpack_from(buffer, i)
+        i += _HEADER.size
+        ppq += offset
+        events.append((ppq, flags, bytes(buffer[i:i + length])))
+        i += length
+    return events
+
+
+def encode_events(events):
+    """
+    Encode MIDI events as packed buffer.
+
+    Parameters
+    ----------
+    events : iterable of (float, int, bytes)
+        Position in MIDI ticks, flags and message of each event,
+        sorted by position. Positions are rounded to the nearest
+        tick.
+
+    Returns
+    -------
+    bytes
+        Packed MIDI buffer.
+    """
+    chunks = []
+    previous_ppq = 0
+    for ppq, flags, message in events:
+        ppq = int(round(ppq))
+        message = bytes(message)
+        chunks.append(_HEADER.pack(ppq - previous_ppq, flags, len(message)))
+        chunks.append(message)
+        previous_ppq = ppq
+    return b"".join(chunks)
+
+
+def get_end_of_source(events):
+    """Return position of the end-of-source event, or None."""
+    if events and events[-1][2] == END_OF_SOURCE:
+        return events[-1][0]
+
+
+def is_cc(message):
+    """Whether message is a channel message other than a note."""
+    return len(message) > 0 and 0xa0 <= message[0] < 0xf0
+
+
+def is_note(message):
+    """Whether message is a note-on or note-off message."""
+    return len(message) == 3 and 0x80 <= message[0] < 0xa0
+
+
+def is_note_off(message):
+    """Whether message is a note-off (or zero-velocity note-on)."""
+    return is_note(message) and (
+        message[0] & 0xf0 == 0x80 or message[2] == 0
+    )
+
+
+def get_note_events(columns):
+    """
+    Split note columns into note-on and note-off events.
+
+    Parameters
+    ----------
+    columns : dict
+        Keys are ``NOTE_COLUMNS`` and values are sequences of numbers
+        of the same length. Positions are in MIDI ticks.
+
+    Returns
+    -------
+    list of (float, int, bytes)
+        Note-on and note-off events, not sorted.
+
+    See also
+    --------
+    get_note_columns
+    """
+    events = []
+    rows = zip(*(columns[key] for key in NOTE_COLUMNS))
+    for start, end, channel, pitch, velocity, selected, muted in rows:
+        flags = bool(selected) | bool(muted) << 1
+        channel, pitch = int(channel) & 0x0f, int(pitch)
+        note_on = bytes((0x90 | channel, pitch, int(velocity)))
+        note_off = bytes((0x80 | channel, pitch, 0))
+        events += (start, flags, note_on), (end, flags, note_off)
+    return events
+
+
+def get_note_columns(events):
+    """
+    Pair note-on and note-off events into columns.
+
+    Notes are ordered by note-on position, like ``Take.notes``. Notes
+    without note-off end at the end of source.
+
+    Parameters
+    ----------
+    events : list of (int, int, bytes)
+        Events as returned by ``decode_events``.
+
+    Returns
+    -------
+    dict
+        Keys are ``NOTE_COLUMNS`` and values are lists of int.
+    """
+    columns = {key: [] for key in NOTE_COLUMNS}
+    open_notes = {}
+    for ppq, flags, message in events:
+        if not is_note(message):
+            continue
+        status, pitch, velocity = message
+        channel = status & 0x0f
+        if status & 0xf0 == 0x90 and velocity > 0:
+            open_notes.setdefault((channel, pitch), []).append(
+                len(columns["start_ppq"])
+            )
+            columns["start_ppq"].append(ppq)
+            columns["end_ppq"].append(None)
+            columns["channel"].append(channel)
+            columns["pitch"].append(pitch)
+            columns["velocity"].append(velocity)
+            columns["selected"].append(flags & 1)
+            columns["muted"].append((flags & 2) >> 1)
+        elif open_notes.get((channel, pitch)):
+            index = open_notes[(channel, pitch)].pop(0)
+            columns["end_ppq"][index] = ppq
+    end = get_end_of_source(events)
+    if end is None:
+        end = events[-1][0] if events else 0
+    columns["end_ppq"] = [end if p is None else p for p in columns["end_ppq"]]
+    return columns
+
+
+def sort_events(events):
+    """
+    Sort events by position.
+
+    Note-offs are put before other events at the same position, so
+    that consecutive notes of the same pitch are paired correctly.
+    The relative order of other events is kept.
+
+    Parameters
+    ----------
+    events : iterable of (float, int, bytes)
+        Events to sort.
+
+    Returns
+    -------
+    list of (float, int, bytes)
+        Sorted events.
+    """
+    return sorted(events, key=lambda e: (e[0], not is_note_off(e[2])))
+
+
+def get_cc_columns(events):
+    """
+    Gather CC events into columns.
+
+    Parameters
+    ----------
+    events : list of (int, int, bytes)
+        Events as returned by ``decode_events``. The end-of-source
+        event is ignored.
+
+    Returns
+    -------
+    dict
+        Keys are ``CC_COLUMNS`` and values are lists of int.
+    """
+    columns = {key: [] for key in CC_COLUMNS}
+    if get_end_of_source(events) is not None:
+        events = events[:-1]
+    for ppq, flags, message in events:
+        if not is_cc(message):
+            continue
+        message = message[:3].ljust(3, b"\x00")
+        columns["position_ppq"].append(ppq)
+        columns["channel_message"].append(message[0] & 0xf0)
+        columns["channel"].append(message[0] & 0x0f)
+        columns["msg2"].append(message[1])
+        columns["msg3"].append(message[2])
+        columns["selected"].append(flags & 1)
+        columns["muted"].append((flags & 2) >> 1)
+    return columns
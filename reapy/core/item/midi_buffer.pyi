@@ -0,0 +1,169 @@
+"""Decode and encode packed MIDI buffers.
+
+Packed buffers are used by ``RPR.MIDI_GetAllEvts`` and
+``RPR.MIDI_SetAllEvts``. Each event is made of a 32-bit signed
+offset in MIDI ticks from the previous event, an 8-bit flag (&1
+for selected, &2 for muted), a 32-bit message length and the
+message itself. All integers are little-endian.
+
+The last event of a buffer is an All-Notes-Off message (CC123)
+marking the end of the take source.
+"""
+
+import struct
+import typing as ty
+
+
+_HEADER: struct.Struct
+BUFFER_SIZE: int
+MAX_BUFFER_SIZE: int
+END_OF_SOURCE: bytes
+NOTE_COLUMNS: ty.Tuple[str, ...]
+CC_COLUMNS: ty.Tuple[str, ...]
+
+EVENT_T = ty.Tuple[int, int, bytes]
+
+
+def decode_events(buffer: bytes) -> ty.List[EVENT_T]:
+    """
+    Decode packed MIDI buffer.
+
+    Parameters
+    ----------
+    buffer : bytes
+        Packed MIDI buffer.
+
+    Returns
+    -------
+    list of (int, int, bytes)
+        Position in MIDI ticks, flags and message of each event.
+    """
+    ...
+
+
+def encode_events(
+    events: ty.Iterable[ty.Tuple[float, int, bytes]]
+) -> bytes:
+    """
+    Encode MIDI events as packed buffer.
+
+    Parameters
+    ----------
+    events : iterable of (float, int, bytes)
+        Position in MIDI ticks, flags and message of each event,
+        sorted by position. Positions are rounded to the nearest
+        tick.
+
+    Returns
+    -------
+    bytes
+        Packed MIDI buffer.
+    """
+    ...
+
+
+def get_end_of_source(events: ty.List[EVENT_T]) -> ty.Optional[int]:
+    """Return position of the end-of-source event, or None."""
+    ...
+
+
+def is_cc(message: bytes) -> bool:
+    """Whether message is a channel message other than a note."""
+    ...
+
+
+def is_note(message: bytes) -> bool:
+    """Whether message is a note-on or note-off message."""
+    ...
+
+
+def is_note_off(message: bytes) -> bool:
+    """Whether message is a note-off (or zero-velocity note-on)."""
+    ...
+
+
+def get_note_events(
+    columns: ty.Mapping[str, ty.Sequence[float]]
+) -> ty.List[ty.Tuple[float, int, bytes]]:
+    """
+    Split note columns into note-on and note-off events.
+
+    Parameters
+    ----------
+    columns : dict
+        Keys are ``NOTE_COLUMNS`` and values are sequences of numbers
+        of the same length. Positions are in MIDI ticks.
+
+    Returns
+    -------
+    list of (float, int, bytes)
+        Note-on and note-off events, not sorted.
+
+    See also
+    --------
+    get_note_columns
+    """
+    ...
+
+
+def get_note_columns(events: ty.List[EVENT_T]
+                     ) -> ty.Dict[str, ty.List[int]]:
+    """
+    Pair note-on and note-off events into columns.
+
+    Notes are ordered by note-on position, like ``Take.notes``. Notes
+    without note-off end at the end of source.
+
+    Parameters
+    ----------
+    events : list of (int, int, bytes)
+        Events as returned by ``decode_events``.
+
+    Returns
+    -------
+    dict
+        Keys are ``NOTE_COLUMNS`` and values are lists of int.
+    """
+    ...
+
+
+def sort_events(
+    events: ty.Iterable[ty.Tuple[float, int, bytes]]
+) -> ty.List[ty.Tuple[float, int, bytes]]:
+    """
+    Sort events by position.
+
+    Note-offs are put before other events at the same position, so
+    that consecutive notes of the same pitch are paired correctly.
+    The relative order of other events is kept.
+
+    Parameters
+    ----------
+    events : iterable of (float, int, bytes)
+        Events to sort.
+
+    Returns
+    -------
+    list of (float, int, bytes)
+        Sorted events.
+    """
+    ...
+
+
+def get_cc_columns(events: ty.List[EVENT_T]
+                   ) -> ty.Dict[str, ty.List[int]]:
+    """
+    Gather CC events into columns.
+
+    Parameters
+    ----------
+    events : list of (int, int, bytes)
+        Events as returned by ``decode_events``. The end-of-source
+        event is ignored.
+
+    Returns
+    -------
+    dict
+        Keys are ``CC_COLUMNS`` and values are lists of int.
+    """
+    ...
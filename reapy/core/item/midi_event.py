@@ -1,6 +1,16 @@
 import reapy
 import reapy.reascript_api as RPR
 from reapy.core import ReapyObject, ReapyObjectList
+from reapy.core.item import midi_buffer
+
+
+def _to_arrays(columns, dtypes):
+    """Convert dict of lists to dict of NumPy arrays."""
+    import numpy as np
+    return {
+        key: np.asarray(column, dtype=dtypes[key])
+        for key, column in columns.items()
+    }
 
 
 class MIDIEvent(ReapyObject):
@@ -246,6 +256,58 @@ class CCList(MIDIEventList):
 
     _elements_class = CC
     _n_elements = "n_cc"
+    _column_dtypes = {
+        "position": "float64",
+        "channel_message": "int64",
+        "channel": "int64",
+        "msg2": "int64",
+        "msg3": "int64",
+        "selected": "bool",
+        "muted": "bool",
+    }
+
+    @reapy.inside_reaper()
+    def _get_columns(self, unit):
+        columns = midi_buffer.get_cc_columns(self.parent._get_midi_events())
+        columns["position"] = self.parent._ppqs_to_times(
+            columns.pop("position_ppq"), unit
+        )
+        return columns
+
+    def to_arrays(self, unit="seconds"):
+        """
+        Return all CC events as columns of NumPy arrays.
+
+        All events are read at once with ``RPR.MIDI_GetAllEvts``,
+        which is much faster than querying each ``CC``. Requires
+        NumPy.
+
+        Parameters
+        ----------
+        unit : str, optional
+            Unit of positions: "beats"|"ppq"|"seconds" (default are
+            seconds). Beats and seconds are counted from project
+            start.
+
+        Returns
+        -------
+        dict of numpy.ndarray
+            Keys are {"position", "channel_message", "channel",
+            "msg2", "msg3", "selected", "muted"}.
+            ``"channel_message"`` is the message type (e.g. ``0xb0``
+            for CC) and ``"msg2"`` and ``"msg3"`` are the message data
+            bytes. Positions can be passed back with the same ``unit``
+            to ``Take.set_events``.
+
+        Examples
+        --------
+        >>> arrays = take.cc_events.to_arrays()
+        >>> is_cc64 = (arrays["channel_message"] == 0xb0) & (
+        ...     arrays["msg2"] == 64
+        ... )
+        >>> sustain_values = arrays["msg3"][is_cc64]
+        """
+        return _to_arrays(self._get_columns(unit), self._column_dtypes)
 
 
 class Note(MIDIEvent):
@@ -399,3 +461,54 @@ class NoteList(MIDIEventList):
 
     _elements_class = Note
     _n_elements = "n_notes"
+    _column_dtypes = {
+        "start": "float64",
+        "end": "float64",
+        "channel": "int64",
+        "pitch": "int64",
+        "velocity": "int64",
+        "selected": "bool",
+        "muted": "bool",
+    }
+
+    @reapy.inside_reaper()
+    def _get_columns(self, unit):
+        columns = midi_buffer.get_note_columns(
+            self.parent._get_midi_events()
+        )
+        starts, ends = columns.pop("start_ppq"), columns.pop("end_ppq")
+        times = self.parent._ppqs_to_times(starts + ends, unit)
+        columns["start"] = times[:len(starts)]
+        columns["end"] = times[len(starts):]
+        return columns
+
+    def to_arrays(self, unit="seconds"):
+        """
+        Return all notes as columns of NumPy arrays.
+
+        All events are read at once with ``RPR.MIDI_GetAllEvts``,
+        which is much faster than querying each ``Note``. Requires
+        NumPy.
+
+        Parameters
+        ----------
+        unit : str, optional
+            Unit of positions: "beats"|"ppq"|"seconds" (default are
+            seconds). Beats and seconds are counted from project
+            start.
+
+        Returns
+        -------
+        dict of numpy.ndarray
+            Keys are {"start", "end", "channel", "pitch", "velocity",
+            "selected", "muted"}. Notes are in the same order as in
+            ``Take.notes``. They can be modified and written back with
+            ``Take.set_notes``, with the same ``unit``.
+
+        Examples
+        --------
+        >>> arrays = take.notes.to_arrays()
+        >>> durations = arrays["end"] - arrays["start"]
+        >>> mean_velocity = arrays["velocity"].mean()
+        """
+        return _to_arrays(self._get_columns(unit), self._column_dtypes)
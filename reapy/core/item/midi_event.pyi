@@ -1,12 +1,22 @@
 import reapy
 import reapy.reascript_api as RPR
 from reapy.core import ReapyObject, ReapyObjectList
+from reapy.core.item import midi_buffer
 import typing as ty
 import typing_extensions as te
 
+if ty.TYPE_CHECKING:
+    import numpy as np
+
 T = ty.TypeVar('T')
 
 
+def _to_arrays(columns: ty.Dict[str, ty.List[ty.Any]],
+               dtypes: ty.Dict[str, str]) -> ty.Dict[str, 'np.ndarray']:
+    """Convert dict of lists to dict of NumPy arrays."""
+    ...
+
+
 class MIDIEvent(ReapyObject):
     """Abstract class for MIDI events."""
     parent: reapy.Take
@@ -184,6 +194,37 @@ class CCList(MIDIEventList[CC]):
 
     _elements_class: ty.Type[CC]
     _n_elements: str
+    _column_dtypes: ty.Dict[str, str]
+
+    def _get_columns(self, unit: str) -> ty.Dict[str, ty.List[ty.Any]]:
+        ...
+
+    def to_arrays(self, unit: str = "seconds") -> ty.Dict[str, 'np.ndarray']:
+        """
+        Return all CC events as columns of NumPy arrays.
+
+        All events are read at once with ``RPR.MIDI_GetAllEvts``,
+        which is much faster than querying each ``CC``. Requires
+        NumPy.
+
+        Parameters
+        ----------
+        unit : str, optional
+            Unit of positions: "beats"|"ppq"|"seconds" (default are
+            seconds). Beats and seconds are counted from project
+            start.
+
+        Returns
+        -------
+        dict of numpy.ndarray
+            Keys are {"position", "channel_message", "channel",
+            "msg2", "msg3", "selected", "muted"}.
+            ``"channel_message"`` is the message type (e.g. ``0xb0``
+            for CC) and ``"msg2"`` and ``"msg3"`` are the message data
+            bytes. Positions can be passed back with the same ``unit``
+            to ``Take.set_events``.
+        """
+        ...
 
 
 NOTE_INFOS_T = te.TypedDict(
@@ -321,3 +362,32 @@ class NoteList(MIDIEventList[Note]):
 
     _elements_class: ty.Type[Note]
     _n_elements: str
+    _column_dtypes: ty.Dict[str, str]
+
+    def _get_columns(self) -> ty.Dict[str, ty.List[ty.Any]]:
+        ...
+
+    def to_arrays(self) -> ty.Dict[str, 'np.ndarray']:
+        """
+        Return all notes as columns of NumPy arrays.
+
+        All events are read at once with ``RPR.MIDI_GetAllEvts``,
+        which is much faster than querying each ``Note``. Requires
+        NumPy.
+
+        Parameters
+        ----------
+        unit : str, optional
+            Unit of positions: "beats"|"ppq"|"seconds" (default are
+            seconds). Beats and seconds are counted from project
+            start.
+
+        Returns
+        -------
+        dict of numpy.ndarray
+            Keys are {"start", "end", "channel", "pitch", "velocity",
+            "selected", "muted"}. Notes are in the same order as in
+            ``Take.notes``. They can be modified and written back with
+            ``Take.set_notes``, with the same ``unit``.
+        """
+        ...
@@ -1,6 +1,14 @@
 import reapy
 from reapy import reascript_api as RPR
 from reapy.core import ReapyObject
+from reapy.core.item import midi_buffer
+
+
+def _get_column(columns, key, default, length):
+    """Return column of dict, or list of default values if missing."""
+    if key in columns:
+        return columns[key]
+    return [default]*length
 
 
 class Take(ReapyObject):
@@ -215,6 +223,67 @@ class Take(ReapyObject):
         """
         return reapy.FXList(self)
 
+    def _get_midi_events(self):
+        """
+        Return all MIDI events of take in a single API call.
+
+        Returns
+        -------
+        list of (int, int, bytes)
+            Position in MIDI ticks, flags and message of each event,
+            including the end-of-source event.
+
+        Raises
+        ------
+        RuntimeError
+            If events don't fit in a buffer of
+            ``midi_buffer.MAX_BUFFER_SIZE`` bytes.
+
+        See also
+        --------
+        reapy.core.item.midi_buffer.decode_events
+        """
+        if not self.is_midi:
+            return []
+        size = midi_buffer.BUFFER_SIZE
+        while True:
+            success, _, buffer, length = RPR.MIDI_GetAllEvts(
+                self.id, "", size
+            )
+            if success and length < size:
+                break
+            if size >= midi_buffer.MAX_BUFFER_SIZE:
+                raise RuntimeError(
+                    "MIDI events of take {} don't fit in {} bytes."
+                    .format(self.id, midi_buffer.MAX_BUFFER_SIZE)
+                )
+            # REAPER fails when buffer is too small, or it may have
+            # been truncated
+            size *= 2
+        return midi_buffer.decode_events(buffer.encode("latin-1"))
+
+    def _get_ppq_columns(self, columns, keys, unit):
+        """
+        Return position columns in MIDI ticks.
+
+        Columns are converted from ``unit`` in a single request (see
+        ``Take._times_to_ppqs``). Raise ``ValueError`` when columns
+        ``key + "_ppq"`` are given, since they would conflict with
+        columns ``key``.
+        """
+        for key in keys:
+            if key + "_ppq" in columns:
+                raise ValueError(
+                    'Column "{0}_ppq" is not supported, pass positions in '
+                    'MIDI ticks as "{0}" with unit="ppq".'.format(key)
+                )
+        positions = [float(x) for key in keys for x in columns[key]]
+        positions = self._times_to_ppqs(positions, unit)
+        n = len(positions) // len(keys)
+        return {
+            key: positions[i*n:(i + 1)*n] for i, key in enumerate(keys)
+        }
+
     def get_info_value(self, param_name):
         return RPR.GetMediaItemTakeInfo_Value(self.id, param_name)
 
@@ -431,6 +500,25 @@ class Take(ReapyObject):
         time = RPR.MIDI_GetProjTimeFromPPQPos(self.id, ppq)
         return time
 
+    @reapy.inside_reaper()
+    def _ppqs_to_times(self, ppqs, unit="seconds"):
+        """
+        Convert several times in MIDI ticks at once.
+
+        ``unit`` is "beats"|"ppq"|"seconds". Beats and seconds are
+        counted from project start, like ``Note.start``.
+        """
+        if unit == "ppq":
+            return list(ppqs)
+        convert = {
+            "beats": RPR.MIDI_GetProjQNFromPPQPos,
+            "seconds": RPR.MIDI_GetProjTimeFromPPQPos,
+        }.get(unit)
+        if convert is None:
+            raise ValueError('unit param should be one of seconds|beats|ppq')
+        times = {ppq: convert(self.id, ppq) for ppq in set(ppqs)}
+        return [times[ppq] for ppq in ppqs]
+
     @reapy.inside_reaper()
     @property
     def project(self):
@@ -487,9 +575,158 @@ class Take(ReapyObject):
         """
         RPR.MIDI_SelectAll(self.id, select)
 
+    def set_events(self, events, unit="seconds", sort=True):
+        """
+        Replace all MIDI events of take.
+
+        Events are encoded locally and sent to REAPER with a single
+        ``RPR.MIDI_SetAllEvts`` call, which is much faster than
+        adding them one by one with ``Take.add_event``.
+
+        Parameters
+        ----------
+        events : dict
+            Columns of events, as sequences (or NumPy arrays) of the
+            same length. Required keys are ``"position"`` and
+            ``"message"`` (bytes or iterables of int, e.g.
+            ``(0xb0, 64, 127)``). Optional keys are ``"selected"`` and
+            ``"muted"`` (default=False).
+        unit : str, optional
+            Unit of ``"position"``: "beats"|"ppq"|"seconds" (default
+            are seconds). Beats and seconds are counted from project
+            start, like in ``CCList.to_arrays``.
+        sort : bool, optional
+            Whether to call ``Take.sort_events`` afterwards
+            (default=True).
+
+        Raises
+        ------
+        ValueError
+            If a ``"position_ppq"`` column is given. Use ``unit="ppq"``
+            instead.
+        RuntimeError
+            If existing events of take can't be read (see
+            ``Take._get_midi_events``).
+
+        See also
+        --------
+        Take.set_notes
+        """
+        position = self._get_ppq_columns(events, ("position",), unit)
+        n_events = len(position["position"])
+        rows = zip(
+            position["position"],
+            _get_column(events, "selected", False, n_events),
+            _get_column(events, "muted", False, n_events),
+            events["message"]
+        )
+        new_events = [
+            (ppq, bool(selected) | bool(muted) << 1, bytes(message))
+            for ppq, selected, muted, message in rows
+        ]
+        end = midi_buffer.get_end_of_source(self._get_midi_events())
+        self._set_midi_events(new_events, end, sort)
+
     def set_info_value(self, param_name, value):
         return RPR.SetMediaItemTakeInfo_Value(self.id, param_name, value)
 
+    def _set_midi_events(self, events, end_of_source=None, sort=True):
+        """
+        Replace all MIDI events of take in a single API call.
+
+        Parameters
+        ----------
+        events : iterable of (float, int, bytes)
+            Position in MIDI ticks, flags and message of each event,
+            without the end-of-source event.
+        end_of_source : float, optional
+            Position of end-of-source event. It is moved after the
+            last event if needed. Defaults to the last event position.
+        sort : bool, optional
+            Whether to call ``RPR.MIDI_Sort`` afterwards (default=True).
+        """
+        events = midi_buffer.sort_events(events)
+        last = events[-1][0] if events else 0
+        end = last if end_of_source is None else max(end_of_source, last)
+        events.append((end, 0, midi_buffer.END_OF_SOURCE))
+        buffer = midi_buffer.encode_events(events)
+        RPR.MIDI_SetAllEvts(self.id, buffer.decode("latin-1"), len(buffer))
+        if sort:
+            self.sort_events()
+
+    def set_notes(self, notes, unit="seconds", sort=True):
+        """
+        Replace all notes of take.
+
+        Other MIDI events (CC, SysEx...) are kept. Notes are encoded
+        locally and sent to REAPER with a single
+        ``RPR.MIDI_SetAllEvts`` call, which is much faster than
+        adding them one by one with ``Take.add_note``.
+
+        Parameters
+        ----------
+        notes : dict
+            Columns of notes, as sequences (or NumPy arrays) of the
+            same length. Required keys are ``"start"``, ``"end"`` and
+            ``"pitch"``. Optional keys are ``"velocity"``
+            (default=100), ``"channel"`` (default=0), ``"selected"``
+            and ``"muted"`` (default=False).
+        unit : str, optional
+            Unit of ``"start"`` and ``"end"``: "beats"|"ppq"|"seconds"
+            (default are seconds). Beats and seconds are counted from
+            project start, like in ``NoteList.to_arrays``.
+        sort : bool, optional
+            Whether to call ``Take.sort_events`` afterwards
+            (default=True).
+
+        Raises
+        ------
+        ValueError
+            If ``"start_ppq"`` or ``"end_ppq"`` columns are given. Use
+            ``unit="ppq"`` instead.
+        RuntimeError
+            If other events of take can't be read (see
+            ``Take._get_midi_events``). Nothing is written then.
+
+        See also
+        --------
+        NoteList.to_arrays
+        Take.set_events
+
+        Examples
+        --------
+        Arrays returned by ``NoteList.to_arrays`` can be modified and
+        written back:
+
+        >>> arrays = take.notes.to_arrays()
+        >>> arrays["pitch"] += 12  # Transpose one octave up
+        >>> arrays["start"] += 1  # Delay by one second
+        >>> arrays["end"] += 1
+        >>> take.set_notes(arrays)
+
+        Positions can also be edited in MIDI ticks:
+
+        >>> arrays = take.notes.to_arrays(unit="ppq")
+        >>> arrays["end"] = arrays["start"] + 240
+        >>> take.set_notes(arrays, unit="ppq")
+        """
+        columns = self._get_ppq_columns(notes, ("start", "end"), unit)
+        n_notes = len(columns["start"])
+        columns["start_ppq"] = columns.pop("start")
+        columns["end_ppq"] = columns.pop("end")
+        columns["pitch"] = notes["pitch"]
+        defaults = {"channel": 0, "velocity": 100, "selected": False,
+                    "muted": False}
+        for key, default in defaults.items():
+            columns[key] = _get_column(notes, key, default, n_notes)
+        events = self._get_midi_events()
+        end = midi_buffer.get_end_of_source(events)
+        if end is not None:
+            events = events[:-1]
+        events = [e for e in events if not midi_buffer.is_note(e[2])]
+        events += midi_buffer.get_note_events(columns)
+        self._set_midi_events(events, end, sort)
+
     def sort_events(self):
         """
         Sort MIDI events on take.
@@ -554,6 +791,24 @@ class Take(ReapyObject):
         ppq = RPR.MIDI_GetPPQPosFromProjTime(self.id, time)
         return ppq
 
+    @reapy.inside_reaper()
+    def _times_to_ppqs(self, times, unit="seconds"):
+        """
+        Convert several times to MIDI ticks at once.
+
+        Inverse of ``Take._ppqs_to_times``.
+        """
+        if unit == "ppq":
+            return [float(time) for time in times]
+        convert = {
+            "beats": RPR.MIDI_GetPPQPosFromProjQN,
+            "seconds": RPR.MIDI_GetPPQPosFromProjTime,
+        }.get(unit)
+        if convert is None:
+            raise ValueError('unit param should be one of seconds|beats|ppq')
+        ppqs = {time: convert(self.id, time) for time in set(times)}
+        return [ppqs[time] for time in times]
+
     @property
     def track(self):
         """
@@ -1,9 +1,16 @@
 import reapy
 from reapy import reascript_api as RPR
 from reapy.core import ReapyObject
+from reapy.core.item import midi_buffer
 import typing as ty
 
 
+def _get_column(columns: ty.Mapping[str, ty.Sequence[ty.Any]], key: str,
+                default: ty.Any, length: int) -> ty.Sequence[ty.Any]:
+    """Return column of dict, or list of default values if missing."""
+    ...
+
+
 class Take(ReapyObject):
 
     _class_name = "Take"
@@ -199,6 +206,42 @@ class Take(ReapyObject):
         """
         ...
 
+    def _get_midi_events(self) -> ty.List[ty.Tuple[int, int, bytes]]:
+        """
+        Return all MIDI events of take in a single API call.
+
+        Returns
+        -------
+        list of (int, int, bytes)
+            Position in MIDI ticks, flags and message of each event,
+            including the end-of-source event.
+
+        Raises
+        ------
+        RuntimeError
+            If events don't fit in a buffer of
+            ``midi_buffer.MAX_BUFFER_SIZE`` bytes.
+
+        See also
+        --------
+        reapy.core.item.midi_buffer.decode_events
+        """
+        ...
+
+    def _get_ppq_columns(
+        self, columns: ty.Mapping[str, ty.Sequence[float]],
+        keys: ty.Iterable[str], unit: str
+    ) -> ty.Dict[str, ty.List[float]]:
+        """
+        Return position columns in MIDI ticks.
+
+        Columns are converted from ``unit`` in a single request (see
+        ``Take._times_to_ppqs``). Raise ``ValueError`` when columns
+        ``key + "_ppq"`` are given, since they would conflict with
+        columns ``key``.
+        """
+        ...
+
     def get_info_value(self, param_name: str) -> float:
         ...
 
@@ -404,6 +447,17 @@ class Take(ReapyObject):
         """
         ...
 
+    def _ppqs_to_times(
+        self, ppqs: ty.List[float], unit: str = "seconds"
+    ) -> ty.List[float]:
+        """
+        Convert several times in MIDI ticks at once.
+
+        ``unit`` is "beats"|"ppq"|"seconds". Beats and seconds are
+        counted from project start, like ``Note.start``.
+        """
+        ...
+
     @property
     def project(self) -> reapy.Project:
         """
@@ -446,9 +500,138 @@ class Take(ReapyObject):
         """
         ...
 
+    def set_events(
+        self,
+        events: ty.Mapping[str, ty.Sequence[ty.Any]],
+        unit: str = "seconds",
+        sort: bool = True
+    ) -> None:
+        """
+        Replace all MIDI events of take.
+
+        Events are encoded locally and sent to REAPER with a single
+        ``RPR.MIDI_SetAllEvts`` call, which is much faster than
+        adding them one by one with ``Take.add_event``.
+
+        Parameters
+        ----------
+        events : dict
+            Columns of events, as sequences (or NumPy arrays) of the
+            same length. Required keys are ``"position"`` and
+            ``"message"`` (bytes or iterables of int, e.g.
+            ``(0xb0, 64, 127)``). Optional keys are ``"selected"`` and
+            ``"muted"`` (default=False).
+        unit : str, optional
+            Unit of ``"position"``: "beats"|"ppq"|"seconds" (default
+            are seconds). Beats and seconds are counted from project
+            start, like in ``CCList.to_arrays``.
+        sort : bool, optional
+            Whether to call ``Take.sort_events`` afterwards
+            (default=True).
+
+        Raises
+        ------
+        ValueError
+            If a ``"position_ppq"`` column is given. Use ``unit="ppq"``
+            instead.
+        RuntimeError
+            If existing events of take can't be read (see
+            ``Take._get_midi_events``).
+
+        See also
+        --------
+        Take.set_notes
+        """
+        ...
+
     def set_info_value(self, param_name: str, value: float) -> bool:
         ...
 
+    def _set_midi_events(
+        self,
+        events: ty.Iterable[ty.Tuple[float, int, bytes]],
+        end_of_source: ty.Optional[float] = None,
+        sort: bool = True
+    ) -> None:
+        """
+        Replace all MIDI events of take in a single API call.
+
+        Parameters
+        ----------
+        events : iterable of (float, int, bytes)
+            Position in MIDI ticks, flags and message of each event,
+            without the end-of-source event.
+        end_of_source : float, optional
+            Position of end-of-source event. It is moved after the
+            last event if needed. Defaults to the last event position.
+        sort : bool, optional
+            Whether to call ``RPR.MIDI_Sort`` afterwards (default=True).
+        """
+        ...
+
+    def set_notes(
+        self,
+        notes: ty.Mapping[str, ty.Sequence[ty.Any]],
+        unit: str = "seconds",
+        sort: bool = True
+    ) -> None:
+        """
+        Replace all notes of take.
+
+        Other MIDI events (CC, SysEx...) are kept. Notes are encoded
+        locally and sent to REAPER with a single
+        ``RPR.MIDI_SetAllEvts`` call, which is much faster than
+        adding them one by one with ``Take.add_note``.
+
+        Parameters
+        ----------
+        notes : dict
+            Columns of notes, as sequences (or NumPy arrays) of the
+            same length. Required keys are ``"start"``, ``"end"`` and
+            ``"pitch"``. Optional keys are ``"velocity"``
+            (default=100), ``"channel"`` (default=0), ``"selected"``
+            and ``"muted"`` (default=False).
+        unit : str, optional
+            Unit of ``"start"`` and ``"end"``: "beats"|"ppq"|"seconds"
+            (default are seconds). Beats and seconds are counted from
+            project start, like in ``NoteList.to_arrays``.
+        sort : bool, optional
+            Whether to call ``Take.sort_events`` afterwards
+            (default=True).
+
+        Raises
+        ------
+        ValueError
+            If ``"start_ppq"`` or ``"end_ppq"`` columns are given. Use
+            ``unit="ppq"`` instead.
+        RuntimeError
+            If other events of take can't be read (see
+            ``Take._get_midi_events``). Nothing is written then.
+
+        See also
+        --------
+        NoteList.to_arrays
+        Take.set_events
+
+        Examples
+        --------
+        Arrays returned by ``NoteList.to_arrays`` can be modified and
+        written back:
+
+        >>> arrays = take.notes.to_arrays()
+        >>> arrays["pitch"] += 12  # Transpose one octave up
+        >>> arrays["start"] += 1  # Delay by one second
+        >>> arrays["end"] += 1
+        >>> take.set_notes(arrays)
+
+        Positions can also be edited in MIDI ticks:
+
+        >>> arrays = take.notes.to_arrays(unit="ppq")
+        >>> arrays["end"] = arrays["start"] + 240
+        >>> take.set_notes(arrays, unit="ppq")
+        """
+        ...
+
     def sort_events(self) -> None:
         """
         Sort MIDI events on take.
@@ -512,6 +695,16 @@ class Take(ReapyObject):
         """
         ...
 
+    def _times_to_ppqs(
+        self, times: ty.List[float], unit: str = "seconds"
+    ) -> ty.List[float]:
+        """
+        Convert several times to MIDI ticks at once.
+
+        Inverse of ``Take._ppqs_to_times``.
+        """
+        ...
+
     @property
     def track(self) -> reapy.Track:
         """
@@ -1,4 +1,4 @@
-from .marker import Marker
+from .marker import Marker, MarkerList
 from .project import Project
-from .region import Region
+from .region import Region, RegionList
 from .time_selection import TimeSelection
@@ -1,10 +1,12 @@
-from .marker import Marker
+from .marker import Marker, MarkerList
 from .project import Project
-from .region import Region
+from .region import Region, RegionList
 from .time_selection import TimeSelection
 __all__ = [
     'Marker',
+    'MarkerList',
     'Project',
     'Region',
+    'RegionList',
     'TimeSelection',
 ]
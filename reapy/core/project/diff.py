@@ -0,0 +1,293 @@
+"""Incremental project diffs.
+
+Each object of a project (track, item, take or envelope) gets a short
+signature computed inside REAPER from its snapshot record and, for
+takes and envelopes, from a hash of their content
+(``RPR.MIDI_GetHash``, ``RPR.GetAudioAccessorHash`` or envelope state
+chunk). A ``DiffToken`` stores the signatures of the last diff, so that
+the next one only returns objects whose signature changed.
+
+When the project state change count (``RPR.GetProjectStateChangeCount``)
+did not change since the token was issued, no signature is computed
+at all.
+"""
+
+import collections
+import hashlib
+import types
+
+import reapy
+from reapy import reascript_api as RPR
+from reapy.core.project import snapshot as project_snapshot
+
+
+#: Size of buffers passed to ``RPR.GetEnvelopeStateChunk``.
+ENVELOPE_CHUNK_SIZE = 4 * 1024 ** 2
+
+
+class DiffToken(collections.namedtuple(
+    "DiffToken", ("project_id", "state_change_count", "signatures")
+)):
+
+    """
+    State of a project as seen by the last diff.
+
+    Tokens are opaque: pass them to ``Project.diff_since``.
+
+    Attributes
+    ----------
+    project_id : str
+        ReaScript ID of the project.
+    state_change_count : int
+        Value of ``RPR.GetProjectStateChangeCount`` when the token was
+        issued.
+    signatures : mapping
+        Read-only mapping from object keys (GUIDs for tracks, items and
+        takes, ``EnvelopeRecord.key`` for envelopes) to signatures.
+    """
+
+    __slots__ = ()
+
+
+class EnvelopeRecord(collections.namedtuple(
+    "EnvelopeRecord", ("id", "key", "name", "n_points")
+)):
+
+    """
+    Snapshot of an envelope.
+
+    Attributes
+    ----------
+    id : str
+        ReaScript ID of the envelope.
+    key : str
+        Identifier of the envelope, made of its parent GUID and its
+        name (e.g. ``"{...}/Volume"``).
+    name : str
+    n_points : int
+    """
+
+    __slots__ = ()
+
+
+class ProjectDiff(collections.namedtuple(
+    "ProjectDiff",
+    (
+        "token", "tracks", "items", "takes", "envelopes", "parents",
+        "removed"
+    )
+)):
+
+    """
+    Changes of a project since a ``DiffToken``.
+
+    Attributes
+    ----------
+    token : DiffToken
+        Token to pass to the next call of ``Project.diff_since``.
+    tracks : tuple of TrackRecord
+        New or changed tracks.
+    items : tuple of ItemRecord
+        New or changed items.
+    takes : tuple of TakeRecord
+        New or changed takes.
+    envelopes : tuple of EnvelopeRecord
+        New or changed track and take envelopes.
+    parents : mapping
+        Read-only mapping from keys of changed items, takes and
+        envelopes to GUIDs of their parent track, item or take.
+    removed : frozenset of str
+        Keys of objects that no longer exist.
+
+    Notes
+    -----
+    Records come from ``reapy.core.project.snapshot``. Their children
+    (``TrackRecord.items`` and ``ItemRecord.takes``) are always empty:
+    changed children are listed separately, and linked to their
+    parents with ``ProjectDiff.parents``.
+    """
+
+    __slots__ = ()
+
+    def __bool__(self):
+        return bool(
+            self.tracks or self.items or self.takes or self.envelopes
+            or self.removed
+        )
+
+
+def _get_signature(*values):
+    data = repr(values).encode("utf-8", "surrogatepass")
+    return hashlib.blake2b(data, digest_size=8).hexdigest()
+
+
+def _get_take_content_hash(take_id):
+    if RPR.TakeIsMIDI(take_id):
+        return RPR.MIDI_GetHash(take_id, False, "", 1024)[3]
+    accessor = RPR.CreateTakeAudioAccessor(take_id)
+    try:
+        return RPR.GetAudioAccessorHash(accessor, "")[1]
+    finally:
+        RPR.DestroyAudioAccessor(accessor)
+
+
+def _without_id(record):
+    """Return record without fields that change between sessions."""
+    return sorted(
+        (key, value) for key, value in record.items() if key != "id"
+    )
+
+
+class _ChangeReader:
+
+    """Walk project and collect objects whose signature changed."""
+
+    def __init__(self, signatures):
+        self.signatures = signatures
+        self.new_signatures = {}
+        self.changes = {
+            "tracks": [], "items": [], "takes": [], "envelopes": []
+        }
+        self.parents = {}
+
+    def add(self, kind, key, record, parent_key, *content):
+        # Parent is signed so that objects moved to another parent
+        # (e.g. with ``RPR.MoveMediaItemToTrack``) are reported.
+        signature = _get_signature(parent_key, _without_id(record), *content)
+        self.new_signatures[key] = signature
+        if self.signatures.get(key) != signature:
+            self.changes[kind].append(record)
+            if parent_key is not None:
+                self.parents[key] = parent_key
+
+    def read_envelopes(self, count, get, parent_id, parent_key):
+        for i in range(count(parent_id)):
+            envelope_id = get(parent_id, i)
+            name = RPR.GetEnvelopeName(envelope_id, "", 2048)[2]
+            key = "{}/{}".format(parent_key, name)
+            record = {
+                "id": envelope_id,
+                "key": key,
+                "name": name,
+                "n_points": RPR.CountEnvelopePoints(envelope_id),
+            }
+            chunk = RPR.GetEnvelopeStateChunk(
+                envelope_id, "", ENVELOPE_CHUNK_SIZE, False
+            )[2]
+            self.add("envelopes", key, record, parent_key, chunk)
+
+    def read_item(self, item_id, index, parent_key, fields, fxs):
+        item = project_snapshot._read_item(
+            item_id, index, dict(fields, take=None), fxs
+        )
+        self.add("items", item["guid"], item, parent_key)
+        for i in range(RPR.CountTakes(item_id)):
+            take_id = RPR.GetTake(item_id, i)
+            take = project_snapshot._read_take(take_id, i, fields, fxs)
+            self.add(
+                "takes", take["guid"], take, item["guid"],
+                _get_take_content_hash(take_id)
+            )
+            self.read_envelopes(
+                RPR.CountTakeEnvelopes, RPR.GetTakeEnvelope, take_id,
+                take["guid"]
+            )
+
+    def read_project(self, project_id, fields, fxs):
+        for i in range(RPR.CountTracks(project_id)):
+            track_id = RPR.GetTrack(project_id, i)
+            track = project_snapshot._read_track(
+                track_id, i, dict(fields, item=None), fxs
+            )
+            self.add("tracks", track["guid"], track, None)
+            self.read_envelopes(
+                RPR.CountTrackEnvelopes, RPR.GetTrackEnvelope, track_id,
+                track["guid"]
+            )
+            for j in range(RPR.CountTrackMediaItems(track_id)):
+                item_id = RPR.GetTrackMediaItem(track_id, j)
+                self.read_item(item_id, j, track["guid"], fields, fxs)
+
+
+@reapy.inside_reaper()
+def read_changes(project_id, signatures, fields=None, fxs=True):
+    """
+    Return objects whose signature changed.
+
+    Should only be used internally. Use ``Project.diff_since`` instead.
+
+    Parameters
+    ----------
+    project_id : str
+        ReaScript ID of the project.
+    signatures : dict
+        Signatures of the previous diff.
+    fields : dict, optional
+        See ``Project.snapshot``. Values can't be None.
+    fxs : bool, optional
+        Whether to read FX names (default=True).
+
+    Returns
+    -------
+    dict
+        Keys are ``"state_change_count"``, ``"changes"`` (dict of
+        lists of records), ``"parents"``, ``"signatures"`` (new or
+        changed signatures only) and ``"removed"``.
+    """
+    fields = project_snapshot._get_fields(fields)
+    if None in fields.values():
+        raise ValueError("Diffs can't skip record types.")
+    reader = _ChangeReader(signatures)
+    state_change_count = RPR.GetProjectStateChangeCount(project_id)
+    reader.read_project(project_id, fields, fxs)
+    return {
+        "state_change_count": state_change_count,
+        "changes": reader.changes,
+        "parents": reader.parents,
+        "signatures": {
+            key: signature
+            for key, signature in reader.new_signatures.items()
+            if signatures.get(key) != signature
+        },
+        "removed": [
+            key for key in signatures if key not in reader.new_signatures
+        ],
+    }
+
+
+def diff_since(project_id, token=None, fields=None, fxs=True):
+    """
+    Return changes of a project since a token.
+
+    Should only be used internally. Use ``Project.diff_since`` instead.
+    """
+    if token is not None:
+        if token.project_id != project_id:
+            raise ValueError("Token was issued for another project.")
+        count = RPR.GetProjectStateChangeCount(project_id)
+        if count == token.state_change_count:
+            return ProjectDiff(
+                token, (), (), (), (), types.MappingProxyType({}),
+                frozenset()
+            )
+        signatures = dict(token.signatures)
+    else:
+        signatures = {}
+    data = read_changes(project_id, signatures, fields, fxs)
+    for key in data["removed"]:
+        del signatures[key]
+    signatures.update(data["signatures"])
+    token = DiffToken(
+        project_id, data["state_change_count"],
+        types.MappingProxyType(signatures)
+    )
+    changes = data["changes"]
+    return ProjectDiff(
+        token,
+        tuple(map(project_snapshot._to_track_record, changes["tracks"])),
+        tuple(map(project_snapshot._to_item_record, changes["items"])),
+        tuple(map(project_snapshot._to_take_record, changes["takes"])),
+        tuple(EnvelopeRecord(**e) for e in changes["envelopes"]),
+        types.MappingProxyType(data["parents"]),
+        frozenset(data["removed"])
+    )
@@ -0,0 +1,207 @@
+"""Incremental project diffs.
+
+Each object of a project (track, item, take or envelope) gets a short
+signature computed inside REAPER from its snapshot record and, for
+takes and envelopes, from a hash of their content
+(``RPR.MIDI_GetHash``, ``RPR.GetAudioAccessorHash`` or envelope state
+chunk). A ``DiffToken`` stores the signatures of the last diff, so that
+the next one only returns objects whose signature changed.
+
+When the project state change count (``RPR.GetProjectStateChangeCount``)
+did not change since the token was issued, no signature is computed
+at all.
+"""
+
+import typing as ty
+
+from reapy.core.project import snapshot as project_snapshot
+
+
+ENVELOPE_CHUNK_SIZE: int
+
+
+class DiffToken(ty.NamedTuple):
+
+    """
+    State of a project as seen by the last diff.
+
+    Tokens are opaque: pass them to ``Project.diff_since``.
+
+    Attributes
+    ----------
+    project_id : str
+        ReaScript ID of the project.
+    state_change_count : int
+        Value of ``RPR.GetProjectStateChangeCount`` when the token was
+        issued.
+    signatures : mapping
+        Read-only mapping from object keys (GUIDs for tracks, items and
+        takes, ``EnvelopeRecord.key`` for envelopes) to signatures.
+    """
+
+    project_id: str
+    state_change_count: int
+    signatures: ty.Mapping[str, str]
+
+
+class EnvelopeRecord(ty.NamedTuple):
+
+    """
+    Snapshot of an envelope.
+
+    Attributes
+    ----------
+    id : str
+        ReaScript ID of the envelope.
+    key : str
+        Identifier of the envelope, made of its parent GUID and its
+        name (e.g. ``"{...}/Volume"``).
+    name : str
+    n_points : int
+    """
+
+    id: str
+    key: str
+    name: str
+    n_points: int
+
+
+class ProjectDiff(ty.NamedTuple):
+
+    """
+    Changes of a project since a ``DiffToken``.
+
+    Attributes
+    ----------
+    token : DiffToken
+        Token to pass to the next call of ``Project.diff_since``.
+    tracks : tuple of TrackRecord
+        New or changed tracks.
+    items : tuple of ItemRecord
+        New or changed items.
+    takes : tuple of TakeRecord
+        New or changed takes.
+    envelopes : tuple of EnvelopeRecord
+        New or changed track and take envelopes.
+    parents : mapping
+        Read-only mapping from keys of changed items, takes and
+        envelopes to GUIDs of their parent track, item or take.
+    removed : frozenset of str
+        Keys of objects that no longer exist.
+
+    Notes
+    -----
+    Records come from ``reapy.core.project.snapshot``. Their children
+    (``TrackRecord.items`` and ``ItemRecord.takes``) are always empty:
+    changed children are listed separately, and linked to their
+    parents with ``ProjectDiff.parents``.
+    """
+
+    token: DiffToken
+    tracks: ty.Tuple[project_snapshot.TrackRecord, ...]
+    items: ty.Tuple[project_snapshot.ItemRecord, ...]
+    takes: ty.Tuple[project_snapshot.TakeRecord, ...]
+    envelopes: ty.Tuple[EnvelopeRecord, ...]
+    parents: ty.Mapping[str, str]
+    removed: ty.FrozenSet[str]
+
+    def __bool__(self) -> bool:
+        ...
+
+
+def _get_signature(*values: ty.Any) -> str:
+    ...
+
+
+def _get_take_content_hash(take_id: str) -> str:
+    ...
+
+
+def _without_id(
+    record: ty.Mapping[str, ty.Any]
+) -> ty.List[ty.Tuple[str, ty.Any]]:
+    """Return record without fields that change between sessions."""
+    ...
+
+
+class _ChangeReader:
+
+    """Walk project and collect objects whose signature changed."""
+
+    signatures: ty.Mapping[str, str]
+    new_signatures: ty.Dict[str, str]
+    changes: ty.Dict[str, ty.List[ty.Dict[str, ty.Any]]]
+    parents: ty.Dict[str, str]
+
+    def __init__(self, signatures: ty.Mapping[str, str]) -> None:
+        ...
+
+    def add(
+        self, kind: str, key: str, record: ty.Dict[str, ty.Any],
+        parent_key: ty.Optional[str], *content: ty.Any
+    ) -> None:
+        ...
+
+    def read_envelopes(
+        self, count: ty.Callable[[str], int],
+        get: ty.Callable[[str, int], str], parent_id: str, parent_key: str
+    ) -> None:
+        ...
+
+    def read_item(
+        self, item_id: str, index: int, parent_key: str,
+        fields: ty.Mapping[str, ty.Iterable[str]], fxs: bool
+    ) -> None:
+        ...
+
+    def read_project(
+        self, project_id: str,
+        fields: ty.Mapping[str, ty.Iterable[str]], fxs: bool
+    ) -> None:
+        ...
+
+
+def read_changes(
+    project_id: str,
+    signatures: ty.Mapping[str, str],
+    fields: ty.Optional[ty.Mapping[str, ty.Iterable[str]]] = None,
+    fxs: bool = True
+) -> ty.Dict[str, ty.Any]:
+    """
+    Return objects whose signature changed.
+
+    Should only be used internally. Use ``Project.diff_since`` instead.
+
+    Parameters
+    ----------
+    project_id : str
+        ReaScript ID of the project.
+    signatures : dict
+        Signatures of the previous diff.
+    fields : dict, optional
+        See ``Project.snapshot``. Values can't be None.
+    fxs : bool, optional
+        Whether to read FX names (default=True).
+
+    Returns
+    -------
+    dict
+        Keys are ``"state_change_count"``, ``"changes"`` (dict of
+        lists of records), ``"parents"``, ``"signatures"`` (new or
+        changed signatures only) and ``"removed"``.
+    """
+    ...
+
+
+def diff_since(
+    project_id: str,
+    token: ty.Optional[DiffToken] = None,
+    fields: ty.Optional[ty.Mapping[str, ty.Iterable[str]]] = None,
+    fxs: bool = True
+) -> ProjectDiff:
+    """
+    Return changes of a project since a token.
+
+    Should only be used internally. Use ``Project.diff_since`` instead.
+    """
+    ...
@@ -1,6 +1,7 @@
 import reapy
 from reapy import reascript_api as RPR
-from reapy.core import ReapyObject
+from reapy.core import ReapyObject, ReapyObjectList
+from reapy.core.project.snapshot import MarkerRecord
 
 
 class Marker(ReapyObject):
@@ -28,9 +29,7 @@ class Marker(ReapyObject):
         """
         Return marker index as needed by RPR.EnumProjectMarkers2.
         """
-        for index, marker in enumerate(self.project.markers):
-            if marker.index == self.index:
-                return index
+        return self.project._get_marker_enum_index(self.index, False)
 
     @property
     def _kwargs(self):
@@ -71,3 +70,73 @@ class Marker(ReapyObject):
         RPR.SetProjectMarker2(
             self.project_id, self.index, False, position, 0, ""
         )
+
+
+class MarkerList(ReapyObjectList):
+
+    """
+    Container for a project's markers.
+
+    Markers are read inside REAPER in a single pass, and cached until
+    the project state change count changes (see
+    ``Project._get_marker_table``).
+
+    Examples
+    --------
+    >>> markers = project.markers
+    >>> len(markers)
+    2
+    >>> markers[0].index
+    1
+    >>> markers.to_records()[0]
+    MarkerRecord(index=1, name='Verse', position=4.0, color=0)
+    """
+
+    _class_name = "MarkerList"
+
+    def __init__(self, parent):
+        """
+        Create marker list.
+
+        Parameters
+        ----------
+        parent : Project
+            Parent project.
+        """
+        self.parent = parent
+
+    @reapy.inside_reaper()
+    def __getitem__(self, key):
+        records = self._get_records()
+        if isinstance(key, slice):
+            return [Marker(self.parent, r[0]) for r in records[key]]
+        return Marker(self.parent, records[key][0])
+
+    def __iter__(self):
+        markers = self[:]  # Only cost one distant call
+        for marker in markers:
+            yield marker
+
+    @reapy.inside_reaper()
+    def __len__(self):
+        # Same table as indexing, so that both always agree
+        return len(self._get_records())
+
+    @property
+    def _args(self):
+        return self.parent,
+
+    @reapy.inside_reaper()
+    def _get_records(self):
+        return self.parent._get_marker_table()["markers"]
+
+    def to_records(self):
+        """
+        Return all markers as records, with a single request.
+
+        Returns
+        -------
+        markers : list of MarkerRecord
+            Index, name, position and color of each marker, by position.
+        """
+        return [MarkerRecord(*record) for record in self._get_records()]
@@ -1,6 +1,7 @@
 import reapy
 from reapy import reascript_api as RPR
-from reapy.core import ReapyObject
+from reapy.core import ReapyObject, ReapyObjectList
+from reapy.core.project.snapshot import MarkerRecord
 import typing as ty
 
 
@@ -57,3 +58,69 @@ class Marker(ReapyObject):
             Marker position in seconds.
         """
         ...
+
+
+class MarkerList(ReapyObjectList):
+    """
+    Container for a project's markers.
+
+    Markers are read inside REAPER in a single pass, and cached until
+    the project state change count changes (see
+    ``Project._get_marker_table``).
+
+    Examples
+    --------
+    >>> markers = project.markers
+    >>> len(markers)
+    2
+    >>> markers[0].index
+    1
+    >>> markers.to_records()[0]
+    MarkerRecord(index=1, name='Verse', position=4.0, color=0)
+    """
+
+    _class_name = "MarkerList"
+    parent: reapy.Project
+
+    def __init__(self, parent: reapy.Project) -> None:
+        """
+        Create marker list.
+
+        Parameters
+        ----------
+        parent : Project
+            Parent project.
+        """
+        ...
+
+    @ty.overload
+    def __getitem__(self, key: int) -> Marker:
+        ...
+
+    @ty.overload
+    def __getitem__(self, key: slice) -> ty.List[Marker]:
+        ...
+
+    def __iter__(self) -> ty.Iterator[Marker]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @property
+    def _args(self) -> ty.Tuple[reapy.Project]:
+        ...
+
+    def _get_records(self) -> ty.List[ty.Tuple[ty.Any, ...]]:
+        ...
+
+    def to_records(self) -> ty.List[MarkerRecord]:
+        """
+        Return all markers as records, with a single request.
+
+        Returns
+        -------
+        markers : list of MarkerRecord
+            Index, name, position and color of each marker, by position.
+        """
+        ...
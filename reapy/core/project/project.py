@@ -7,9 +7,16 @@ import os
 import reapy
 from reapy import reascript_api as RPR
 from reapy.core import ReapyObject
+from reapy.core.project import diff as project_diff
+from reapy.core.project import snapshot as project_snapshot
 from reapy.errors import RedoError, UndoError
 
 
+# Marker and region tables by project ID, with the project state change
+# count at which they were read (see ``Project._get_marker_table``).
+_MARKER_TABLES = {}
+
+
 class Project(ReapyObject):
 
     """REAPER project."""
@@ -78,13 +85,94 @@ class Project(ReapyObject):
                     return project
         raise NameError('"{}" is not currently open.'.format(name))
 
+    @classmethod
+    def _get_id_from_pointer(cls, pointer):
+        return '(ReaProject*)0x{0:0{1}X}'.format(int(pointer), 16)
+
     @reapy.inside_reaper()
+    def _get_marker_enum_index(self, index, is_region):
+        """
+        Return enumeration index of a marker or region.
+
+        It is the index expected by ``RPR.EnumProjectMarkers2``, among
+        all markers and regions of the project. It is read from the
+        cached marker table, and checked with a single API call.
+
+        Parameters
+        ----------
+        index : int
+            Marker or region index, as displayed in REAPER.
+        is_region : bool
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        IndexError
+            If no marker or region has this index.
+        """
+        key = "region_indices" if is_region else "marker_indices"
+        enum_index = self._get_marker_table()[key].get(index)
+        if enum_index is not None:
+            args = self.id, enum_index, 0, 0, 0, 0, 0
+            infos = RPR.EnumProjectMarkers2(*args)
+            if bool(infos[3]) == is_region and infos[7] == index:
+                return enum_index
+        # Not all API calls change the project state change count
+        enum_index = self._get_marker_table(refresh=True)[key].get(index)
+        if enum_index is None:
+            raise IndexError("No {} with index {} in {}".format(
+                "region" if is_region else "marker", index, self
+            ))
+        return enum_index
+
+    @reapy.inside_reaper()
+    def _get_marker_table(self, refresh=False):
+        """
+        Return markers and regions of project.
+
+        They are read in a single pass and cached until the project
+        state change count changes. Since the count isn't changed by
+        all API calls, the cached table is also read again when the
+        numbers of markers and regions have changed.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Whether to read markers and regions even if the project
+            state change count hasn't changed (default=False).
+
+        Returns
+        -------
+        table : dict
+            Keys are ``"markers"`` and ``"regions"`` (lists of tuples
+            with the fields of ``MarkerRecord`` and ``RegionRecord``,
+            by position), and ``"marker_indices"`` and
+            ``"region_indices"`` (dicts that map indices to enumeration
+            indices).
+        """
+        count = RPR.GetProjectStateChangeCount(self.id)
+        table_count, table = _MARKER_TABLES.get(self.id, (None, None))
+        if not refresh and table_count == count:
+            _, _, n_markers, n_regions = RPR.CountProjectMarkers(
+                self.id, 0, 0
+            )
+            refresh = (n_markers, n_regions) != (
+                len(table["markers"]), len(table["regions"])
+            )
+        if refresh or table_count != count:
+            table = project_snapshot._read_markers(self.id)
+            _MARKER_TABLES[self.id] = count, table
+        return table
+
     def _get_track_by_name(self, name):
         """Return first track with matching name."""
-        for track in self.tracks:
-            if track.name == name:
-                return track
-        raise KeyError(name)
+        track = self.tracks.by_names([name])[0]
+        if track is None:
+            raise KeyError(name)
+        return track
 
     def add_marker(self, position, name="", color=0):
         """
@@ -332,6 +420,48 @@ class Project(ReapyObject):
         """
         RPR.SetEditCurPos(position, True, True)
 
+    def diff_since(self, token=None, fields=None, fxs=True):
+        """
+        Return tracks, items, takes and envelopes changed since token.
+
+        Objects are compared through signatures computed inside
+        REAPER from their snapshot records (see ``Project.snapshot``)
+        and content hashes (``RPR.MIDI_GetHash`` for MIDI takes,
+        ``RPR.GetAudioAccessorHash`` for audio takes, state chunks for
+        envelopes). When the project state change count did not change
+        since ``token`` was issued, an empty diff is returned after a
+        single cheap API call.
+
+        Parameters
+        ----------
+        token : reapy.core.project.diff.DiffToken, optional
+            Token of a previous diff. When None (default), all objects
+            are returned as changed.
+        fields : dict, optional
+            Info values to read for each record type. See
+            ``Project.snapshot``. They should be the same for all
+            diffs sharing tokens.
+        fxs : bool, optional
+            Whether to read FX names of tracks and takes
+            (default=True).
+
+        Returns
+        -------
+        reapy.core.project.diff.ProjectDiff
+            Changed records, keys of removed objects and a new token.
+            It evaluates to False when nothing changed.
+
+        Examples
+        --------
+        >>> diff = project.diff_since()  # Initial state
+        >>> while True:
+        ...     diff = project.diff_since(diff.token)
+        ...     if diff:
+        ...         update_database(diff)
+        ...     time.sleep(1)
+        """
+        return project_diff.diff_since(self.id, token, fields, fxs)
+
     @reapy.inside_reaper()
     def disarm_rec_on_all_tracks(self):
         """
@@ -679,19 +809,14 @@ class Project(ReapyObject):
         """
         RPR.MarkProjectDirty(self.id)
 
-    @reapy.inside_reaper()
     @property
     def markers(self):
         """
         List of project markers.
 
-        :type: list of reapy.Marker
+        :type: MarkerList
         """
-        ids = [
-            RPR.EnumProjectMarkers2(self.id, i, 0, 0, 0, 0, 0)
-            for i in range(self.n_regions + self.n_markers)
-        ]
-        return [reapy.Marker(self, i[0]) for i in ids if not i[3]]
+        return reapy.MarkerList(self)
 
     @property
     def master_track(self):
@@ -900,19 +1025,14 @@ class Project(ReapyObject):
         if not success:
             raise RedoError
 
-    @reapy.inside_reaper()
     @property
     def regions(self):
         """
         List of project regions.
 
-        :type: list of reapy.Region
+        :type: RegionList
         """
-        ids = [
-            RPR.EnumProjectMarkers2(self.id, i, 0, 0, 0, 0, 0)
-            for i in range(self.n_regions + self.n_markers)
-        ]
-        return [reapy.Region(self, i[0]) for i in ids if i[3]]
+        return reapy.RegionList(self)
 
     def save(self, force_save_as=False):
         """
@@ -1091,6 +1211,51 @@ class Project(ReapyObject):
             raise ValueError(message.format(len(value)))
         RPR.SetProjExtState(self.id, section, key, value)
 
+    def snapshot(self, fields=None, fxs=True):
+        """
+        Return immutable snapshot of project state.
+
+        Tracks, items, takes, FX names, markers and regions are read
+        inside REAPER in a single request, which is much faster than
+        walking ``Project.tracks``, ``Track.items`` and
+        ``Item.takes`` from outside REAPER.
+
+        Parameters
+        ----------
+        fields : dict, optional
+            Info values to read for each record type. Keys are
+            ``"track"``, ``"item"`` and ``"take"``, and values are
+            lists of parameter names of
+            ``RPR.GetMediaTrackInfo_Value``,
+            ``RPR.GetMediaItemInfo_Value`` and
+            ``RPR.GetMediaItemTakeInfo_Value`` respectively. A value
+            of None skips records of that type and their children
+            (e.g. ``{"item": None}`` only reads tracks). Missing keys
+            default to
+            ``reapy.core.project.snapshot.DEFAULT_FIELDS``.
+        fxs : bool, optional
+            Whether to read FX names of tracks and takes
+            (default=True).
+
+        Returns
+        -------
+        reapy.core.project.snapshot.ProjectSnapshot
+            Tree of named tuples. Info values of each record are in
+            its ``infos`` mapping.
+
+        Examples
+        --------
+        >>> snapshot = project.snapshot()
+        >>> track = snapshot.tracks[0]
+        >>> track.name, track.infos["B_MUTE"]
+        ('Drums', 0.0)
+        >>> [item.infos["D_POSITION"] for item in track.items]
+        [0.0, 4.0, 8.0]
+        >>> snapshot = project.snapshot({"track": ["D_VOL"], "item": None})
+        """
+        data = project_snapshot.read(self.id, fields, fxs)
+        return project_snapshot.from_dict(data)
+
     @reapy.inside_reaper()
     def solo_all_tracks(self):
         """
@@ -3,11 +3,15 @@
 import reapy
 from reapy import reascript_api as RPR
 from reapy.core import ReapyObject
+from reapy.core.project import diff as project_diff
+from reapy.core.project import snapshot as project_snapshot
 from reapy.errors import RedoError, UndoError
 import typing as ty
 import typing_extensions as te
 
 
+_MARKER_TABLES: ty.Dict[str, ty.Tuple[int, ty.Dict[str, ty.Any]]]
+
 class Project(ReapyObject):
     """REAPER project."""
     id: str
@@ -61,6 +65,63 @@ class Project(ReapyObject):
         """
         ...
 
+    @classmethod
+    def _get_id_from_pointer(cls, pointer: ty.Union[int, float]) -> str:
+        ...
+
+    def _get_marker_enum_index(
+        self, index: int, is_region: bool
+    ) -> int:
+        """
+        Return enumeration index of a marker or region.
+
+        It is the index expected by ``RPR.EnumProjectMarkers2``, among
+        all markers and regions of the project. It is read from the
+        cached marker table, and checked with a single API call.
+
+        Parameters
+        ----------
+        index : int
+            Marker or region index, as displayed in REAPER.
+        is_region : bool
+
+        Returns
+        -------
+        int
+
+        Raises
+        ------
+        IndexError
+            If no marker or region has this index.
+        """
+        ...
+
+    def _get_marker_table(self, refresh: bool = False) -> ty.Dict[str, ty.Any]:
+        """
+        Return markers and regions of project.
+
+        They are read in a single pass and cached until the project
+        state change count changes. Since the count isn't changed by
+        all API calls, the cached table is also read again when the
+        numbers of markers and regions have changed.
+
+        Parameters
+        ----------
+        refresh : bool, optional
+            Whether to read markers and regions even if the project
+            state change count hasn't changed (default=False).
+
+        Returns
+        -------
+        table : dict
+            Keys are ``"markers"`` and ``"regions"`` (lists of tuples
+            with the fields of ``MarkerRecord`` and ``RegionRecord``,
+            by position), and ``"marker_indices"`` and
+            ``"region_indices"`` (dicts that map indices to enumeration
+            indices).
+        """
+        ...
+
     def _get_track_by_name(self, name: str) -> ty.Optional[reapy.Track]:
         """Return first track with matching name."""
         ...
@@ -279,6 +340,53 @@ class Project(ReapyObject):
         """
         ...
 
+    def diff_since(
+        self,
+        token: ty.Optional[project_diff.DiffToken] = None,
+        fields: ty.Optional[ty.Mapping[str, ty.Iterable[str]]] = None,
+        fxs: bool = True
+    ) -> project_diff.ProjectDiff:
+        """
+        Return tracks, items, takes and envelopes changed since token.
+
+        Objects are compared through signatures computed inside
+        REAPER from their snapshot records (see ``Project.snapshot``)
+        and content hashes (``RPR.MIDI_GetHash`` for MIDI takes,
+        ``RPR.GetAudioAccessorHash`` for audio takes, state chunks for
+        envelopes). When the project state change count did not change
+        since ``token`` was issued, an empty diff is returned after a
+        single cheap API call.
+
+        Parameters
+        ----------
+        token : reapy.core.project.diff.DiffToken, optional
+            Token of a previous diff. When None (default), all objects
+            are returned as changed.
+        fields : dict, optional
+            Info values to read for each record type. See
+            ``Project.snapshot``. They should be the same for all
+            diffs sharing tokens.
+        fxs : bool, optional
+            Whether to read FX names of tracks and takes
+            (default=True).
+
+        Returns
+        -------
+        reapy.core.project.diff.ProjectDiff
+            Changed records, keys of removed objects and a new token.
+            It evaluates to False when nothing changed.
+
+        Examples
+        --------
+        >>> diff = project.diff_since()  # Initial state
+        >>> while True:
+        ...     diff = project.diff_since(diff.token)
+        ...     if diff:
+        ...         update_database(diff)
+        ...     time.sleep(1)
+        """
+        ...
+
     def disarm_rec_on_all_tracks(self) -> None:
         """
         Disarm record on all tracks.
@@ -538,11 +646,11 @@ class Project(ReapyObject):
         ...
 
     @property
-    def markers(self) -> ty.List[reapy.Marker]:
+    def markers(self) -> reapy.MarkerList:
         """
         List of project markers.
 
-        :type: list of reapy.Marker
+        :type: MarkerList
         """
         ...
 
@@ -734,11 +842,11 @@ class Project(ReapyObject):
         ...
 
     @property
-    def regions(self) -> ty.List[reapy.Region]:
+    def regions(self) -> reapy.RegionList:
         """
         List of project regions.
 
-        :type: list of reapy.Region
+        :type: RegionList
         """
         ...
 
@@ -905,6 +1013,56 @@ class Project(ReapyObject):
     def set_ext_state(self, section: str, key: str, value: str,
                       pickled: bool = False) -> int: ...
 
+    def snapshot(
+        self,
+        fields: ty.Optional[
+            ty.Mapping[str, ty.Optional[ty.Iterable[str]]]
+        ] = None,
+        fxs: bool = True
+    ) -> project_snapshot.ProjectSnapshot:
+        """
+        Return immutable snapshot of project state.
+
+        Tracks, items, takes, FX names, markers and regions are read
+        inside REAPER in a single request, which is much faster than
+        walking ``Project.tracks``, ``Track.items`` and
+        ``Item.takes`` from outside REAPER.
+
+        Parameters
+        ----------
+        fields : dict, optional
+            Info values to read for each record type. Keys are
+            ``"track"``, ``"item"`` and ``"take"``, and values are
+            lists of parameter names of
+            ``RPR.GetMediaTrackInfo_Value``,
+            ``RPR.GetMediaItemInfo_Value`` and
+            ``RPR.GetMediaItemTakeInfo_Value`` respectively. A value
+            of None skips records of that type and their children
+            (e.g. ``{"item": None}`` only reads tracks). Missing keys
+            default to
+            ``reapy.core.project.snapshot.DEFAULT_FIELDS``.
+        fxs : bool, optional
+            Whether to read FX names of tracks and takes
+            (default=True).
+
+        Returns
+        -------
+        reapy.core.project.snapshot.ProjectSnapshot
+            Tree of named tuples. Info values of each record are in
+            its ``infos`` mapping.
+
+        Examples
+        --------
+        >>> snapshot = project.snapshot()
+        >>> track = snapshot.tracks[0]
+        >>> track.name, track.infos["B_MUTE"]
+        ('Drums', 0.0)
+        >>> [item.infos["D_POSITION"] for item in track.items]
+        [0.0, 4.0, 8.0]
+        >>> snapshot = project.snapshot({"track": ["D_VOL"], "item": None})
+        """
+        ...
+
     def solo_all_tracks(self) -> None:
         """
         Solo all tracks in project.
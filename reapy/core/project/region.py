@@ -1,6 +1,7 @@
 import reapy
 from reapy import reascript_api as RPR
-from reapy.core import ReapyObject
+from reapy.core import ReapyObject, ReapyObjectList
+from reapy.core.project.snapshot import RegionRecord
 
 
 class Region(ReapyObject):
@@ -25,10 +26,8 @@ class Region(ReapyObject):
         """
         Return region index as needed by RPR.EnumProjectMarkers2.
         """
-        return next(
-            i for i, r in enumerate(reapy.Project(self.project_id).regions)
-            if r.index == self.index
-        )
+        project = reapy.Project(self.project_id)
+        return project._get_marker_enum_index(self.index, True)
 
     @property
     def _kwargs(self):
@@ -180,3 +179,73 @@ class Region(ReapyObject):
         RPR.SetProjectMarker2(
             self.project_id, self.index, 1, start, self.end, ""
         )
+
+
+class RegionList(ReapyObjectList):
+
+    """
+    Container for a project's regions.
+
+    Regions are read inside REAPER in a single pass, and cached until
+    the project state change count changes (see
+    ``Project._get_marker_table``).
+
+    Examples
+    --------
+    >>> regions = project.regions
+    >>> len(regions)
+    2
+    >>> regions[0].index
+    1
+    >>> regions.to_records()[0]
+    RegionRecord(index=1, name='Intro', start=0.0, end=8.0, color=0)
+    """
+
+    _class_name = "RegionList"
+
+    def __init__(self, parent):
+        """
+        Create region list.
+
+        Parameters
+        ----------
+        parent : Project
+            Parent project.
+        """
+        self.parent = parent
+
+    @reapy.inside_reaper()
+    def __getitem__(self, key):
+        records = self._get_records()
+        if isinstance(key, slice):
+            return [Region(self.parent, r[0]) for r in records[key]]
+        return Region(self.parent, records[key][0])
+
+    def __iter__(self):
+        regions = self[:]  # Only cost one distant call
+        for region in regions:
+            yield region
+
+    @reapy.inside_reaper()
+    def __len__(self):
+        # Same table as indexing, so that both always agree
+        return len(self._get_records())
+
+    @property
+    def _args(self):
+        return self.parent,
+
+    @reapy.inside_reaper()
+    def _get_records(self):
+        return self.parent._get_marker_table()["regions"]
+
+    def to_records(self):
+        """
+        Return all regions as records, with a single request.
+
+        Returns
+        -------
+        regions : list of RegionRecord
+            Index, name, start, end and color of each region, by start.
+        """
+        return [RegionRecord(*record) for record in self._get_records()]
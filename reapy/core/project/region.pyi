@@ -1,6 +1,7 @@
 import reapy
 from reapy import reascript_api as RPR
-from reapy.core import ReapyObject
+from reapy.core import ReapyObject, ReapyObjectList
+from reapy.core.project.snapshot import RegionRecord
 import typing as ty
 
 
@@ -149,3 +150,69 @@ class Region(ReapyObject):
             region start in seconds.
         """
         ...
+
+
+class RegionList(ReapyObjectList):
+    """
+    Container for a project's regions.
+
+    Regions are read inside REAPER in a single pass, and cached until
+    the project state change count changes (see
+    ``Project._get_marker_table``).
+
+    Examples
+    --------
+    >>> regions = project.regions
+    >>> len(regions)
+    2
+    >>> regions[0].index
+    1
+    >>> regions.to_records()[0]
+    RegionRecord(index=1, name='Intro', start=0.0, end=8.0, color=0)
+    """
+
+    _class_name = "RegionList"
+    parent: reapy.Project
+
+    def __init__(self, parent: reapy.Project) -> None:
+        """
+        Create region list.
+
+        Parameters
+        ----------
+        parent : Project
+            Parent project.
+        """
+        ...
+
+    @ty.overload
+    def __getitem__(self, key: int) -> Region:
+        ...
+
+    @ty.overload
+    def __getitem__(self, key: slice) -> ty.List[Region]:
+        ...
+
+    def __iter__(self) -> ty.Iterator[Region]:
+        ...
+
+    def __len__(self) -> int:
+        ...
+
+    @property
+    def _args(self) -> ty.Tuple[reapy.Project]:
+        ...
+
+    def _get_records(self) -> ty.List[ty.Tuple[ty.Any, ...]]:
+        ...
+
+    def to_records(self) -> ty.List[RegionRecord]:
+        """
+        Return all regions as records, with a single request.
+
+        Returns
+        -------
+        regions : list of RegionRecord
+            Index, name, start, end and color of each region, by start.
+        """
+        ...
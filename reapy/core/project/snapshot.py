@@ -0,0 +1,332 @@
+"""Immutable snapshots of a project state.
+
+A snapshot is a tree of plain records (named tuples) read inside
+REAPER in a single request. Records hold values, not live reapy
+objects, so reading them never triggers any API call.
+"""
+
+import collections
+import types
+
+import reapy
+from reapy import reascript_api as RPR
+
+
+#: Default info values read for each record type. Keys are record
+#: types and values are parameter names of ``GetMediaTrackInfo_Value``,
+#: ``GetMediaItemInfo_Value`` and ``GetMediaItemTakeInfo_Value``.
+DEFAULT_FIELDS = {
+    "track": ("B_MUTE", "I_SOLO", "D_VOL", "D_PAN", "I_SELECTED"),
+    "item": ("D_POSITION", "D_LENGTH", "B_MUTE", "B_UISEL"),
+    "take": ("D_STARTOFFS", "D_PLAYRATE", "D_VOL"),
+}
+
+
+class ProjectSnapshot(collections.namedtuple(
+    "ProjectSnapshot",
+    ("project_id", "state_change_count", "tracks", "markers", "regions")
+)):
+
+    """
+    Snapshot of a project.
+
+    Attributes
+    ----------
+    project_id : str
+        ReaScript ID of the project.
+    state_change_count : int
+        Value of ``RPR.GetProjectStateChangeCount`` when the snapshot
+        was taken.
+    tracks : tuple of TrackRecord
+    markers : tuple of MarkerRecord
+    regions : tuple of RegionRecord
+    """
+
+    __slots__ = ()
+
+
+class TrackRecord(collections.namedtuple(
+    "TrackRecord",
+    ("id", "index", "guid", "name", "infos", "fxs", "items")
+)):
+
+    """
+    Snapshot of a track.
+
+    Attributes
+    ----------
+    id : str
+        ReaScript ID of the track.
+    index : int
+        Track index in project.
+    guid : str
+    name : str
+    infos : mapping
+        Read-only mapping from parameter names to values of
+        ``RPR.GetMediaTrackInfo_Value``.
+    fxs : tuple of str
+        Names of track FXs.
+    items : tuple of ItemRecord
+    """
+
+    __slots__ = ()
+
+
+class ItemRecord(collections.namedtuple(
+    "ItemRecord", ("id", "index", "guid", "infos", "takes")
+)):
+
+    """
+    Snapshot of an item.
+
+    Attributes
+    ----------
+    id : str
+        ReaScript ID of the item.
+    index : int
+        Item index on its track.
+    guid : str
+    infos : mapping
+        Read-only mapping from parameter names to values of
+        ``RPR.GetMediaItemInfo_Value``.
+    takes : tuple of TakeRecord
+    """
+
+    __slots__ = ()
+
+
+class TakeRecord(collections.namedtuple(
+    "TakeRecord", ("id", "index", "guid", "name", "infos", "fxs")
+)):
+
+    """
+    Snapshot of a take.
+
+    Attributes
+    ----------
+    id : str
+        ReaScript ID of the take.
+    index : int
+        Take index in its item.
+    guid : str
+    name : str
+    infos : mapping
+        Read-only mapping from parameter names to values of
+        ``RPR.GetMediaItemTakeInfo_Value``.
+    fxs : tuple of str
+        Names of take FXs.
+    """
+
+    __slots__ = ()
+
+
+class MarkerRecord(collections.namedtuple(
+    "MarkerRecord", ("index", "name", "position", "color")
+)):
+
+    """Snapshot of a marker. ``position`` is in seconds."""
+
+    __slots__ = ()
+
+
+class RegionRecord(collections.namedtuple(
+    "RegionRecord", ("index", "name", "start", "end", "color")
+)):
+
+    """Snapshot of a region. ``start`` and ``end`` are in seconds."""
+
+    __slots__ = ()
+
+
+def _get_fields(fields):
+    """Return default fields updated with user-specified fields."""
+    result = dict(DEFAULT_FIELDS)
+    if fields is not None:
+        unknown = set(fields) - set(DEFAULT_FIELDS)
+        if unknown:
+            raise ValueError("Unknown record types: {}.".format(
+                ", ".join(sorted(unknown))
+            ))
+        result.update(fields)
+    return result
+
+
+def _read_fx_names(get_name, parent_id, n_fxs):
+    return [get_name(parent_id, i, "", 2048)[3] for i in range(n_fxs)]
+
+
+def _read_infos(get_value, id, fields):
+    return {field: get_value(id, field) for field in fields}
+
+
+def _read_markers(project_id):
+    """
+    Read markers and regions of a project in a single pass.
+
+    Returns a dict with keys ``"markers"`` and ``"regions"`` (lists of
+    tuples with the fields of ``MarkerRecord`` and ``RegionRecord``),
+    and ``"marker_indices"`` and ``"region_indices"`` (dicts that map
+    indices to enumeration indices of ``RPR.EnumProjectMarkers2``).
+    It is also used by ``Project._get_marker_table``.
+    """
+    table = {
+        "markers": [], "regions": [], "marker_indices": {},
+        "region_indices": {}
+    }
+    _, _, n_markers, n_regions = RPR.CountProjectMarkers(project_id, 0, 0)
+    for i in range(n_markers + n_regions):
+        infos = RPR.EnumProjectMarkers3(project_id, i, 0, 0, 0, "", 0, 0)
+        is_region, start, end, name, index, color = infos[3:9]
+        if is_region:
+            table["regions"].append((index, name, start, end, color))
+            table["region_indices"][index] = i
+        else:
+            table["markers"].append((index, name, start, color))
+            table["marker_indices"][index] = i
+    return table
+
+
+def _read_take(take_id, index, fields, fxs):
+    return {
+        "id": take_id,
+        "index": index,
+        "guid": RPR.GetSetMediaItemTakeInfo_String(
+            take_id, "GUID", "stringNeedBig", False
+        )[3],
+        "name": RPR.GetTakeName(take_id),
+        "infos": _read_infos(
+            RPR.GetMediaItemTakeInfo_Value, take_id, fields["take"]
+        ),
+        "fxs": _read_fx_names(
+            RPR.TakeFX_GetFXName, take_id, RPR.TakeFX_GetCount(take_id)
+        ) if fxs else [],
+    }
+
+
+def _read_item(item_id, index, fields, fxs):
+    item = {
+        "id": item_id,
+        "index": index,
+        "guid": RPR.GetSetMediaItemInfo_String(
+            item_id, "GUID", "stringNeedBig", False
+        )[3],
+        "infos": _read_infos(
+            RPR.GetMediaItemInfo_Value, item_id, fields["item"]
+        ),
+        "takes": [],
+    }
+    if fields["take"] is not None:
+        item["takes"] = [
+            _read_take(RPR.GetTake(item_id, i), i, fields, fxs)
+            for i in range(RPR.CountTakes(item_id))
+        ]
+    return item
+
+
+def _read_track(track_id, index, fields, fxs):
+    track = {
+        "id": track_id,
+        "index": index,
+        "guid": RPR.GetTrackGUID(track_id),
+        "name": RPR.GetTrackName(track_id, "", 2048)[2],
+        "infos": _read_infos(
+            RPR.GetMediaTrackInfo_Value, track_id, fields["track"]
+        ),
+        "fxs": _read_fx_names(
+            RPR.TrackFX_GetFXName, track_id, RPR.TrackFX_GetCount(track_id)
+        ) if fxs else [],
+        "items": [],
+    }
+    if fields["item"] is not None:
+        track["items"] = [
+            _read_item(RPR.GetTrackMediaItem(track_id, i), i, fields, fxs)
+            for i in range(RPR.CountTrackMediaItems(track_id))
+        ]
+    return track
+
+
+def _to_item_record(item):
+    return ItemRecord(
+        item["id"], item["index"], item["guid"],
+        types.MappingProxyType(item["infos"]),
+        tuple(map(_to_take_record, item["takes"]))
+    )
+
+
+def _to_take_record(take):
+    return TakeRecord(
+        take["id"], take["index"], take["guid"], take["name"],
+        types.MappingProxyType(take["infos"]), tuple(take["fxs"])
+    )
+
+
+def _to_track_record(track):
+    return TrackRecord(
+        track["id"], track["index"], track["guid"], track["name"],
+        types.MappingProxyType(track["infos"]), tuple(track["fxs"]),
+        tuple(map(_to_item_record, track["items"]))
+    )
+
+
+@reapy.inside_reaper()
+def read(project_id, fields=None, fxs=True):
+    """
+    Read project state as nested dicts.
+
+    Should only be used internally. Use ``Project.snapshot`` instead.
+
+    Parameters
+    ----------
+    project_id : str
+        ReaScript ID of the project.
+    fields : dict, optional
+        See ``Project.snapshot``.
+    fxs : bool, optional
+        Whether to read FX names (default=True).
+
+    Returns
+    -------
+    dict
+        Keys are the fields of ``ProjectSnapshot``.
+    """
+    fields = _get_fields(fields)
+    tracks = []
+    if fields["track"] is not None:
+        tracks = [
+            _read_track(RPR.GetTrack(project_id, i), i, fields, fxs)
+            for i in range(RPR.CountTracks(project_id))
+        ]
+    markers = _read_markers(project_id)
+    return {
+        "project_id": project_id,
+        "state_change_count": RPR.GetProjectStateChangeCount(project_id),
+        "tracks": tracks,
+        "markers": [
+            dict(zip(MarkerRecord._fields, m)) for m in markers["markers"]
+        ],
+        "regions": [
+            dict(zip(RegionRecord._fields, r)) for r in markers["regions"]
+        ],
+    }
+
+
+def from_dict(snapshot):
+    """
+    Build immutable records from the output of ``read``.
+
+    Parameters
+    ----------
+    snapshot : dict
+        Output of ``read``.
+
+    Returns
+    -------
+    ProjectSnapshot
+    """
+    return ProjectSnapshot(
+        snapshot["project_id"],
+        snapshot["state_change_count"],
+        tuple(map(_to_track_record, snapshot["tracks"])),
+        tuple(MarkerRecord(**m) for m in snapshot["markers"]),
+        tuple(RegionRecord(**r) for r in snapshot["regions"]),
+    )
@@ -0,0 +1,199 @@
+"""Immutable snapshots of a project state.
+
+A snapshot is a tree of plain records (named tuples) read inside
+REAPER in a single request. Records hold values, not live reapy
+objects, so reading them never triggers any API call.
+"""
+
+import typing as ty
+
+
+DEFAULT_FIELDS: ty.Dict[str, ty.Tuple[str, ...]]
+FIELDS_T = ty.Optional[ty.Mapping[str, ty.Optional[ty.Iterable[str]]]]
+
+
+class ProjectSnapshot(ty.NamedTuple):
+
+    """
+    Snapshot of a project.
+
+    Attributes
+    ----------
+    project_id : str
+        ReaScript ID of the project.
+    state_change_count : int
+        Value of ``RPR.GetProjectStateChangeCount`` when the snapshot
+        was taken.
+    tracks : tuple of TrackRecord
+    markers : tuple of MarkerRecord
+    regions : tuple of RegionRecord
+    """
+
+    project_id: str
+    state_change_count: int
+    tracks: ty.Tuple[TrackRecord, ...]
+    markers: ty.Tuple[MarkerRecord, ...]
+    regions: ty.Tuple[RegionRecord, ...]
+
+
+class TrackRecord(ty.NamedTuple):
+
+    """
+    Snapshot of a track.
+
+    Attributes
+    ----------
+    id : str
+        ReaScript ID of the track.
+    index : int
+        Track index in project.
+    guid : str
+    name : str
+    infos : mapping
+        Read-only mapping from parameter names to values of
+        ``RPR.GetMediaTrackInfo_Value``.
+    fxs : tuple of str
+        Names of track FXs.
+    items : tuple of ItemRecord
+    """
+
+    id: str
+    index: int
+    guid: str
+    name: str
+    infos: ty.Mapping[str, float]
+    fxs: ty.Tuple[str, ...]
+    items: ty.Tuple[ItemRecord, ...]
+
+
+class ItemRecord(ty.NamedTuple):
+
+    """
+    Snapshot of an item.
+
+    Attributes
+    ----------
+    id : str
+        ReaScript ID of the item.
+    index : int
+        Item index on its track.
+    guid : str
+    infos : mapping
+        Read-only mapping from parameter names to values of
+        ``RPR.GetMediaItemInfo_Value``.
+    takes : tuple of TakeRecord
+    """
+
+    id: str
+    index: int
+    guid: str
+    infos: ty.Mapping[str, float]
+    takes: ty.Tuple[TakeRecord, ...]
+
+
+class TakeRecord(ty.NamedTuple):
+
+    """
+    Snapshot of a take.
+
+    Attributes
+    ----------
+    id : str
+        ReaScript ID of the take.
+    index : int
+        Take index in its item.
+    guid : str
+    name : str
+    infos : mapping
+        Read-only mapping from parameter names to values of
+        ``RPR.GetMediaItemTakeInfo_Value``.
+    fxs : tuple of str
+        Names of take FXs.
+    """
+
+    id: str
+    index: int
+    guid: str
+    name: str
+    infos: ty.Mapping[str, float]
+    fxs: ty.Tuple[str, ...]
+
+
+class MarkerRecord(ty.NamedTuple):
+
+    """Snapshot of a marker. ``position`` is in seconds."""
+
+    index: int
+    name: str
+    position: float
+    color: int
+
+
+class RegionRecord(ty.NamedTuple):
+
+    """Snapshot of a region. ``start`` and ``end`` are in seconds."""
+
+    index: int
+    name: str
+    start: float
+    end: float
+    color: int
+
+
+def _get_fields(
+    fields: FIELDS_T
+) -> ty.Dict[str, ty.Optional[ty.Iterable[str]]]:
+    """Return default fields updated with user-specified fields."""
+    ...
+
+
+def _to_item_record(item: ty.Mapping[str, ty.Any]) -> ItemRecord:
+    ...
+
+
+def _to_take_record(take: ty.Mapping[str, ty.Any]) -> TakeRecord:
+    ...
+
+
+def _to_track_record(track: ty.Mapping[str, ty.Any]) -> TrackRecord:
+    ...
+
+
+def read(project_id: str, fields: FIELDS_T = None,
+         fxs: bool = True) -> ty.Dict[str, ty.Any]:
+    """
+    Read project state as nested dicts.
+
+    Should only be used internally. Use ``Project.snapshot`` instead.
+
+    Parameters
+    ----------
+    project_id : str
+        ReaScript ID of the project.
+    fields : dict, optional
+        See ``Project.snapshot``.
+    fxs : bool, optional
+        Whether to read FX names (default=True).
+
+    Returns
+    -------
+    dict
+        Keys are the fields of ``ProjectSnapshot``.
+    """
+    ...
+
+
+def from_dict(snapshot: ty.Mapping[str, ty.Any]) -> ProjectSnapshot:
+    """
+    Build immutable records from the output of ``read``.
+
+    Parameters
+    ----------
+    snapshot : dict
+        Output of ``read``.
+
+    Returns
+    -------
+    ProjectSnapshot
+    """
+    ...
@@ -4,6 +4,12 @@ from reapy.core import ReapyObject, ReapyObjectList
 from reapy.errors import InvalidObjectError, UndefinedEnvelopeError
 
 
+# Track indexes by project ID and key, with the project state change
+# count at which they were built and the values that matched no track
+# (see ``TrackList._get_track_ids``).
+_TRACK_INDEXES = {}
+
+
 class Track(ReapyObject):
 
     """
@@ -76,8 +82,13 @@ class Track(ReapyObject):
         Should only be used internally; one should directly access
         Track.project instead of calling this method.
         """
+        pointer = RPR.GetMediaTrackInfo_Value(self.id, "P_PROJECT")
+        if pointer:
+            return reapy.Project(reapy.Project._get_id_from_pointer(pointer))
+        # P_PROJECT is not available in older REAPER versions
+        pointer, name = self._get_pointer_and_name()
         for project in reapy.get_projects():
-            if self.id in [t.id for t in project.tracks]:
+            if RPR.ValidatePtr2(project.id, pointer, name):
                 return project
 
     def add_audio_accessor(self):
@@ -673,6 +684,11 @@ class TrackList(ReapyObjectList):
     'Snare'
     'Hi-hat'
     'Cymbal"
+
+    Looking tracks up by name or GUID doesn't read all track names
+    each time:
+
+    >>> kick, snare = tracks.by_names(["Kick", "Snare"])
     """
 
     def __init__(self, parent):
@@ -709,7 +725,106 @@ class TrackList(ReapyObjectList):
     def _args(self):
         return self.parent,
 
+    def _build_index(self, key):
+        """Return track IDs by name or by GUID, read in one pass."""
+        index = {}
+        for track in self:
+            index.setdefault(getattr(track, key), track.id)
+        return index
+
     @reapy.inside_reaper()
     def _get_items_from_slice(self, slice):
         indices = range(*slice.indices(len(self)))
         return [self[i] for i in indices]
+
+    @reapy.inside_reaper()
+    def _get_track_ids(self, key, values):
+        """
+        Return IDs of tracks from their names or GUIDs.
+
+        Tracks are looked up in an index of ``key`` values that is
+        cached until the project state change count changes. Since
+        the count isn't changed by all API calls, matches are checked
+        and the index is rebuilt once when some are stale. Values that
+        matched no track are remembered until the count changes, so
+        that looking them up again doesn't rebuild the index.
+
+        Parameters
+        ----------
+        key : {"name", "GUID"}
+        values : list of str
+
+        Returns
+        -------
+        ids : list of str or None
+            ReaScript IDs (None for values that match no track).
+        """
+        project_id = self.parent.id
+        count = RPR.GetProjectStateChangeCount(project_id)
+        cache = _TRACK_INDEXES.get((project_id, key))
+        if cache is not None and cache[0] == count:
+            _, index, misses = cache
+            ids = [index.get(value) for value in values]
+            if all(
+                value in misses if id is None
+                else self._is_indexed(id, key, value)
+                for id, value in zip(ids, values)
+            ):
+                return ids
+        index = self._build_index(key)
+        ids = [index.get(value) for value in values]
+        misses = {value for id, value in zip(ids, values) if id is None}
+        _TRACK_INDEXES[project_id, key] = count, index, misses
+        return ids
+
+    def _is_indexed(self, id, key, value):
+        """Whether a cached track ID still matches a name or GUID."""
+        track = Track(id)
+        pointer, name = track._get_pointer_and_name()
+        if not RPR.ValidatePtr2(self.parent.id, pointer, name):
+            return False
+        return getattr(track, key) == value
+
+    @reapy.inside_reaper()
+    def by_guids(self, guids):
+        """
+        Return tracks from their GUIDs.
+
+        Parameters
+        ----------
+        guids : list of str
+            Track GUIDs.
+
+        Returns
+        -------
+        tracks : list of Track or None
+            Tracks in the same order as ``guids``, with None for GUIDs
+            that match no track of the project.
+        """
+        ids = self._get_track_ids("GUID", list(guids))
+        return [None if id is None else Track(id) for id in ids]
+
+    @reapy.inside_reaper()
+    def by_names(self, names):
+        """
+        Return tracks from their names.
+
+        Parameters
+        ----------
+        names : list of str
+            Track names. When several tracks have the same name, the
+            first one is returned.
+
+        Returns
+        -------
+        tracks : list of Track or None
+            Tracks in the same order as ``names``, with None for names
+            that match no track of the project.
+
+        Examples
+        --------
+        >>> project.tracks.by_names(["Kick", "Snare", "Theremin"])
+        [Track("(MediaTrack*)0x..."), Track("(MediaTrack*)0x..."), None]
+        """
+        ids = self._get_track_ids("name", list(names))
+        return [None if id is None else Track(id) for id in ids]
@@ -5,6 +5,11 @@ from reapy.errors import UndefinedEnvelopeError
 import typing as ty
 
 
+_TRACK_INDEXES: ty.Dict[
+    ty.Tuple[str, str], ty.Tuple[int, ty.Dict[str, str], ty.Set[str]]
+]
+
+
 class Track(ReapyObject):
     """
     REAPER Track.
@@ -572,6 +577,11 @@ class TrackList(ReapyObjectList):
     'Snare'
     'Hi-hat'
     'Cymbal"
+
+    Looking tracks up by name or GUID doesn't read all track names
+    each time:
+
+    >>> kick, snare = tracks.by_names(["Kick", "Snare"])
     """
     parent: reapy.Project
 
@@ -611,5 +621,82 @@ class TrackList(ReapyObjectList):
     def _args(self) -> ty.Tuple[reapy.Project]:
         ...
 
+    def _build_index(self, key: str) -> ty.Dict[str, str]:
+        """Return track IDs by name or by GUID, read in one pass."""
+        ...
+
     def _get_items_from_slice(self, slice: slice) -> ty.List[Track]:
         ...
+
+    def _get_track_ids(
+        self, key: str, values: ty.List[str]
+    ) -> ty.List[ty.Optional[str]]:
+        """
+        Return IDs of tracks from their names or GUIDs.
+
+        Tracks are looked up in an index of ``key`` values that is
+        cached until the project state change count changes. Since
+        the count isn't changed by all API calls, matches are checked
+        and the index is rebuilt once when some are stale. Values that
+        matched no track are remembered until the count changes, so
+        that looking them up again doesn't rebuild the index.
+
+        Parameters
+        ----------
+        key : {"name", "GUID"}
+        values : list of str
+
+        Returns
+        -------
+        ids : list of str or None
+            ReaScript IDs (None for values that match no track).
+        """
+        ...
+
+    def _is_indexed(self, id: str, key: str, value: str) -> bool:
+        """Whether a cached track ID still matches a name or GUID."""
+        ...
+
+    def by_guids(
+        self, guids: ty.Iterable[str]
+    ) -> ty.List[ty.Optional[Track]]:
+        """
+        Return tracks from their GUIDs.
+
+        Parameters
+        ----------
+        guids : list of str
+            Track GUIDs.
+
+        Returns
+        -------
+        tracks : list of Track or None
+            Tracks in the same order as ``guids``, with None for GUIDs
+            that match no track of the project.
+        """
+        ...
+
+    def by_names(
+        self, names: ty.Iterable[str]
+    ) -> ty.List[ty.Optional[Track]]:
+        """
+        Return tracks from their names.
+
+        Parameters
+        ----------
+        names : list of str
+            Track names. When several tracks have the same name, the
+            first one is returned.
+
+        Returns
+        -------
+        tracks : list of Track or None
+            Tracks in the same order as ``names``, with None for names
+            that match no track of the project.
+
+        Examples
+        --------
+        >>> project.tracks.by_names(["Kick", "Snare", "Theremin"])
+        [Track("(MediaTrack*)0x..."), Track("(MediaTrack*)0x..."), None]
+        """
+        ...
@@ -1,8 +1,12 @@
 import reapy
 from reapy.tools import json
+from reapy.tools.network import machines
 
+import hashlib
 import os
+import re
 import sys
+import weakref
 
 
 @reapy.inside_reaper()
@@ -10,10 +14,26 @@ def _get_api_names():
     return __all__
 
 
+def _get_api_key():
+    """
+    Return key of API names.
+
+    It is made of REAPER version, installed extensions and a hash of
+    names, and is sent to clients in the server handshake. Only
+    works from inside REAPER.
+    """
+    digest = hashlib.blake2b(
+        " ".join(sorted(__all__)).encode(), digest_size=8
+    ).hexdigest()
+    key = "-".join([_RPR.RPR_GetAppVersion()] + _EXTENSIONS + [digest])
+    return re.sub(r"[^\w.-]", "_", key)
+
+
 if reapy.is_inside_reaper():
     # Import functions without the useless starting "RPR_".
     import reaper_python as _RPR
     __all__ = [s[4:] for s in _RPR.__dict__ if s.startswith("RPR_")]
+    _EXTENSIONS = []
     for s in __all__:
         exec("{} = _RPR.__dict__['{}']".format(s, "RPR_" + s))
 
@@ -29,14 +49,94 @@ if reapy.is_inside_reaper():
         __all__ += list(sws_functions)
         for s in sws_functions:
             exec("from sws_python import {}".format(s))
+        _EXTENSIONS.append("SWS")
     except ImportError:  # SWS is not installed
         pass
 else:
-    if reapy.dist_api_is_enabled():
-        __all__ = _get_api_names()
-        func_def = (
-            "@reapy.inside_reaper()\n"
-            "def {name}(*args): return (name)(*args)"
+    # When a slave machine gets selected from inside REAPER, the module
+    # is reloaded: local functions are removed so that API names are
+    # resolved on the slave machine.
+    for _name in globals().pop("__all__", ()):
+        globals().pop(_name, None)
+
+    #: API names of machines, by client pool.
+    _NAMESPACES = weakref.WeakKeyDictionary()
+    #: Functions that run on the selected machine, by API name. They
+    #: are created on first access and shared by all machines.
+    _STUBS = {}
+
+    def _get_cache_directory():
+        directory = reapy.config.CACHE_DIRECTORY
+        if directory is not None:
+            return os.path.join(directory, "api_names")
+
+    def _get_stub(name):
+        """Return dist API function, shared by all machines."""
+        try:
+            return _STUBS[name]
+        except KeyError:
+            pass
+
+        def stub(*args):
+            pass
+        stub.__name__ = stub.__qualname__ = name
+        stub = _STUBS[name] = reapy.inside_reaper()(stub)
+        return stub
+
+    def _get_namespace():
+        """
+        Return API names of the selected machine.
+
+        They are read on first use and cached, so that switching
+        machines doesn't require any request.
+        """
+        client_pool = machines.get_selected_pool()
+        if client_pool is None:
+            return frozenset()
+        try:
+            return _NAMESPACES[client_pool]
+        except KeyError:
+            pass
+        namespace = _NAMESPACES[client_pool] = frozenset(_read_api_names())
+        return namespace
+
+    def _read_api_names():
+        """
+        Read API names of the selected machine.
+
+        Name lists are cached on disk, keyed by REAPER version and
+        installed extensions (see ``_get_api_key``). The key is part
+        of the server handshake, so that cached names are read without
+        any request.
+        """
+        directory = _get_cache_directory()
+        key = machines.get_selected_pool().handshake.get("api_key")
+        if directory is None or key is None:
+            return _get_api_names()
+        path = os.path.join(directory, key + ".json")
+        try:
+            with open(path) as f:
+                return json.loads(f.read())
+        except (OSError, ValueError):
+            names = _get_api_names()
+        try:
+            os.makedirs(directory, exist_ok=True)
+            temp_path = "{}.{}.tmp".format(path, os.getpid())
+            with open(temp_path, "w") as f:
+                f.write(json.dumps(names))
+            os.replace(temp_path, path)
+        except OSError:
+            pass
+        return names
+
+    def __dir__():
+        return sorted(set(globals()) | _get_namespace())
+
+    def __getattr__(name):
+        if name == "__all__":
+            return sorted(_get_namespace())
+        if not name.startswith("__") and name in _get_namespace():
+            return _get_stub(name)
+        raise AttributeError(
+            "module '{}' has no attribute '{}'".format(__name__, name)
         )
-        exec("\n".join(func_def.format(name=name) for name in __all__))
-        del func_def
@@ -1,8 +1,13 @@
 import reapy
 from reapy.tools import json
+from reapy.tools.network import machines
 
+import hashlib
+import os
+import re
 import sys
 import typing as ty
+import weakref
 
 __all__: ty.List[str] = []
 
@@ -10,3 +15,58 @@ __all__: ty.List[str] = []
 @reapy.inside_reaper()
 def _get_api_names() -> ty.List[str]:
     ...
+
+
+def _get_api_key() -> str:
+    """
+    Return key of API names.
+
+    It is made of REAPER version, installed extensions and a hash of
+    names, and is sent to clients in the server handshake. Only
+    works from inside REAPER.
+    """
+    ...
+
+
+_EXTENSIONS: ty.List[str]
+_NAMESPACES: weakref.WeakKeyDictionary
+_STUBS: ty.Dict[str, ty.Callable[..., ty.Any]]
+
+
+def _get_cache_directory() -> ty.Optional[str]:
+    ...
+
+
+def _get_stub(name: str) -> ty.Callable[..., ty.Any]:
+    """Return dist API function, shared by all machines."""
+    ...
+
+
+def _get_namespace() -> ty.FrozenSet[str]:
+    """
+    Return API names of the selected machine.
+
+    They are read on first use and cached, so that switching
+    machines doesn't require any request.
+    """
+    ...
+
+
+def _read_api_names() -> ty.List[str]:
+    """
+    Read API names of the selected machine.
+
+    Name lists are cached on disk, keyed by REAPER version and
+    installed extensions (see ``_get_api_key``). The key is part
+    of the server handshake, so that cached names are read without
+    any request.
+    """
+    ...
+
+
+def __dir__() -> ty.List[str]:
+    ...
+
+
+def __getattr__(name: str) -> ty.Any:
+    ...
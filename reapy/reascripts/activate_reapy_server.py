@@ -22,12 +22,8 @@ from reapy.tools.network import Server
 
 
 def run_main_loop():
-    # Get new connections
-    SERVER.accept()
-    # Process API call requests
-    requests = SERVER.get_requests()
-    results = SERVER.process_requests(requests)
-    SERVER.send_results(results)
+    # Get new connections and process API call requests
+    SERVER.run_tick()
     # Run main_loop again
     reapy.defer(run_main_loop)
 
@@ -0,0 +1,20 @@
+"""
+Tools to use ``reapy`` without REAPER.
+
+``FakeReaper`` is an in-memory implementation of the ReaScript API
+(tracks, items, takes, MIDI, FX parameters, envelopes, markers and
+ext states). ``FakeReaperServer`` hosts the real ``reapy`` server on
+it in a subprocess, so that the dist API can be exercised end to end
+over loopback, e.g. in tests or benchmarks.
+
+Examples
+--------
+>>> from reapy.testing import FakeReaperServer
+>>> with FakeReaperServer():
+...     track = reapy.Project().add_track(name="Drums")
+...     track.add_fx("ReaEQ").params[0]
+0.17
+"""
+
+from .fake_reaper import FakeReaper
+from .fake_server import FakeReaperServer
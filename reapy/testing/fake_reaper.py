@@ -0,0 +1,2266 @@
+"""
+In-memory stand-in for REAPER's ``reaper_python`` module.
+
+``FakeReaper`` implements the part of the ReaScript API used by
+``reapy.core``: projects, tracks, items, takes, MIDI events, FX
+parameters, envelopes, markers and regions, and ext states. Functions
+that ``reapy.additional_api`` calls through ``ctypes`` are exposed as
+C callbacks in ``_ft``, like in REAPER.
+
+``reapy`` selects its mode when it is imported, so this module doesn't
+import ``reapy``: it can be loaded (e.g. by path) and installed with
+``FakeReaper.install`` before ``reapy`` is imported. Running it as a
+script hosts a real ``reapy`` server on a fake REAPER, and prints
+the server port on the first line of stdout::
+
+    python fake_reaper.py [OPTIONS]
+
+where ``OPTIONS`` is a JSON object of keyword arguments of
+``FakeReaper.serve`` and ``FakeReaper``. See
+``reapy.testing.FakeReaperServer``.
+"""
+
+import bisect
+import ctypes as ct
+import hashlib
+import json
+import os
+import struct
+import sys
+import time
+import types
+
+
+#: Version returned by ``GetAppVersion``.
+DEFAULT_VERSION = "7.0/reapy-fake"
+#: MIDI ticks per quarter note.
+PPQ = 960
+#: Parameters of FX known by the fake, by FX name. Each parameter is
+#: a tuple ``(name, default_value, min_value, max_value)``.
+#: ``"Bypass"``, ``"Wet"`` and ``"Delta"`` are added to all FX, like
+#: in REAPER.
+FX_PARAMETERS = {
+    "VST: ReaComp (Cockos)": (
+        ("Thresh", 1.0, 0.0, 1.0), ("Ratio", 0.0, 0.0, 1.0),
+        ("Attack", 0.003, 0.0, 0.5), ("Release", 0.1, 0.0, 5.0),
+    ),
+    "VST: ReaEQ (Cockos)": (
+        ("Freq-Low Shelf", 0.17, 0.0, 1.0), ("Gain-Low Shelf", 0.5, 0.0, 1.0),
+        ("Freq-High Shelf", 0.83, 0.0, 1.0),
+        ("Gain-High Shelf", 0.5, 0.0, 1.0),
+    ),
+    "VST: ReaGain (Cockos)": (("Gain", 0.5, 0.0, 1.0),),
+    "VSTi: ReaSynth (Cockos)": (
+        ("Volume", 0.5, 0.0, 1.0), ("Attack", 0.0, 0.0, 1.0),
+        ("Decay", 0.0, 0.0, 1.0), ("Sustain", 1.0, 0.0, 1.0),
+    ),
+}
+_COMMON_FX_PARAMETERS = (
+    ("Bypass", 0.0, 0.0, 1.0), ("Wet", 1.0, 0.0, 1.0),
+    ("Delta", 0.0, 0.0, 1.0),
+)
+_END_OF_SOURCE = b"\xb0\x7b\x00"
+_MIDI_HEADER = struct.Struct("<iBi")
+
+
+class _Object:
+
+    """Object with a ReaScript pointer."""
+
+    pointer_type = "void*"
+
+    def __init__(self):
+        self.address = 0
+
+    @property
+    def id(self):
+        return "({}){}".format(self.pointer_type, "0x{:016X}".format(
+            self.address
+        ))
+
+
+class _AudioAccessor(_Object):
+
+    pointer_type = "AudioAccessor*"
+
+    def __init__(self, parent):
+        super().__init__()
+        self.parent = parent
+
+
+class _Envelope(_Object):
+
+    pointer_type = "TrackEnvelope*"
+
+    def __init__(self, parent, name, default_value=0.):
+        super().__init__()
+        self.parent = parent
+        self.name = name
+        self.default_value = default_value
+        self.points = []  # [time, value, shape, tension, selected]
+
+    def evaluate(self, position):
+        if not self.points:
+            return self.default_value
+        times = [p[0] for p in self.points]
+        i = bisect.bisect_right(times, position)
+        if i == 0:
+            return self.points[0][1]
+        if i == len(self.points):
+            return self.points[-1][1]
+        (t0, v0), (t1, v1) = self.points[i - 1][:2], self.points[i][:2]
+        if self.points[i - 1][2] == 1 or t1 == t0:  # Square shape
+            return v0
+        return v0 + (v1 - v0) * (position - t0) / (t1 - t0)
+
+    def sort(self):
+        self.points.sort(key=lambda p: p[0])
+
+
+class _FX:
+
+    def __init__(self, name, parameters):
+        self.name = name
+        self.parameters = [list(p) for p in parameters]
+        self.is_enabled = True
+        self.is_offline = False
+        self.envelopes = {}
+
+
+class _Item(_Object):
+
+    pointer_type = "MediaItem*"
+
+    def __init__(self, track):
+        super().__init__()
+        self.track = track
+        self.takes = []
+        self.active_take = None
+        self.notes = ""
+        self.infos = {
+            "B_MUTE": 0., "B_LOOPSRC": 1., "B_UISEL": 0., "C_LOCK": 0.,
+            "D_VOL": 1., "D_POSITION": 0., "D_LENGTH": 0.,
+            "D_SNAPOFFSET": 0., "D_FADEINLEN": 0., "D_FADEOUTLEN": 0.,
+            "I_GROUPID": 0., "I_CUSTOMCOLOR": 0.,
+        }
+
+    @property
+    def end(self):
+        return self.infos["D_POSITION"] + self.infos["D_LENGTH"]
+
+    @property
+    def position(self):
+        return self.infos["D_POSITION"]
+
+
+class _Marker:
+
+    def __init__(self, is_region, position, end, name, number, color):
+        self.is_region = is_region
+        self.position = position
+        self.end = end if is_region else position
+        self.name = name
+        self.number = number
+        self.color = color
+
+
+class _Project(_Object):
+
+    pointer_type = "ReaProject*"
+
+    def __init__(self, name=""):
+        super().__init__()
+        self.name = name
+        self.path = ""
+        self.tracks = []
+        self.master_track = None
+        self.markers = []
+        self.render_matrix = {}
+        self.ext_state = {}
+        self.state_change_count = 0
+        self.is_dirty = False
+        self.bpm = 120.
+        self.bpi = 4
+        self.cursor_position = 0.
+        self.play_state = 0
+        self.play_rate = 1.
+        self.infos = {}
+        self.string_infos = {}
+
+
+class _Source(_Object):
+
+    pointer_type = "PCM_source*"
+
+    def __init__(self, type, take):
+        super().__init__()
+        self.type = type
+        self.take = take
+
+
+class _Take(_Object):
+
+    pointer_type = "MediaItem_Take*"
+
+    def __init__(self, item, name="", is_midi=False):
+        super().__init__()
+        self.item = item
+        self.name = name
+        self.is_midi = is_midi
+        self.events = []  # [ppq, flags, msg] sorted by ppq
+        self.fxs = []
+        self.envelopes = []
+        self.source = None
+        self.infos = {
+            "D_STARTOFFS": 0., "D_VOL": 1., "D_PAN": 0., "D_PANLAW": -1.,
+            "D_PLAYRATE": 1., "D_PITCH": 0., "B_PPITCH": 1.,
+            "I_CHANMODE": 0., "I_PITCHMODE": -1., "I_CUSTOMCOLOR": 0.,
+        }
+        self._buffer = None
+        self._event_indices = None
+
+    def changed(self):
+        """Invalidate data derived from events."""
+        self._buffer = None
+        self._event_indices = None
+
+    def get_buffer(self):
+        """Return packed MIDI buffer, as ``MIDI_GetAllEvts``."""
+        if self._buffer is None:
+            chunks, last_ppq = [], 0
+            for ppq, flags, msg in self.events:
+                ppq = int(round(ppq))
+                chunks.append(
+                    _MIDI_HEADER.pack(ppq - last_ppq, flags, len(msg))
+                )
+                chunks.append(msg)
+                last_ppq = ppq
+            end_ppq = max(last_ppq, int(round(self.get_length_ppq())))
+            chunks.append(_MIDI_HEADER.pack(
+                end_ppq - last_ppq, 0, len(_END_OF_SOURCE)
+            ))
+            chunks.append(_END_OF_SOURCE)
+            self._buffer = b"".join(chunks)
+        return self._buffer
+
+    def get_event_indices(self):
+        """
+        Return indices of notes, CCs and text/SysEx events in events.
+
+        Notes are ``(note_on_index, note_off_index)`` pairs.
+        """
+        if self._event_indices is None:
+            self.events.sort(key=lambda e: e[0])
+            notes, ccs, texts, pending = [], [], [], {}
+            for i, (_, _, msg) in enumerate(self.events):
+                status = msg[0] & 0xf0 if msg else 0
+                if msg and msg[0] in (0xf0, 0xff):
+                    texts.append(i)
+                elif status == 0x90 and msg[2]:
+                    pending.setdefault((msg[0] & 0xf, msg[1]), []).append(
+                        len(notes)
+                    )
+                    notes.append([i, None])
+                elif status in (0x80, 0x90):
+                    on = pending.get((msg[0] & 0xf, msg[1]))
+                    if on:
+                        notes[on.pop(0)][1] = i
+                elif status in (0xa0, 0xb0, 0xc0, 0xd0, 0xe0):
+                    ccs.append(i)
+            notes = [tuple(n) for n in notes if n[1] is not None]
+            self._event_indices = notes, ccs, texts
+        return self._event_indices
+
+    def get_length_ppq(self):
+        item = self.item
+        qn_start = item.position * item.track.project.bpm / 60
+        qn_end = item.end * item.track.project.bpm / 60
+        return (qn_end - qn_start) * PPQ
+
+
+class _Track(_Object):
+
+    pointer_type = "MediaTrack*"
+
+    def __init__(self, project, is_master=False):
+        super().__init__()
+        self.project = project
+        self.is_master = is_master
+        self.name = ""
+        self.items = []
+        self.fxs = []
+        self.envelopes = []
+        self.is_selected = False
+        self.string_infos = {}
+        self.infos = {
+            "B_MUTE": 0., "B_PHASE": 0., "I_SOLO": 0., "I_FXEN": 1.,
+            "I_RECARM": 0., "I_RECINPUT": 0., "I_RECMODE": 0.,
+            "I_RECMON": 0., "I_AUTOMODE": 0., "I_NCHAN": 2.,
+            "I_FOLDERDEPTH": 0., "I_CUSTOMCOLOR": 0., "D_VOL": 1.,
+            "D_PAN": 0., "D_WIDTH": 1., "B_SHOWINMIXER": 1.,
+            "B_SHOWINTCP": 1., "B_MAINSEND": 1.,
+        }
+
+
+class FakeReaper:
+
+    """
+    In-memory REAPER, exposed as a fake ``reaper_python`` module.
+
+    It starts with a single empty project. API functions are methods
+    named after the ReaScript API (e.g. ``FakeReaper.CountTracks``);
+    ``FX_*`` methods are exposed both as ``TrackFX_*`` and
+    ``TakeFX_*``. Objects are identified by ReaScript IDs such as
+    ``"(MediaTrack*)0x0000000000010008"``, and an unknown or deleted
+    ID raises ``ValueError``.
+
+    Tempo is constant for each project, and audio accessors return
+    silence.
+
+    Parameters
+    ----------
+    version : str, optional
+        Version returned by ``GetAppVersion``.
+    fx_parameters : dict, optional
+        Additional FX that can be added by name, with their
+        parameters (see ``FX_PARAMETERS``).
+
+    Examples
+    --------
+    From a process where ``reapy`` hasn't been imported yet:
+
+    >>> FakeReaper().install()
+    >>> import reapy
+    >>> reapy.Project().add_track(name="Drums")
+    Track("(MediaTrack*)0x0000000000010010")
+    """
+
+    def __init__(self, version=DEFAULT_VERSION, fx_parameters=None):
+        self.version = version
+        self.fx_parameters = dict(FX_PARAMETERS, **(fx_parameters or {}))
+        self.ext_state = {}
+        self.console = []
+        self._objects = {}
+        self._next_address = 0x10000
+        self._deferred = []
+        self._at_exit = []
+        self.projects = [self._new_project()]
+        self.current_project = self.projects[0]
+
+    def _add_marker(self, project, marker):
+        """Insert marker in position order."""
+        keys = [(m.position, m.is_region) for m in project.markers]
+        i = bisect.bisect_right(keys, (marker.position, marker.is_region))
+        project.markers.insert(i, marker)
+        self._touch(project)
+
+    def _at_exit_code(self, code):
+        self._at_exit.append(code)
+
+    def _defer(self, code):
+        self._deferred.append(code)
+
+    def _find_marker(self, project, number, is_region):
+        for marker in project.markers:
+            is_same_type = marker.is_region == bool(is_region)
+            if marker.number == number and is_same_type:
+                return marker
+
+    def _get(self, id, cls=_Object):
+        """Return object from its ReaScript ID or address."""
+        if isinstance(id, str):
+            address = int(id[id.rfind("0x"):], 16) if "0x" in id else 0
+        else:
+            address = int(id or 0)
+        obj = self._objects.get(address)
+        if not isinstance(obj, cls):
+            raise ValueError("Invalid {}: {}".format(cls.pointer_type, id))
+        return obj
+
+    def _get_fx_parent(self, id):
+        parent = self._get(id)
+        if not isinstance(parent, (_Track, _Take)):
+            raise ValueError("Invalid FX parent: {}".format(id))
+        return parent
+
+    def _get_project(self, id):
+        """Return project from its ID (0, None or null is current)."""
+        if not id or isinstance(id, str) and id.endswith("0x" + "0" * 16):
+            return self.current_project
+        return self._get(id, _Project)
+
+    def _get_track_items(self, project):
+        return [item for track in project.tracks for item in track.items]
+
+    def _new(self, obj):
+        """Register object and give it an address."""
+        obj.address = self._next_address
+        self._next_address += 8
+        self._objects[obj.address] = obj
+        return obj
+
+    def _new_item(self, track, position=0., length=0.):
+        item = self._new(_Item(track))
+        item.infos["D_POSITION"], item.infos["D_LENGTH"] = position, length
+        track.items.append(item)
+        self._sort_items(track)
+        return item
+
+    def _new_project(self):
+        project = self._new(_Project())
+        project.master_track = self._new(_Track(project, is_master=True))
+        return project
+
+    def _new_take(self, item, is_midi=False):
+        take = self._new(_Take(item, is_midi=is_midi))
+        if is_midi:
+            take.source = self._new(_Source("MIDI", take))
+        item.takes.append(take)
+        if item.active_take is None:
+            item.active_take = take
+        return take
+
+    def _null(self, cls):
+        return "({})0x0000000000000000".format(cls.pointer_type)
+
+    def _remove(self, obj):
+        """Unregister object and its children."""
+        self._objects.pop(obj.address, None)
+        for attribute in ("items", "takes", "envelopes"):
+            for child in getattr(obj, attribute, ()):
+                self._remove(child)
+        for fx in getattr(obj, "fxs", ()):
+            for envelope in fx.envelopes.values():
+                self._remove(envelope)
+        if getattr(obj, "source", None) is not None:
+            self._remove(obj.source)
+
+    def _sort_items(self, track):
+        track.items.sort(key=lambda item: item.position)
+
+    def _to_ppq(self, take, position):
+        item = take.item
+        bpm = item.track.project.bpm
+        return (position - item.position) * bpm / 60 * PPQ
+
+    def _to_time(self, take, ppq):
+        item = take.item
+        return item.position + ppq / PPQ * 60 / item.track.project.bpm
+
+    def _touch(self, obj):
+        """Mark project of object as changed."""
+        while not isinstance(obj, _Project):
+            if isinstance(obj, _Track):
+                obj = obj.project
+            elif isinstance(obj, _Item):
+                obj = obj.track
+            elif isinstance(obj, (_Take, _Source)):
+                obj = obj.item if isinstance(obj, _Take) else obj.take
+            elif isinstance(obj, (_Envelope, _AudioAccessor)):
+                obj = obj.parent
+            else:
+                return
+        obj.state_change_count += 1
+        obj.is_dirty = True
+
+    # ReaScript API
+
+    def AddMediaItemToTrack(self, tr):
+        track = self._get(tr, _Track)
+        item = self._new_item(track)
+        self._touch(track)
+        return item.id
+
+    def AddProjectMarker(self, proj, isrgn, pos, rgnend, name, wantidx):
+        return self.AddProjectMarker2(
+            proj, isrgn, pos, rgnend, name, wantidx, 0
+        )
+
+    def AddProjectMarker2(
+        self, proj, isrgn, pos, rgnend, name, wantidx, color
+    ):
+        project = self._get_project(proj)
+        numbers = {
+            m.number for m in project.markers if m.is_region == bool(isrgn)
+        }
+        number = wantidx
+        if wantidx < 0 or wantidx in numbers:
+            number = 1
+            while number in numbers:
+                number += 1
+        self._add_marker(project, _Marker(
+            bool(isrgn), pos, rgnend, name, number, color
+        ))
+        return number
+
+    def AddTakeToMediaItem(self, item):
+        item = self._get(item, _Item)
+        take = self._new_take(item)
+        self._touch(item)
+        return take.id
+
+    def AnyTrackSolo(self, proj):
+        project = self._get_project(proj)
+        return any(t.infos["I_SOLO"] for t in project.tracks)
+
+    def AudioAccessorStateChanged(self, accessor):
+        self._get(accessor, _AudioAccessor)
+        return False
+
+    def AudioAccessorUpdate(self, accessor):
+        self._get(accessor, _AudioAccessor)
+
+    def AudioAccessorValidateState(self, accessor):
+        self._get(accessor, _AudioAccessor)
+        return False
+
+    def ClearConsole(self):
+        self.console = []
+
+    def ColorFromNative(self, col, rOut, gOut, bOut):
+        return col, col & 0xff, (col >> 8) & 0xff, (col >> 16) & 0xff
+
+    def ColorToNative(self, r, g, b):
+        return r | g << 8 | b << 16
+
+    def CountAutomationItems(self, env):
+        self._get(env, _Envelope)
+        return 0
+
+    def CountEnvelopePoints(self, envelope):
+        return len(self._get(envelope, _Envelope).points)
+
+    def CountEnvelopePointsEx(self, envelope, autoitem_idx):
+        if autoitem_idx >= 0:
+            return 0
+        return self.CountEnvelopePoints(envelope)
+
+    def CountMediaItems(self, proj):
+        return len(self._get_track_items(self._get_project(proj)))
+
+    def CountProjectMarkers(self, proj, num_markersOut, num_regionsOut):
+        project = self._get_project(proj)
+        n_regions = sum(m.is_region for m in project.markers)
+        n_markers = len(project.markers) - n_regions
+        return len(project.markers), proj, n_markers, n_regions
+
+    def CountSelectedMediaItems(self, proj):
+        items = self._get_track_items(self._get_project(proj))
+        return sum(bool(item.infos["B_UISEL"]) for item in items)
+
+    def CountSelectedTracks(self, proj):
+        return self.CountSelectedTracks2(proj, False)
+
+    def CountSelectedTracks2(self, proj, wantmaster):
+        project = self._get_project(proj)
+        tracks = project.tracks
+        if wantmaster:
+            tracks = [project.master_track] + tracks
+        return sum(t.is_selected for t in tracks)
+
+    def CountTakeEnvelopes(self, take):
+        return len(self._get(take, _Take).envelopes)
+
+    def CountTakes(self, item):
+        return len(self._get(item, _Item).takes)
+
+    def CountTempoTimeSigMarkers(self, proj):
+        self._get_project(proj)
+        return 0
+
+    def CountTrackEnvelopes(self, track):
+        return len(self._get(track, _Track).envelopes)
+
+    def CountTrackMediaItems(self, track):
+        return len(self._get(track, _Track).items)
+
+    def CountTracks(self, proj):
+        return len(self._get_project(proj).tracks)
+
+    def CreateNewMIDIItemInProj(self, track, starttime, endtime, qnInOptional):
+        track_object = self._get(track, _Track)
+        start, end = starttime, endtime
+        if qnInOptional:
+            start = start * 60 / track_object.project.bpm
+            end = end * 60 / track_object.project.bpm
+        item = self._new_item(track_object, start, end - start)
+        self._new_take(item, is_midi=True)
+        self._touch(item)
+        return item.id, track, starttime, endtime, qnInOptional
+
+    def CreateTakeAudioAccessor(self, take):
+        return self._new(_AudioAccessor(self._get(take, _Take))).id
+
+    def CreateTrackAudioAccessor(self, track):
+        return self._new(_AudioAccessor(self._get(track, _Track))).id
+
+    def DeleteEnvelopePointRange(self, envelope, time_start, time_end):
+        envelope = self._get(envelope, _Envelope)
+        envelope.points = [
+            p for p in envelope.points if not time_start <= p[0] < time_end
+        ]
+        self._touch(envelope)
+        return True
+
+    def DeleteEnvelopePointRangeEx(
+        self, envelope, autoitem_idx, time_start, time_end
+    ):
+        if autoitem_idx >= 0:
+            return False
+        return self.DeleteEnvelopePointRange(envelope, time_start, time_end)
+
+    def DeleteExtState(self, section, key, persist):
+        self.ext_state.pop((section, key), None)
+
+    def DeleteProjectMarker(self, proj, markrgnindexnumber, isrgn):
+        project = self._get_project(proj)
+        marker = self._find_marker(project, markrgnindexnumber, isrgn)
+        if marker is None:
+            return False
+        project.markers.remove(marker)
+        self._touch(project)
+        return True
+
+    def DeleteProjectMarkerByIndex(self, proj, markrgnidx):
+        project = self._get_project(proj)
+        if not 0 <= markrgnidx < len(project.markers):
+            return False
+        del project.markers[markrgnidx]
+        self._touch(project)
+        return True
+
+    def DeleteTrack(self, tr):
+        track = self._get(tr, _Track)
+        track.project.tracks.remove(track)
+        self._remove(track)
+        self._touch(track.project)
+
+    def DeleteTrackMediaItem(self, tr, it):
+        track, item = self._get(tr, _Track), self._get(it, _Item)
+        if item.track is not track:
+            return False
+        track.items.remove(item)
+        self._remove(item)
+        self._touch(track)
+        return True
+
+    def DestroyAudioAccessor(self, accessor):
+        self._objects.pop(self._get(accessor, _AudioAccessor).address)
+
+    def EnumProjectMarkers(
+        self, idx, isrgnOut, posOut, rgnendOut, nameOut, markrgnindexnumberOut
+    ):
+        result = self.EnumProjectMarkers2(
+            None, idx, isrgnOut, posOut, rgnendOut, nameOut,
+            markrgnindexnumberOut
+        )
+        return result[:1] + result[2:]
+
+    def EnumProjectMarkers2(
+        self, proj, idx, isrgnOut, posOut, rgnendOut, nameOut,
+        markrgnindexnumberOut
+    ):
+        return self.EnumProjectMarkers3(
+            proj, idx, isrgnOut, posOut, rgnendOut, nameOut,
+            markrgnindexnumberOut, 0
+        )[:8]
+
+    def EnumProjectMarkers3(
+        self, proj, idx, isrgnOut, posOut, rgnendOut, nameOut,
+        markrgnindexnumberOut, colorOut
+    ):
+        project = self._get_project(proj)
+        if not 0 <= idx < len(project.markers):
+            return 0, proj, idx, False, 0., 0., "", 0, 0
+        m = project.markers[idx]
+        return (
+            idx + 1, proj, idx, m.is_region, m.position, m.end, m.name,
+            m.number, m.color
+        )
+
+    def EnumProjExtState(
+        self, proj, extname, idx, keyOutOptional, keyOutOptional_sz,
+        valOutOptional, valOutOptional_sz
+    ):
+        project = self._get_project(proj)
+        keys = [k for s, k in project.ext_state if s == extname]
+        if not 0 <= idx < len(keys):
+            return (
+                False, proj, extname, idx, "", keyOutOptional_sz, "",
+                valOutOptional_sz
+            )
+        key = keys[idx]
+        return (
+            True, proj, extname, idx, key, keyOutOptional_sz,
+            project.ext_state[extname, key], valOutOptional_sz
+        )
+
+    def EnumProjects(self, idx, projfnOutOptional, projfnOutOptional_sz):
+        if idx == -1:
+            project = self.current_project
+        elif 0 <= idx < len(self.projects):
+            project = self.projects[idx]
+        else:
+            return self._null(_Project), idx, "", projfnOutOptional_sz
+        path = os.path.join(project.path, project.name) if project.name else ""
+        return project.id, idx, path, projfnOutOptional_sz
+
+    def EnumRegionRenderMatrix(self, proj, regionindex, rendertrack):
+        project = self._get_project(proj)
+        tracks = project.render_matrix.get(regionindex, [])
+        if 0 <= rendertrack < len(tracks):
+            return tracks[rendertrack].id
+        return self._null(_Track)
+
+    def Envelope_Evaluate(
+        self, envelope, time, samplerate, samplesRequested, valueOut,
+        dVdSOut, ddVdSOut, dddVdSOut
+    ):
+        value = self._get(envelope, _Envelope).evaluate(time)
+        return (
+            0, envelope, time, samplerate, samplesRequested, value, 0., 0.,
+            0.
+        )
+
+    def Envelope_FormatValue(self, env, value, bufOut, bufOut_sz):
+        self._get(env, _Envelope)
+        return env, value, "{:.2f}".format(value), bufOut_sz
+
+    def Envelope_SortPoints(self, envelope):
+        self._get(envelope, _Envelope).sort()
+        return True
+
+    def FX_Delete(self, parent, fx):
+        parent = self._get_fx_parent(parent)
+        if not 0 <= fx < len(parent.fxs):
+            return False
+        for envelope in parent.fxs.pop(fx).envelopes.values():
+            self._remove(envelope)
+        self._touch(parent)
+        return True
+
+    def FX_FormatParamValue(
+        self, parent, fx, param, value, bufOut, bufOut_sz
+    ):
+        self._get_fx_parent(parent).fxs[fx].parameters[param]
+        formatted = "{:.2f}".format(value)
+        return True, parent, fx, param, value, formatted, bufOut_sz
+
+    def FX_FormatParamValueNormalized(
+        self, parent, fx, param, value, buf, buf_sz
+    ):
+        _, _, low, high = self._get_fx_parent(parent).fxs[fx].parameters[param]
+        formatted = "{:.2f}".format(low + value * (high - low))
+        return True, parent, fx, param, value, formatted, buf_sz
+
+    def FX_GetChainVisible(self, parent):
+        self._get_fx_parent(parent)
+        return -1
+
+    def FX_GetCount(self, parent):
+        return len(self._get_fx_parent(parent).fxs)
+
+    def FX_GetEnabled(self, parent, fx):
+        return self._get_fx_parent(parent).fxs[fx].is_enabled
+
+    def FX_GetFXName(self, parent, fx, bufOut, bufOut_sz):
+        fxs = self._get_fx_parent(parent).fxs
+        if not 0 <= fx < len(fxs):
+            return False, parent, fx, "", bufOut_sz
+        return True, parent, fx, fxs[fx].name, bufOut_sz
+
+    def FX_GetFormattedParamValue(self, parent, fx, param, bufOut, bufOut_sz):
+        value = self._get_fx_parent(parent).fxs[fx].parameters[param][1]
+        return True, parent, fx, param, "{:.2f}".format(value), bufOut_sz
+
+    def FX_GetIOSize(self, parent, fx, inputPinsOut, outputPinsOut):
+        self._get_fx_parent(parent).fxs[fx]
+        return 0, parent, fx, 2, 2
+
+    def FX_GetNumParams(self, parent, fx):
+        fxs = self._get_fx_parent(parent).fxs
+        return len(fxs[fx].parameters) if 0 <= fx < len(fxs) else 0
+
+    def FX_GetOffline(self, parent, fx):
+        return self._get_fx_parent(parent).fxs[fx].is_offline
+
+    def FX_GetParam(self, parent, fx, param, minvalOut, maxvalOut):
+        fxs = self._get_fx_parent(parent).fxs
+        try:
+            _, value, low, high = fxs[fx].parameters[param]
+        except IndexError:
+            return 0., parent, fx, param, 0., 0.
+        return value, parent, fx, param, low, high
+
+    def FX_GetParamName(self, parent, fx, param, bufOut, bufOut_sz):
+        fxs = self._get_fx_parent(parent).fxs
+        try:
+            name = fxs[fx].parameters[param][0]
+        except IndexError:
+            return False, parent, fx, param, "", bufOut_sz
+        return True, parent, fx, param, name, bufOut_sz
+
+    def FX_GetParamNormalized(self, parent, fx, param):
+        _, value, low, high = self._get_fx_parent(parent).fxs[fx].parameters[
+            param
+        ]
+        return (value - low) / (high - low) if high != low else 0.
+
+    def FX_GetPreset(self, parent, fx, presetname, presetname_sz):
+        self._get_fx_parent(parent).fxs[fx]
+        return False, parent, fx, "", presetname_sz
+
+    def FX_GetPresetIndex(self, parent, fx, numberOfPresetsOut):
+        self._get_fx_parent(parent).fxs[fx]
+        return -1, parent, fx, 0
+
+    def FX_SetEnabled(self, parent, fx, enabled):
+        parent_object = self._get_fx_parent(parent)
+        parent_object.fxs[fx].is_enabled = bool(enabled)
+        self._touch(parent_object)
+
+    def FX_SetOffline(self, parent, fx, offline):
+        parent_object = self._get_fx_parent(parent)
+        parent_object.fxs[fx].is_offline = bool(offline)
+        self._touch(parent_object)
+
+    def FX_SetParam(self, parent, fx, param, val):
+        parent_object = self._get_fx_parent(parent)
+        try:
+            parameter = parent_object.fxs[fx].parameters[param]
+        except IndexError:
+            return False
+        parameter[1] = min(max(val, parameter[2]), parameter[3])
+        self._touch(parent_object)
+        return True
+
+    def FX_SetParamNormalized(self, parent, fx, param, value):
+        parent_object = self._get_fx_parent(parent)
+        try:
+            parameter = parent_object.fxs[fx].parameters[param]
+        except IndexError:
+            return False
+        low, high = parameter[2:]
+        parameter[1] = low + min(max(value, 0.), 1.) * (high - low)
+        self._touch(parent_object)
+        return True
+
+    def GetActiveTake(self, item):
+        take = self._get(item, _Item).active_take
+        return self._null(_Take) if take is None else take.id
+
+    def GetAppVersion(self):
+        return self.version
+
+    def GetAudioAccessorEndTime(self, accessor):
+        parent = self._get(accessor, _AudioAccessor).parent
+        if isinstance(parent, _Take):
+            return parent.item.end
+        return max((item.end for item in parent.items), default=0.)
+
+    def GetAudioAccessorHash(self, accessor, hashNeed128):
+        parent = self._get(accessor, _AudioAccessor).parent
+        return accessor, hashlib.md5(parent.id.encode()).hexdigest()
+
+    def GetAudioAccessorSamples(
+        self, accessor, samplerate, numchannels, starttime_sec,
+        numsamplesperchannel, samplebuffer
+    ):
+        self._get(accessor, _AudioAccessor)
+        samples = [0.] * (numchannels * numsamplesperchannel)
+        return (
+            1, accessor, samplerate, numchannels, starttime_sec,
+            numsamplesperchannel, samples
+        )
+
+    def GetAudioAccessorStartTime(self, accessor):
+        parent = self._get(accessor, _AudioAccessor).parent
+        return parent.item.position if isinstance(parent, _Take) else 0.
+
+    def GetCursorPosition(self):
+        return self.current_project.cursor_position
+
+    def GetCursorPositionEx(self, proj):
+        return self._get_project(proj).cursor_position
+
+    def GetEnvelopeName(self, env, bufOut, bufOut_sz):
+        return True, env, self._get(env, _Envelope).name, bufOut_sz
+
+    def GetEnvelopePoint(
+        self, envelope, ptidx, timeOutOptional, valueOutOptional,
+        shapeOutOptional, tensionOutOptional, selectedOutOptional
+    ):
+        points = self._get(envelope, _Envelope).points
+        if not 0 <= ptidx < len(points):
+            return False, envelope, ptidx, 0., 0., 0, 0., False
+        return (True, envelope, ptidx) + tuple(points[ptidx])
+
+    def GetEnvelopePointEx(
+        self, envelope, autoitem_idx, ptidx, timeOut, valueOut, shapeOut,
+        tensionOut, selectedOut
+    ):
+        result = self.GetEnvelopePoint(
+            envelope, ptidx, timeOut, valueOut, shapeOut, tensionOut,
+            selectedOut
+        )
+        if autoitem_idx >= 0:
+            result = (False, envelope, ptidx, 0., 0., 0, 0., False)
+        return result[:2] + (autoitem_idx,) + result[2:]
+
+    def GetEnvelopeStateChunk(self, env, strNeedBig, strNeedBig_sz, isundo):
+        envelope = self._get(env, _Envelope)
+        lines = ["<ENVELOPE", "NAME {}".format(envelope.name)] + [
+            "PT {} {} {} {} {}".format(*point) for point in envelope.points
+        ] + [">"]
+        return True, env, "\n".join(lines), strNeedBig_sz, isundo
+
+    def GetExePath(self):
+        return os.path.dirname(sys.executable)
+
+    def GetExtState(self, section, key):
+        return self.ext_state.get((section, key), "")
+
+    def GetFXEnvelope(self, track, fxindex, parameterindex, create):
+        track_object = self._get(track, _Track)
+        fx = track_object.fxs[fxindex]
+        envelope = fx.envelopes.get(parameterindex)
+        if envelope is None:
+            if not create:
+                return self._null(_Envelope)
+            name, value, low, high = fx.parameters[parameterindex]
+            value = (value - low) / (high - low) if high != low else 0.
+            envelope = fx.envelopes[parameterindex] = self._new(_Envelope(
+                track_object, "{} / {}".format(name, fx.name), value
+            ))
+            self._touch(track_object)
+        return envelope.id
+
+    def GetItemProjectContext(self, item):
+        return self._get(item, _Item).track.project.id
+
+    def GetMasterTrack(self, proj):
+        return self._get_project(proj).master_track.id
+
+    def GetMediaItem(self, proj, itemidx):
+        items = self._get_track_items(self._get_project(proj))
+        if 0 <= itemidx < len(items):
+            return items[itemidx].id
+        return self._null(_Item)
+
+    def GetMediaItemInfo_Value(self, item, parmname):
+        item = self._get(item, _Item)
+        if parmname == "I_CURTAKE":
+            take = item.active_take
+            return float(item.takes.index(take)) if take is not None else 0.
+        if parmname == "IP_ITEMNUMBER":
+            return float(item.track.items.index(item))
+        if parmname == "P_TRACK":
+            return float(item.track.address)
+        return item.infos.get(parmname, 0.)
+
+    def GetMediaItemNumTakes(self, item):
+        return self.CountTakes(item)
+
+    def GetMediaItemTake(self, item, tk):
+        return self.GetTake(item, tk)
+
+    def GetMediaItemTakeInfo_Value(self, take, parmname):
+        take = self._get(take, _Take)
+        if parmname == "IP_TAKENUMBER":
+            return float(take.item.takes.index(take))
+        if parmname == "P_ITEM":
+            return float(take.item.address)
+        if parmname == "P_TRACK":
+            return float(take.item.track.address)
+        return take.infos.get(parmname, 0.)
+
+    def GetMediaItemTake_Item(self, take):
+        return self._get(take, _Take).item.id
+
+    def GetMediaItemTake_Source(self, take):
+        source = self._get(take, _Take).source
+        return self._null(_Source) if source is None else source.id
+
+    def GetMediaItemTake_Track(self, take):
+        return self._get(take, _Take).item.track.id
+
+    def GetMediaItemTrack(self, item):
+        return self._get(item, _Item).track.id
+
+    def GetMediaItem_Track(self, item):
+        return self.GetMediaItemTrack(item)
+
+    def GetMediaSourceFileName(self, source, filenamebuf, filenamebuf_sz):
+        self._get(source, _Source)
+        return source, "", filenamebuf_sz
+
+    def GetMediaSourceLength(self, source, lengthIsQNOut):
+        take = self._get(source, _Source).take
+        return take.item.infos["D_LENGTH"], source, False
+
+    def GetMediaSourceNumChannels(self, source):
+        self._get(source, _Source)
+        return 0
+
+    def GetMediaSourceSampleRate(self, source):
+        self._get(source, _Source)
+        return 0
+
+    def GetMediaSourceType(self, source, typebuf, typebuf_sz):
+        return source, self._get(source, _Source).type, typebuf_sz
+
+    def GetMediaTrackInfo_Value(self, tr, parmname):
+        track = self._get(tr, _Track)
+        if parmname == "IP_TRACKNUMBER":
+            if track.is_master:
+                return -1.
+            return float(track.project.tracks.index(track) + 1)
+        if parmname == "I_SELECTED":
+            return float(track.is_selected)
+        if parmname == "P_PROJECT":
+            return float(track.project.address)
+        return track.infos.get(parmname, 0.)
+
+    def GetParentTrack(self, track):
+        track = self._get(track, _Track)
+        if track.is_master:
+            return self._null(_Track)
+        parents = []
+        for t in track.project.tracks:
+            if t is track:
+                break
+            depth = int(t.infos["I_FOLDERDEPTH"])
+            if depth > 0:
+                parents.append(t)
+            elif depth < 0:
+                del parents[len(parents) + depth:]
+        return parents[-1].id if parents else self._null(_Track)
+
+    def GetPlayPosition2Ex(self, proj):
+        return self._get_project(proj).cursor_position
+
+    def GetPlayPositionEx(self, proj):
+        return self._get_project(proj).cursor_position
+
+    def GetPlayStateEx(self, proj):
+        return self._get_project(proj).play_state
+
+    def GetProjExtState(
+        self, proj, extname, key, valOutNeedBig, valOutNeedBig_sz
+    ):
+        value = self._get_project(proj).ext_state.get((extname, key), "")
+        return len(value), proj, extname, key, value, valOutNeedBig_sz
+
+    def GetProjectLength(self, proj):
+        items = self._get_track_items(self._get_project(proj))
+        return max((item.end for item in items), default=0.)
+
+    def GetProjectName(self, proj, buf, buf_sz):
+        return proj, self._get_project(proj).name, buf_sz
+
+    def GetProjectPathEx(self, proj, buf, buf_sz):
+        return proj, self._get_project(proj).path, buf_sz
+
+    def GetProjectStateChangeCount(self, proj):
+        return self._get_project(proj).state_change_count
+
+    def GetProjectTimeSignature2(self, proj, bpmOut, bpiOut):
+        project = self._get_project(proj)
+        return proj, project.bpm, project.bpi
+
+    def GetResourcePath(self):
+        return os.path.join(os.path.expanduser("~"), ".config", "REAPER")
+
+    def GetSelectedMediaItem(self, proj, selitem):
+        items = self._get_track_items(self._get_project(proj))
+        selected = [item for item in items if item.infos["B_UISEL"]]
+        if 0 <= selitem < len(selected):
+            return selected[selitem].id
+        return self._null(_Item)
+
+    def GetSelectedTrack(self, proj, seltrackidx):
+        return self.GetSelectedTrack2(proj, seltrackidx, False)
+
+    def GetSelectedTrack2(self, proj, seltrackidx, wantmaster):
+        project = self._get_project(proj)
+        tracks = project.tracks
+        if wantmaster:
+            tracks = [project.master_track] + tracks
+        selected = [t for t in tracks if t.is_selected]
+        if 0 <= seltrackidx < len(selected):
+            return selected[seltrackidx].id
+        return self._null(_Track)
+
+    def GetSetMediaItemInfo_String(
+        self, item, parmname, stringNeedBig, setNewValue
+    ):
+        item_object = self._get(item, _Item)
+        if parmname == "GUID":
+            value = "{{{:08X}-0000-4000-8000-{:012X}}}".format(
+                0x1, item_object.address
+            )
+            return True, item, parmname, value, setNewValue
+        if parmname != "P_NOTES":
+            return False, item, parmname, "", setNewValue
+        if setNewValue:
+            item_object.notes = stringNeedBig
+            self._touch(item_object)
+        return True, item, parmname, item_object.notes, setNewValue
+
+    def GetSetMediaItemTakeInfo_String(
+        self, tk, parmname, stringNeedBig, setNewValue
+    ):
+        take = self._get(tk, _Take)
+        if parmname == "GUID":
+            value = "{{{:08X}-0000-4000-8000-{:012X}}}".format(
+                0x2, take.address
+            )
+            return True, tk, parmname, value, setNewValue
+        if parmname != "P_NAME":
+            return False, tk, parmname, "", setNewValue
+        if setNewValue:
+            take.name = stringNeedBig
+            self._touch(take)
+        return True, tk, parmname, take.name, setNewValue
+
+    def GetSetMediaTrackInfo_String(
+        self, tr, parmname, stringNeedBig, setNewValue
+    ):
+        track = self._get(tr, _Track)
+        if parmname == "GUID":
+            return True, tr, parmname, self.GetTrackGUID(tr), setNewValue
+        if parmname == "P_NAME":
+            if setNewValue:
+                track.name = stringNeedBig
+                self._touch(track)
+            return True, tr, parmname, track.name, setNewValue
+        if not parmname.startswith("P_EXT:"):
+            return False, tr, parmname, "", setNewValue
+        if setNewValue:
+            track.string_infos[parmname] = stringNeedBig
+            self._touch(track)
+        value = track.string_infos.get(parmname, "")
+        return parmname in track.string_infos, tr, parmname, value, setNewValue
+
+    def GetSetProjectInfo(self, project, desc, value, is_set):
+        project = self._get_project(project)
+        if is_set:
+            project.infos[desc] = value
+            self._touch(project)
+        return project.infos.get(desc, 0.)
+
+    def GetSetProjectInfo_String(self, project, desc, valuestrNeedBig, is_set):
+        project_object = self._get_project(project)
+        if is_set:
+            project_object.string_infos[desc] = valuestrNeedBig
+            self._touch(project_object)
+        value = project_object.string_infos.get(desc, "")
+        return True, project, desc, value, is_set
+
+    def GetTake(self, item, takeidx):
+        takes = self._get(item, _Item).takes
+        if 0 <= takeidx < len(takes):
+            return takes[takeidx].id
+        return self._null(_Take)
+
+    def GetTakeEnvelope(self, take, envidx):
+        envelopes = self._get(take, _Take).envelopes
+        if 0 <= envidx < len(envelopes):
+            return envelopes[envidx].id
+        return self._null(_Envelope)
+
+    def GetTakeEnvelopeByName(self, take, envname):
+        for envelope in self._get(take, _Take).envelopes:
+            if envelope.name == envname:
+                return envelope.id
+        return self._null(_Envelope)
+
+    def GetTakeName(self, take):
+        return self._get(take, _Take).name
+
+    def GetTrack(self, proj, trackidx):
+        tracks = self._get_project(proj).tracks
+        if 0 <= trackidx < len(tracks):
+            return tracks[trackidx].id
+        return self._null(_Track)
+
+    def GetTrackAutomationMode(self, tr):
+        return int(self._get(tr, _Track).infos["I_AUTOMODE"])
+
+    def GetTrackColor(self, track):
+        return int(self._get(track, _Track).infos["I_CUSTOMCOLOR"])
+
+    def GetTrackDepth(self, track):
+        track = self._get(track, _Track)
+        if track.is_master:
+            return 0
+        depth = 0
+        for t in track.project.tracks:
+            if t is track:
+                return depth
+            depth = max(0, depth + int(t.infos["I_FOLDERDEPTH"]))
+
+    def GetTrackEnvelope(self, track, envidx):
+        envelopes = self._get(track, _Track).envelopes
+        if 0 <= envidx < len(envelopes):
+            return envelopes[envidx].id
+        return self._null(_Envelope)
+
+    def GetTrackEnvelopeByName(self, track, envname):
+        for envelope in self._get(track, _Track).envelopes:
+            if envelope.name == envname:
+                return envelope.id
+        return self._null(_Envelope)
+
+    def GetTrackGUID(self, tr):
+        track = self._get(tr, _Track)
+        return "{{{:08X}-0000-4000-8000-{:012X}}}".format(0x3, track.address)
+
+    def GetTrackMediaItem(self, tr, itemidx):
+        items = self._get(tr, _Track).items
+        if 0 <= itemidx < len(items):
+            return items[itemidx].id
+        return self._null(_Item)
+
+    def GetTrackName(self, track, bufOut, bufOut_sz):
+        track_object = self._get(track, _Track)
+        name = track_object.name
+        if track_object.is_master:
+            name = "MASTER"
+        elif not name:
+            index = track_object.project.tracks.index(track_object)
+            name = "Track {}".format(index + 1)
+        return True, track, name, bufOut_sz
+
+    def GetTrackNumSends(self, tr, category):
+        self._get(tr, _Track)
+        return 0
+
+    def HasExtState(self, section, key):
+        return (section, key) in self.ext_state
+
+    def InsertEnvelopePoint(
+        self, envelope, time, value, shape, tension, selected, noSortInOptional
+    ):
+        envelope_object = self._get(envelope, _Envelope)
+        envelope_object.points.append(
+            [time, value, shape, tension, bool(selected)]
+        )
+        if not noSortInOptional:
+            envelope_object.sort()
+        self._touch(envelope_object)
+        return True
+
+    def InsertEnvelopePointEx(
+        self, envelope, autoitem_idx, time, value, shape, tension, selected,
+        noSortInOptional
+    ):
+        if autoitem_idx >= 0:
+            return False
+        return self.InsertEnvelopePoint(
+            envelope, time, value, shape, tension, selected, noSortInOptional
+        )
+
+    def InsertTrackAtIndex(self, idx, wantDefaults):
+        project = self.current_project
+        idx = min(max(idx, 0), len(project.tracks))
+        project.tracks.insert(idx, self._new(_Track(project)))
+        self._touch(project)
+
+    def IsMediaItemSelected(self, item):
+        return bool(self._get(item, _Item).infos["B_UISEL"])
+
+    def IsProjectDirty(self, proj):
+        return int(self._get_project(proj).is_dirty)
+
+    def IsTrackSelected(self, track):
+        return self._get(track, _Track).is_selected
+
+    def MIDI_CountEvts(self, take, notecntOut, ccevtcntOut, textsyxevtcntOut):
+        notes, ccs, texts = self._get(take, _Take).get_event_indices()
+        n_events = len(notes) + len(ccs) + len(texts)
+        return n_events, take, len(notes), len(ccs), len(texts)
+
+    def MIDI_DeleteCC(self, take, ccidx):
+        take_object = self._get(take, _Take)
+        ccs = take_object.get_event_indices()[1]
+        if not 0 <= ccidx < len(ccs):
+            return False
+        del take_object.events[ccs[ccidx]]
+        take_object.changed()
+        self._touch(take_object)
+        return True
+
+    def MIDI_DeleteEvt(self, take, evtidx):
+        take_object = self._get(take, _Take)
+        take_object.get_event_indices()  # Sorts events
+        if not 0 <= evtidx < len(take_object.events):
+            return False
+        del take_object.events[evtidx]
+        take_object.changed()
+        self._touch(take_object)
+        return True
+
+    def MIDI_DeleteNote(self, take, noteidx):
+        take_object = self._get(take, _Take)
+        notes = take_object.get_event_indices()[0]
+        if not 0 <= noteidx < len(notes):
+            return False
+        for i in sorted(notes[noteidx], reverse=True):
+            del take_object.events[i]
+        take_object.changed()
+        self._touch(take_object)
+        return True
+
+    def MIDI_GetAllEvts(self, take, bufNeedBig, bufNeedBig_sz):
+        buffer = self._get(take, _Take).get_buffer()
+        if len(buffer) > bufNeedBig_sz:
+            return False, take, "", 0
+        return True, take, buffer.decode("latin-1"), len(buffer)
+
+    def MIDI_GetCC(
+        self, take, ccidx, selectedOut, mutedOut, ppqposOut, chanmsgOut,
+        chanOut, msg2Out, msg3Out
+    ):
+        take_object = self._get(take, _Take)
+        ccs = take_object.get_event_indices()[1]
+        if not 0 <= ccidx < len(ccs):
+            return False, take, ccidx, False, False, 0., 0, 0, 0, 0
+        ppq, flags, msg = take_object.events[ccs[ccidx]]
+        msg3 = msg[2] if len(msg) > 2 else 0
+        return (
+            True, take, ccidx, bool(flags & 1), bool(flags & 2), ppq,
+            msg[0] & 0xf0, msg[0] & 0xf, msg[1], msg3
+        )
+
+    def MIDI_GetEvt(
+        self, take, evtidx, selectedOut, mutedOut, ppqposOut, msg, msg_sz
+    ):
+        take_object = self._get(take, _Take)
+        take_object.get_event_indices()  # Sorts events
+        if not 0 <= evtidx < len(take_object.events):
+            return False, take, evtidx, False, False, 0., "", 0
+        ppq, flags, message = take_object.events[evtidx]
+        return (
+            True, take, evtidx, bool(flags & 1), bool(flags & 2), ppq,
+            message.decode("latin-1"), len(message)
+        )
+
+    def MIDI_GetHash(self, take, notesonly, hash, hash_sz):
+        take_object = self._get(take, _Take)
+        events = take_object.events
+        if notesonly:
+            notes = take_object.get_event_indices()[0]
+            events = [events[i] for pair in notes for i in pair]
+        digest = hashlib.md5(repr(events).encode()).hexdigest()
+        return True, take, notesonly, digest, hash_sz
+
+    def MIDI_GetNote(
+        self, take, noteidx, selectedOut, mutedOut, startppqposOut,
+        endppqposOut, chanOut, pitchOut, velOut
+    ):
+        take_object = self._get(take, _Take)
+        notes = take_object.get_event_indices()[0]
+        if not 0 <= noteidx < len(notes):
+            return False, take, noteidx, False, False, 0., 0., 0, 0, 0
+        on, off = (take_object.events[i] for i in notes[noteidx])
+        return (
+            True, take, noteidx, bool(on[1] & 1), bool(on[1] & 2), on[0],
+            off[0], on[2][0] & 0xf, on[2][1], on[2][2]
+        )
+
+    def MIDI_GetPPQPosFromProjQN(self, take, projqn):
+        take = self._get(take, _Take)
+        return self._to_ppq(take, projqn * 60 / take.item.track.project.bpm)
+
+    def MIDI_GetPPQPosFromProjTime(self, take, projtime):
+        return self._to_ppq(self._get(take, _Take), projtime)
+
+    def MIDI_GetProjQNFromPPQPos(self, take, ppqpos):
+        take = self._get(take, _Take)
+        return self._to_time(take, ppqpos) * take.item.track.project.bpm / 60
+
+    def MIDI_GetProjTimeFromPPQPos(self, take, ppqpos):
+        return self._to_time(self._get(take, _Take), ppqpos)
+
+    def MIDI_GetTextSysexEvt(
+        self, take, textsyxevtidx, selectedOutOptional, mutedOutOptional,
+        ppqposOutOptional, typeOutOptional, msgOptional, msgOptional_sz
+    ):
+        take_object = self._get(take, _Take)
+        texts = take_object.get_event_indices()[2]
+        if not 0 <= textsyxevtidx < len(texts):
+            return False, take, textsyxevtidx, False, False, 0., 0, "", 0
+        ppq, flags, msg = take_object.events[texts[textsyxevtidx]]
+        if msg[0] == 0xff:
+            type, msg = msg[1], msg[2:]
+        else:
+            type, msg = -1, msg[1:-1] if msg.endswith(b"\xf7") else msg[1:]
+        return (
+            True, take, textsyxevtidx, bool(flags & 1), bool(flags & 2), ppq,
+            type, msg.decode("latin-1"), len(msg)
+        )
+
+    def MIDI_GetTrackHash(self, track, notesonly, hash, hash_sz):
+        hashes = [
+            self.MIDI_GetHash(take.id, notesonly, "", hash_sz)[3]
+            for item in self._get(track, _Track).items
+            for take in item.takes if take.is_midi
+        ]
+        digest = hashlib.md5(" ".join(hashes).encode()).hexdigest()
+        return bool(hashes), track, notesonly, digest, hash_sz
+
+    def MIDI_InsertCC(
+        self, take, selected, muted, ppqpos, chanmsg, chan, msg2, msg3
+    ):
+        msg = bytes([chanmsg | chan, msg2, msg3])
+        if chanmsg in (0xc0, 0xd0):  # Two-byte messages
+            msg = msg[:2]
+        return self.MIDI_InsertEvt(
+            take, selected, muted, ppqpos, msg, len(msg)
+        )
+
+    def MIDI_InsertEvt(
+        self, take, selected, muted, ppqpos, bytestr, bytestr_sz
+    ):
+        take_object = self._get(take, _Take)
+        if isinstance(bytestr, str):
+            bytestr = bytestr.encode("latin-1")
+        flags = bool(selected) | bool(muted) << 1
+        take_object.events.append([ppqpos, flags, bytes(bytestr[:bytestr_sz])])
+        take_object.changed()
+        self._touch(take_object)
+        return True
+
+    def MIDI_InsertNote(
+        self, take, selected, muted, startppqpos, endppqpos, chan, pitch, vel,
+        noSortInOptional
+    ):
+        take_object = self._get(take, _Take)
+        flags = bool(selected) | bool(muted) << 1
+        take_object.events.append(
+            [startppqpos, flags, bytes([0x90 | chan, pitch, vel])]
+        )
+        take_object.events.append(
+            [endppqpos, flags, bytes([0x80 | chan, pitch, 0])]
+        )
+        take_object.changed()
+        self._touch(take_object)
+        return True
+
+    def MIDI_InsertTextSysexEvt(
+        self, take, selected, muted, ppqpos, type, bytestr, bytestr_sz
+    ):
+        if isinstance(bytestr, str):
+            bytestr = bytestr.encode("latin-1")
+        bytestr = bytes(bytestr[:bytestr_sz])
+        if type == -1:
+            msg = b"\xf0" + bytestr + b"\xf7"
+        else:
+            msg = bytes([0xff, type]) + bytestr
+        return self.MIDI_InsertEvt(
+            take, selected, muted, ppqpos, msg, len(msg)
+        )
+
+    def MIDI_SelectAll(self, take, select):
+        take_object = self._get(take, _Take)
+        for event in take_object.events:
+            event[1] = event[1] & ~1 | bool(select)
+        take_object.changed()
+
+    def MIDI_SetAllEvts(self, take, buf, buf_sz):
+        take_object = self._get(take, _Take)
+        if isinstance(buf, str):
+            buf = buf.encode("latin-1")
+        buf = bytes(buf[:buf_sz])
+        events, ppq, i = [], 0, 0
+        while i + _MIDI_HEADER.size <= len(buf):
+            offset, flags, length = _MIDI_HEADER.unpack_from(buf, i)
+            i += _MIDI_HEADER.size
+            ppq += offset
+            events.append([ppq, flags, buf[i:i + length]])
+            i += length
+        if events and events[-1][2] == _END_OF_SOURCE:
+            events.pop()
+        take_object.events = events
+        take_object.changed()
+        self._touch(take_object)
+        return True
+
+    def MIDI_SetCC(
+        self, take, ccidx, selectedIn, mutedIn, ppqposIn, chanmsgIn, chanIn,
+        msg2In, msg3In, noSortIn
+    ):
+        take_object = self._get(take, _Take)
+        ccs = take_object.get_event_indices()[1]
+        if not 0 <= ccidx < len(ccs):
+            return False
+        event = take_object.events[ccs[ccidx]]
+        msg = bytearray(event[2])
+        if chanmsgIn is not None:
+            msg[0] = chanmsgIn | msg[0] & 0xf
+        if chanIn is not None:
+            msg[0] = msg[0] & 0xf0 | chanIn
+        if msg2In is not None:
+            msg[1] = msg2In
+        if msg3In is not None and len(msg) > 2:
+            msg[2] = msg3In
+        event[2] = bytes(msg)
+        self._set_event_flags(event, selectedIn, mutedIn, ppqposIn)
+        take_object.changed()
+        self._touch(take_object)
+        return True
+
+    def MIDI_SetCCShape(
+        self, take, ccidx, shape, beztension, noSortInOptional
+    ):
+        take_object = self._get(take, _Take)
+        return 0 <= ccidx < len(take_object.get_event_indices()[1])
+
+    def MIDI_SetEvt(
+        self, take, evtidx, selectedInOptional, mutedInOptional,
+        ppqposInOptional, msgOptional, msgOptional_sz, noSortInOptional
+    ):
+        take_object = self._get(take, _Take)
+        take_object.get_event_indices()  # Sorts events
+        if not 0 <= evtidx < len(take_object.events):
+            return False
+        event = take_object.events[evtidx]
+        if msgOptional is not None:
+            if isinstance(msgOptional, str):
+                msgOptional = msgOptional.encode("latin-1")
+            event[2] = bytes(msgOptional[:msgOptional_sz])
+        self._set_event_flags(
+            event, selectedInOptional, mutedInOptional, ppqposInOptional
+        )
+        take_object.changed()
+        self._touch(take_object)
+        return True
+
+    def MIDI_SetNote(
+        self, take, noteidx, selectedInOptional, mutedInOptional,
+        startppqposInOptional, endppqposInOptional, chanInOptional,
+        pitchInOptional, velInOptional, noSortInOptional
+    ):
+        take_object = self._get(take, _Take)
+        notes = take_object.get_event_indices()[0]
+        if not 0 <= noteidx < len(notes):
+            return False
+        on, off = (take_object.events[i] for i in notes[noteidx])
+        for event in on, off:
+            msg = bytearray(event[2])
+            if chanInOptional is not None:
+                msg[0] = msg[0] & 0xf0 | chanInOptional
+            if pitchInOptional is not None:
+                msg[1] = pitchInOptional
+            if velInOptional is not None and event is on:
+                msg[2] = velInOptional
+            event[2] = bytes(msg)
+            self._set_event_flags(
+                event, selectedInOptional, mutedInOptional, None
+            )
+        if startppqposInOptional is not None:
+            on[0] = startppqposInOptional
+        if endppqposInOptional is not None:
+            off[0] = endppqposInOptional
+        take_object.changed()
+        self._touch(take_object)
+        return True
+
+    def MIDI_SetTextSysexEvt(
+        self, take, textsyxevtidx, selectedInOptional, mutedInOptional,
+        ppqposInOptional, typeInOptional, msgOptional, msgOptional_sz,
+        noSortInOptional
+    ):
+        take_object = self._get(take, _Take)
+        texts = take_object.get_event_indices()[2]
+        if not 0 <= textsyxevtidx < len(texts):
+            return False
+        event = take_object.events[texts[textsyxevtidx]]
+        if typeInOptional is not None or msgOptional is not None:
+            _, _, _, _, _, _, type, msg, _ = self.MIDI_GetTextSysexEvt(
+                take, textsyxevtidx, 0, 0, 0., 0, "", 0
+            )
+            if typeInOptional is not None:
+                type = typeInOptional
+            if msgOptional is not None:
+                msg = msgOptional[:msgOptional_sz]
+            if isinstance(msg, str):
+                msg = msg.encode("latin-1")
+            if type == -1:
+                event[2] = b"\xf0" + msg + b"\xf7"
+            else:
+                event[2] = bytes([0xff, type]) + msg
+        self._set_event_flags(
+            event, selectedInOptional, mutedInOptional, ppqposInOptional
+        )
+        take_object.changed()
+        self._touch(take_object)
+        return True
+
+    def MIDI_Sort(self, take):
+        take_object = self._get(take, _Take)
+        take_object.events.sort(key=lambda e: e[0])
+        take_object.changed()
+
+    def Main_OnCommand(self, command, flag):
+        self.Main_OnCommandEx(command, flag, None)
+
+    def Main_OnCommandEx(self, command, flag, proj):
+        """
+        Run action. Only a few actions are supported:
+
+        - 40001: insert new track
+        - 40005: remove selected tracks
+        - 40182, 40289: select (unselect) all items
+        - 40296, 40297: select (unselect) all tracks
+        - 40406, 40407: add volume (pan) envelope to selected tracks
+        """
+        project = self._get_project(proj)
+        if command == 40001:
+            self.InsertTrackAtIndex(len(project.tracks), True)
+        elif command == 40005:
+            for track in [t for t in project.tracks if t.is_selected]:
+                self.DeleteTrack(track.id)
+        elif command in (40182, 40289):
+            self.SelectAllMediaItems(project.id, command == 40182)
+        elif command in (40296, 40297):
+            for track in project.tracks:
+                track.is_selected = command == 40296
+        elif command in (40406, 40407):
+            name, value = ("Volume", 1.) if command == 40406 else ("Pan", 0.)
+            for track in [t for t in project.tracks if t.is_selected]:
+                if not any(e.name == name for e in track.envelopes):
+                    track.envelopes.append(
+                        self._new(_Envelope(track, name, value))
+                    )
+                    self._touch(track)
+
+    def MarkProjectDirty(self, proj):
+        self._get_project(proj).is_dirty = True
+
+    def Master_GetPlayRate(self, project):
+        return self._get_project(project).play_rate
+
+    def Master_GetPlayRateAtTime(self, time_s, proj):
+        return self._get_project(proj).play_rate
+
+    def Master_GetTempo(self):
+        return self.current_project.bpm
+
+    def MoveMediaItemToTrack(self, item, desttr):
+        item, track = self._get(item, _Item), self._get(desttr, _Track)
+        if track.is_master or track.project is not item.track.project:
+            return False
+        item.track.items.remove(item)
+        item.track = track
+        track.items.append(item)
+        self._sort_items(track)
+        self._touch(track)
+        return True
+
+    def OnPauseButtonEx(self, proj):
+        project = self._get_project(proj)
+        project.play_state = 2 if project.play_state != 2 else 0
+
+    def OnPlayButtonEx(self, proj):
+        self._get_project(proj).play_state = 1
+
+    def OnStopButtonEx(self, proj):
+        self._get_project(proj).play_state = 0
+
+    def PreventUIRefresh(self, prevent_count):
+        pass
+
+    def SelectAllMediaItems(self, proj, selected):
+        for item in self._get_track_items(self._get_project(proj)):
+            item.infos["B_UISEL"] = float(bool(selected))
+
+    def SelectProjectInstance(self, proj):
+        self.current_project = self._get(proj, _Project)
+
+    def SetActiveTake(self, take):
+        take = self._get(take, _Take)
+        take.item.active_take = take
+        self._touch(take)
+
+    def SetCurrentBPM(self, __proj, bpm, wantUndo):
+        project = self._get_project(__proj)
+        project.bpm = float(bpm)
+        for item in self._get_track_items(project):
+            for take in item.takes:
+                take.changed()
+        self._touch(project)
+
+    def SetEditCurPos(self, time, moveview, seekplay):
+        self.SetEditCurPos2(None, time, moveview, seekplay)
+
+    def SetEditCurPos2(self, proj, time, moveview, seekplay):
+        self._get_project(proj).cursor_position = time
+
+    def SetEnvelopePoint(
+        self, envelope, ptidx, timeInOptional, valueInOptional,
+        shapeInOptional, tensionInOptional, selectedInOptional,
+        noSortInOptional
+    ):
+        envelope_object = self._get(envelope, _Envelope)
+        if not 0 <= ptidx < len(envelope_object.points):
+            return False
+        point = envelope_object.points[ptidx]
+        values = (
+            timeInOptional, valueInOptional, shapeInOptional,
+            tensionInOptional, selectedInOptional
+        )
+        for i, value in enumerate(values):
+            if value is not None:
+                point[i] = value
+        if not noSortInOptional:
+            envelope_object.sort()
+        self._touch(envelope_object)
+        return True
+
+    def SetExtState(self, section, key, value, persist):
+        self.ext_state[section, key] = value
+
+    def SetMediaItemInfo_Value(self, item, parmname, newvalue):
+        item = self._get(item, _Item)
+        if parmname not in item.infos:
+            return False
+        item.infos[parmname] = float(newvalue)
+        if parmname == "D_POSITION":
+            self._sort_items(item.track)
+        for take in item.takes:
+            take.changed()
+        self._touch(item)
+        return True
+
+    def SetMediaItemLength(self, item, length, refreshUI):
+        return self.SetMediaItemInfo_Value(item, "D_LENGTH", length)
+
+    def SetMediaItemPosition(self, item, position, refreshUI):
+        return self.SetMediaItemInfo_Value(item, "D_POSITION", position)
+
+    def SetMediaItemSelected(self, item, selected):
+        self._get(item, _Item).infos["B_UISEL"] = float(bool(selected))
+
+    def SetMediaItemTakeInfo_Value(self, take, parmname, newvalue):
+        take = self._get(take, _Take)
+        if parmname not in take.infos:
+            return False
+        take.infos[parmname] = float(newvalue)
+        self._touch(take)
+        return True
+
+    def SetMediaTrackInfo_Value(self, tr, parmname, newvalue):
+        track = self._get(tr, _Track)
+        if parmname == "I_SELECTED":
+            track.is_selected = bool(newvalue)
+            return True
+        if parmname not in track.infos:
+            return False
+        track.infos[parmname] = float(newvalue)
+        self._touch(track)
+        return True
+
+    def SetOnlyTrackSelected(self, track):
+        track = self._get(track, _Track)
+        for t in [track.project.master_track] + track.project.tracks:
+            t.is_selected = t is track
+
+    def SetProjExtState(self, proj, extname, key, value):
+        project = self._get_project(proj)
+        if not key:
+            for k in [k for k in project.ext_state if k[0] == extname]:
+                del project.ext_state[k]
+        elif not value:
+            project.ext_state.pop((extname, key), None)
+        else:
+            project.ext_state[extname, key] = value
+        self._touch(project)
+        return 1
+
+    def SetProjectMarker(self, markrgnindexnumber, isrgn, pos, rgnend, name):
+        return self.SetProjectMarker2(
+            None, markrgnindexnumber, isrgn, pos, rgnend, name
+        )
+
+    def SetProjectMarker2(
+        self, proj, markrgnindexnumber, isrgn, pos, rgnend, name
+    ):
+        project = self._get_project(proj)
+        marker = self._find_marker(project, markrgnindexnumber, isrgn)
+        if marker is None:
+            return False
+        return self.SetProjectMarker3(
+            proj, markrgnindexnumber, isrgn, pos, rgnend, name, marker.color
+        )
+
+    def SetProjectMarker3(
+        self, proj, markrgnindexnumber, isrgn, pos, rgnend, name, color
+    ):
+        project = self._get_project(proj)
+        marker = self._find_marker(project, markrgnindexnumber, isrgn)
+        if marker is None:
+            return False
+        project.markers.remove(marker)
+        marker.position = pos
+        marker.end = rgnend if marker.is_region else pos
+        if name:  # An empty name leaves it unchanged, like in REAPER
+            marker.name = name
+        marker.color = color
+        self._add_marker(project, marker)
+        return True
+
+    def SetRegionRenderMatrix(self, proj, regionindex, track, addorremove):
+        project = self._get_project(proj)
+        track = self._get(track, _Track)
+        tracks = project.render_matrix.setdefault(regionindex, [])
+        if addorremove > 0 and track not in tracks:
+            tracks.append(track)
+        elif addorremove < 0 and track in tracks:
+            tracks.remove(track)
+        self._touch(project)
+
+    def SetTrackAutomationMode(self, tr, mode):
+        self.SetMediaTrackInfo_Value(tr, "I_AUTOMODE", mode)
+
+    def SetTrackColor(self, track, color):
+        self.SetMediaTrackInfo_Value(track, "I_CUSTOMCOLOR", color | 0x1000000)
+
+    def SetTrackSelected(self, track, selected):
+        self._get(track, _Track).is_selected = bool(selected)
+
+    def ShowConsoleMsg(self, msg):
+        self.console.append(msg)
+
+    def SplitMediaItem(self, item, position):
+        item_object = self._get(item, _Item)
+        if not item_object.position < position < item_object.end:
+            return self._null(_Item)
+        right = self._new_item(
+            item_object.track, position, item_object.end - position
+        )
+        right.infos = dict(item_object.infos, D_POSITION=position)
+        right.infos["D_LENGTH"] = item_object.end - position
+        item_object.infos["D_LENGTH"] = position - item_object.position
+        for take in item_object.takes:
+            right_take = self._new_take(right, take.is_midi)
+            right_take.name, right_take.infos = take.name, dict(take.infos)
+            split_ppq = self._to_ppq(take, position)
+            right_take.events = [
+                [ppq - split_ppq, flags, msg]
+                for ppq, flags, msg in take.events if ppq >= split_ppq
+            ]
+            take.events = [e for e in take.events if e[0] < split_ppq]
+            take.changed()
+            if take is item_object.active_take:
+                right.active_take = right_take
+        self._touch(item_object)
+        return right.id
+
+    def TakeFX_AddByName(self, take, fxname, instantiate):
+        return self._add_fx(self._get(take, _Take), fxname, instantiate)
+
+    def TakeIsMIDI(self, take):
+        return self._get(take, _Take).is_midi
+
+    def TimeMap2_QNToTime(self, proj, tpos):
+        return tpos * 60 / self._get_project(proj).bpm
+
+    def TimeMap2_timeToQN(self, proj, tpos):
+        return tpos * self._get_project(proj).bpm / 60
+
+    def TimeMap_QNToTime(self, qn):
+        return self.TimeMap2_QNToTime(None, qn)
+
+    def TimeMap_timeToQN(self, tpos):
+        return self.TimeMap2_timeToQN(None, tpos)
+
+    def TrackFX_AddByName(self, track, fxname, recFX, instantiate):
+        return self._add_fx(self._get(track, _Track), fxname, instantiate)
+
+    def TrackFX_GetInstrument(self, track):
+        for i, fx in enumerate(self._get(track, _Track).fxs):
+            if fx.name.startswith("VSTi:"):
+                return i
+        return -1
+
+    def Undo_BeginBlock(self):
+        pass
+
+    def Undo_BeginBlock2(self, proj):
+        self._get_project(proj)
+
+    def Undo_EndBlock(self, descchange, extraflags):
+        pass
+
+    def Undo_EndBlock2(self, proj, descchange, extraflags):
+        self._get_project(proj)
+
+    def UpdateArrange(self):
+        pass
+
+    def UpdateItemInProject(self, item):
+        self._get(item, _Item)
+
+    def UpdateTimeline(self):
+        pass
+
+    def ValidatePtr(self, pointer, ctypename):
+        return self.ValidatePtr2(None, pointer, ctypename)
+
+    def ValidatePtr2(self, proj, pointer, ctypename):
+        try:
+            obj = self._get(pointer)
+        except ValueError:
+            return False
+        if obj.pointer_type != ctypename:
+            return False
+        if proj and not isinstance(obj, _Project):
+            project = self._get_project(proj)
+            while not isinstance(obj, (_Project, _Track)):
+                obj = obj.item if isinstance(obj, _Take) else (
+                    obj.track if isinstance(obj, _Item) else obj.parent
+                )
+            return obj.project is project if isinstance(obj, _Track) else (
+                obj is project
+            )
+        return True
+
+    # Public methods
+
+    def get_api(self):
+        """
+        Return ReaScript API functions, by name without "RPR_".
+
+        Returns
+        -------
+        dict
+        """
+        api = {}
+        for name in dir(self):
+            if name.startswith("FX_"):
+                for prefix in ("TrackFX_", "TakeFX_"):
+                    api.setdefault(prefix + name[3:], getattr(self, name))
+            elif name[0].isupper():
+                api[name] = getattr(self, name)
+        return api
+
+    def install(self):
+        """
+        Make ``reapy`` run as if inside this fake REAPER.
+
+        ``reapy`` must not have been imported yet in the current
+        process.
+        """
+        main = sys.modules["__main__"]
+        main.obj = None  # reapy checks for it to detect REAPER
+        main.RPR_defer = self._defer
+        main.RPR_atexit = self._at_exit_code
+        sys.modules["reaper_python"] = self.make_module()
+
+    def make_module(self):
+        """
+        Return fake ``reaper_python`` module.
+
+        Returns
+        -------
+        module
+            Module with an ``RPR_<name>`` function per API function,
+            and ``_ft``, ``rpr_packp`` and ``rpr_packsc`` used by
+            ``reapy.additional_api``.
+        """
+        module = types.ModuleType("reaper_python")
+        for name, function in self.get_api().items():
+            setattr(module, "RPR_" + name, function)
+        module._callbacks = self._make_callbacks()  # Keep them alive
+        module._ft = {
+            name: ct.cast(f, ct.c_void_p).value
+            for name, f in module._callbacks.items()
+        }
+        module.rpr_packp = lambda t, v: self._get(v).address
+        module.rpr_packsc = lambda v: ct.c_char_p(str(v).encode())
+        return module
+
+    def run_deferred(self):
+        """Run code deferred with ``RPR_defer`` since last call."""
+        deferred, self._deferred = self._deferred, []
+        main = sys.modules["__main__"]
+        for code in deferred:
+            exec(code, vars(main))
+
+    def serve(self, port=0, defer_interval=1 / 30):
+        """
+        Host a ``reapy`` server and run it forever.
+
+        The fake is installed, so ``reapy`` must not have been
+        imported yet. The server port is printed on the first line
+        of stdout.
+
+        Parameters
+        ----------
+        port : int, optional
+            Server port. If 0 (default), a free port is used.
+        defer_interval : float, optional
+            Time in seconds between two server ticks (default=1/30,
+            like REAPER defer loops).
+        """
+        self.install()
+        from reapy.tools.network import Server
+        # Only local clients can connect to the fake server
+        server = Server(port, "127.0.0.1")
+        print(server._socket.getsockname()[1], flush=True)
+        while True:
+            next_tick = time.perf_counter() + defer_interval
+            server.run_tick()
+            self.run_deferred()
+            time.sleep(max(0, next_tick - time.perf_counter()))
+
+    # Private helpers used by the API
+
+    def _add_fx(self, parent, name, instantiate):
+        for i, fx in enumerate(parent.fxs):
+            if instantiate >= 0 and self._match_fx(fx.name, name):
+                return i
+        if instantiate == 0:
+            return -1
+        for fx_name, parameters in sorted(self.fx_parameters.items()):
+            if self._match_fx(fx_name, name):
+                parent.fxs.append(
+                    _FX(fx_name, tuple(parameters) + _COMMON_FX_PARAMETERS)
+                )
+                self._touch(parent)
+                return len(parent.fxs) - 1
+        return -1
+
+    def _make_callbacks(self):
+        """Return C callbacks of functions called through ``_ft``."""
+        def read(address, type):
+            if address is None:
+                return None
+            return type.from_address(address).value
+
+        def write(address, type, value):
+            if address is not None:
+                type.from_address(address).value = value
+
+        def get_take(take):
+            return self._get(take, _Take).id
+
+        @ct.CFUNCTYPE(
+            ct.c_int, ct.c_uint64, ct.c_int, ct.c_int, ct.c_double,
+            ct.c_int, ct.c_void_p
+        )
+        def GetAudioAccessorSamples(
+            accessor, sample_rate, n_channels, start, n_samples, buffer
+        ):
+            self._get(accessor, _AudioAccessor)
+            ct.memset(buffer, 0, 8 * n_channels * n_samples)
+            return 1
+
+        @ct.CFUNCTYPE(ct.c_byte, ct.c_uint64, ct.c_void_p, ct.c_void_p)
+        def MIDI_GetAllEvts(take, buffer, size_address):
+            data = self._get(take, _Take).get_buffer()
+            size = read(size_address, ct.c_int)
+            if len(data) > size:
+                write(size_address, ct.c_int, 0)
+                return 0
+            ct.memmove(buffer, data, len(data))
+            write(size_address, ct.c_int, len(data))
+            return 1
+
+        @ct.CFUNCTYPE(
+            ct.c_byte, ct.c_uint64, ct.c_int, ct.c_void_p, ct.c_void_p,
+            ct.c_void_p, ct.c_void_p, ct.c_void_p
+        )
+        def MIDI_GetEvt(take, index, selected, muted, ppq, msg, size_address):
+            result = self.MIDI_GetEvt(
+                get_take(take), index, 0, 0, 0., "", 0
+            )
+            data = result[6].encode("latin-1")
+            size = min(len(data), read(size_address, ct.c_int))
+            write(selected, ct.c_byte, result[3])
+            write(muted, ct.c_byte, result[4])
+            write(ppq, ct.c_double, result[5])
+            ct.memmove(msg, data, size)
+            write(size_address, ct.c_int, size)
+            return result[0]
+
+        @ct.CFUNCTYPE(
+            ct.c_byte, ct.c_uint64, ct.c_int, ct.c_void_p, ct.c_void_p,
+            ct.c_void_p, ct.c_void_p, ct.c_void_p, ct.c_void_p
+        )
+        def MIDI_GetTextSysexEvt(
+            take, index, selected, muted, ppq, type, msg, size_address
+        ):
+            result = self.MIDI_GetTextSysexEvt(
+                get_take(take), index, 0, 0, 0., 0, "", 0
+            )
+            data = result[7].encode("latin-1")
+            size = min(len(data), read(size_address, ct.c_int))
+            write(selected, ct.c_byte, result[3])
+            write(muted, ct.c_byte, result[4])
+            write(ppq, ct.c_double, result[5])
+            write(type, ct.c_int, result[6])
+            ct.memmove(msg, data, size)
+            write(size_address, ct.c_int, size)
+            return result[0]
+
+        def hash_callback(function, type):
+            @ct.CFUNCTYPE(
+                ct.c_byte, ct.c_uint64, ct.c_byte, ct.c_void_p, ct.c_int
+            )
+            def callback(pointer, notes_only, buffer, size):
+                result = function(
+                    self._get(pointer, type).id, notes_only, "", size
+                )
+                data = result[3].encode()[:size - 1] + b"\0"
+                ct.memmove(buffer, data, len(data))
+                return result[0]
+            return callback
+
+        @ct.CFUNCTYPE(
+            ct.c_byte, ct.c_uint64, ct.c_byte, ct.c_byte, ct.c_double,
+            ct.c_void_p, ct.c_int
+        )
+        def MIDI_InsertEvt(take, selected, muted, ppq, msg, size):
+            return self.MIDI_InsertEvt(
+                get_take(take), selected, muted, ppq, ct.string_at(msg, size),
+                size
+            )
+
+        @ct.CFUNCTYPE(
+            ct.c_byte, ct.c_uint64, ct.c_byte, ct.c_byte, ct.c_double,
+            ct.c_int, ct.c_void_p, ct.c_int
+        )
+        def MIDI_InsertTextSysexEvt(
+            take, selected, muted, ppq, type, msg, size
+        ):
+            return self.MIDI_InsertTextSysexEvt(
+                get_take(take), selected, muted, ppq, type,
+                ct.string_at(msg, size), size
+            )
+
+        @ct.CFUNCTYPE(ct.c_byte, ct.c_uint64, ct.c_void_p, ct.c_int)
+        def MIDI_SetAllEvts(take, buffer, size):
+            return self.MIDI_SetAllEvts(
+                get_take(take), ct.string_at(buffer, size), size
+            )
+
+        @ct.CFUNCTYPE(
+            ct.c_byte, ct.c_uint64, ct.c_int, ct.c_void_p, ct.c_void_p,
+            ct.c_void_p, ct.c_void_p, ct.c_void_p, ct.c_void_p, ct.c_void_p,
+            ct.c_void_p
+        )
+        def MIDI_SetCC(
+            take, index, selected, muted, ppq, chan_msg, channel, msg2, msg3,
+            sort
+        ):
+            return self.MIDI_SetCC(
+                get_take(take), index, read(selected, ct.c_byte),
+                read(muted, ct.c_byte), read(ppq, ct.c_double),
+                read(chan_msg, ct.c_int), read(channel, ct.c_int),
+                read(msg2, ct.c_int), read(msg3, ct.c_int), None
+            )
+
+        @ct.CFUNCTYPE(
+            ct.c_byte, ct.c_uint64, ct.c_int, ct.c_int, ct.c_double,
+            ct.c_void_p
+        )
+        def MIDI_SetCCShape(take, index, shape, tension, sort):
+            return self.MIDI_SetCCShape(
+                get_take(take), index, shape, tension, None
+            )
+
+        @ct.CFUNCTYPE(
+            ct.c_byte, ct.c_uint64, ct.c_int, ct.c_void_p, ct.c_void_p,
+            ct.c_void_p, ct.c_void_p, ct.c_int, ct.c_void_p
+        )
+        def MIDI_SetEvt(take, index, selected, muted, ppq, msg, size, sort):
+            return self.MIDI_SetEvt(
+                get_take(take), index, read(selected, ct.c_byte),
+                read(muted, ct.c_byte), read(ppq, ct.c_double),
+                None if msg is None else ct.string_at(msg, size), size, None
+            )
+
+        @ct.CFUNCTYPE(
+            ct.c_byte, ct.c_uint64, ct.c_int, ct.c_void_p, ct.c_void_p,
+            ct.c_void_p, ct.c_void_p, ct.c_void_p, ct.c_void_p, ct.c_void_p,
+            ct.c_void_p
+        )
+        def MIDI_SetNote(
+            take, index, selected, muted, start, end, channel, pitch,
+            velocity, sort
+        ):
+            return self.MIDI_SetNote(
+                get_take(take), index, read(selected, ct.c_byte),
+                read(muted, ct.c_byte), read(start, ct.c_double),
+                read(end, ct.c_double), read(channel, ct.c_int),
+                read(pitch, ct.c_int), read(velocity, ct.c_int), None
+            )
+
+        @ct.CFUNCTYPE(
+            ct.c_byte, ct.c_uint64, ct.c_int, ct.c_void_p, ct.c_void_p,
+            ct.c_void_p, ct.c_void_p, ct.c_void_p, ct.c_int, ct.c_void_p
+        )
+        def MIDI_SetTextSysexEvt(
+            take, index, selected, muted, ppq, type, msg, size, sort
+        ):
+            return self.MIDI_SetTextSysexEvt(
+                get_take(take), index, read(selected, ct.c_byte),
+                read(muted, ct.c_byte), read(ppq, ct.c_double),
+                read(type, ct.c_int),
+                None if msg is None else ct.string_at(msg, size), size, None
+            )
+
+        @ct.CFUNCTYPE(ct.c_byte, ct.c_uint64, ct.c_uint64, ct.c_char_p)
+        def ValidatePtr2(project, pointer, name):
+            return self.ValidatePtr2(project, pointer, name.decode())
+
+        return {
+            "GetAudioAccessorSamples": GetAudioAccessorSamples,
+            "MIDI_GetAllEvts": MIDI_GetAllEvts,
+            "MIDI_GetEvt": MIDI_GetEvt,
+            "MIDI_GetHash": hash_callback(self.MIDI_GetHash, _Take),
+            "MIDI_GetTextSysexEvt": MIDI_GetTextSysexEvt,
+            "MIDI_GetTrackHash": hash_callback(
+                self.MIDI_GetTrackHash, _Track
+            ),
+            "MIDI_InsertEvt": MIDI_InsertEvt,
+            "MIDI_InsertTextSysexEvt": MIDI_InsertTextSysexEvt,
+            "MIDI_SetAllEvts": MIDI_SetAllEvts,
+            "MIDI_SetCC": MIDI_SetCC,
+            "MIDI_SetCCShape": MIDI_SetCCShape,
+            "MIDI_SetEvt": MIDI_SetEvt,
+            "MIDI_SetNote": MIDI_SetNote,
+            "MIDI_SetTextSysexEvt": MIDI_SetTextSysexEvt,
+            "ValidatePtr2": ValidatePtr2,
+        }
+
+    @staticmethod
+    def _match_fx(fx_name, name):
+        """Whether ``name`` designates FX ``fx_name`` (e.g. "ReaEQ")."""
+        if name == fx_name:
+            return True
+        short_name = fx_name.split(": ", 1)[-1]
+        return name in (short_name, short_name.split(" (")[0])
+
+    @staticmethod
+    def _set_event_flags(event, selected, muted, ppq):
+        if selected is not None:
+            event[1] = event[1] & ~1 | bool(selected)
+        if muted is not None:
+            event[1] = event[1] & ~2 | bool(muted) << 1
+        if ppq is not None:
+            event[0] = ppq
+
+
+if __name__ == "__main__":
+    # This script's directory is in sys.path instead of reapy's parent
+    sys.path[0] = os.path.dirname(os.path.dirname(sys.path[0]))
+    options = json.loads(sys.argv[1]) if len(sys.argv) > 1 else {}
+    serve_options = {
+        key: options.pop(key) for key in ("port", "defer_interval")
+        if key in options
+    }
+    FakeReaper(**options).serve(**serve_options)
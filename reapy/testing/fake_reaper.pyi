@@ -0,0 +1,139 @@
+"""
+In-memory stand-in for REAPER's ``reaper_python`` module.
+
+``FakeReaper`` implements the part of the ReaScript API used by
+``reapy.core``: projects, tracks, items, takes, MIDI events, FX
+parameters, envelopes, markers and regions, and ext states. Functions
+that ``reapy.additional_api`` calls through ``ctypes`` are exposed as
+C callbacks in ``_ft``, like in REAPER.
+
+``reapy`` selects its mode when it is imported, so this module doesn't
+import ``reapy``: it can be loaded (e.g. by path) and installed with
+``FakeReaper.install`` before ``reapy`` is imported. Running it as a
+script hosts a real ``reapy`` server on a fake REAPER, and prints
+the server port on the first line of stdout::
+
+    python fake_reaper.py [OPTIONS]
+
+where ``OPTIONS`` is a JSON object of keyword arguments of
+``FakeReaper.serve`` and ``FakeReaper``. See
+``reapy.testing.FakeReaperServer``.
+"""
+
+import types
+import typing as ty
+
+
+DEFAULT_VERSION: str
+PPQ: int
+FX_PARAMETERS: ty.Dict[str, ty.Tuple[ty.Tuple[str, float, float, float], ...]]
+
+
+class FakeReaper:
+    """
+    In-memory REAPER, exposed as a fake ``reaper_python`` module.
+
+    It starts with a single empty project. API functions are methods
+    named after the ReaScript API (e.g. ``FakeReaper.CountTracks``);
+    ``FX_*`` methods are exposed both as ``TrackFX_*`` and
+    ``TakeFX_*``. Objects are identified by ReaScript IDs such as
+    ``"(MediaTrack*)0x0000000000010008"``, and an unknown or deleted
+    ID raises ``ValueError``.
+
+    Tempo is constant for each project, and audio accessors return
+    silence.
+
+    Parameters
+    ----------
+    version : str, optional
+        Version returned by ``GetAppVersion``.
+    fx_parameters : dict, optional
+        Additional FX that can be added by name, with their
+        parameters (see ``FX_PARAMETERS``).
+
+    Examples
+    --------
+    From a process where ``reapy`` hasn't been imported yet:
+
+    >>> FakeReaper().install()
+    >>> import reapy
+    >>> reapy.Project().add_track(name="Drums")
+    Track("(MediaTrack*)0x0000000000010010")
+    """
+    version: str
+    fx_parameters: ty.Dict[
+        str, ty.Sequence[ty.Tuple[str, float, float, float]]
+    ]
+    ext_state: ty.Dict[ty.Tuple[str, str], str]
+    console: ty.List[str]
+
+    def __init__(
+        self,
+        version: str = ...,
+        fx_parameters: ty.Optional[ty.Dict[
+            str, ty.Sequence[ty.Tuple[str, float, float, float]]
+        ]] = None
+    ) -> None:
+        ...
+
+    def __getattr__(self, name: str) -> ty.Callable[..., ty.Any]:
+        # ReaScript API functions (e.g. ``FakeReaper.CountTracks``)
+        ...
+
+    def get_api(self) -> ty.Dict[str, ty.Callable[..., ty.Any]]:
+        """
+        Return ReaScript API functions, by name without "RPR_".
+
+        Returns
+        -------
+        dict
+        """
+        ...
+
+    def install(self) -> None:
+        """
+        Make ``reapy`` run as if inside this fake REAPER.
+
+        ``reapy`` must not have been imported yet in the current
+        process.
+        """
+        ...
+
+    def make_module(self) -> types.ModuleType:
+        """
+        Return fake ``reaper_python`` module.
+
+        Returns
+        -------
+        module
+            Module with an ``RPR_<name>`` function per API function,
+            and ``_ft``, ``rpr_packp`` and ``rpr_packsc`` used by
+            ``reapy.additional_api``.
+        """
+        ...
+
+    def run_deferred(self) -> None:
+        """Run code deferred with ``RPR_defer`` since last call."""
+        ...
+
+    def serve(self, port: int = 0, defer_interval: float = 1 / 30) -> None:
+        """
+        Host a ``reapy`` server and run it forever.
+
+        The fake is installed, so ``reapy`` must not have been
+        imported yet. The server port is printed on the first line
+        of stdout.
+
+        Parameters
+        ----------
+        port : int, optional
+            Server port. If 0 (default), a free port is used.
+        defer_interval : float, optional
+            Time in seconds between two server ticks (default=1/30,
+            like REAPER defer loops).
+        """
+        ...
+
+    def _make_callbacks(self) -> ty.Dict[str, ty.Any]:
+        """Return C callbacks of functions called through ``_ft``."""
+        ...
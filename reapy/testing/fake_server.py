@@ -0,0 +1,97 @@
+"""Define FakeReaperServer class."""
+
+import json
+import os
+import subprocess
+import sys
+
+from reapy.tools.network import ClientPool, machines
+
+
+class FakeReaperServer:
+
+    """
+    ``reapy`` server running on a fake REAPER.
+
+    The server is the real ``reapy`` server. It runs in a subprocess
+    where a ``FakeReaper`` has been installed, and ticks at the rate
+    of REAPER defer loops. This allows to use ``reapy`` (e.g. in
+    tests or benchmarks) without REAPER.
+
+    When used as a context manager, the fake server is selected in
+    the current context (see ``reapy.connect``) and stopped on exit.
+    Threads started inside the ``with`` block don't inherit that
+    selection, unless ``select_globally`` is True.
+
+    The server only accepts connections from the local host.
+
+    Parameters
+    ----------
+    defer_interval : float, optional
+        Time in seconds between two server ticks (default=1/30).
+    select_globally : bool, optional
+        Whether the context manager also selects the fake server for
+        all threads, until exit (default=False).
+    **options
+        Keyword arguments of ``FakeReaper`` (e.g. ``version`` or
+        ``fx_parameters``). They must be JSON serializable.
+
+    Attributes
+    ----------
+    port : int
+        Port of the fake server.
+    pool : ClientPool
+        Connections to the fake server.
+    select_globally : bool
+        Whether the context manager selects the fake server for all
+        threads.
+
+    Examples
+    --------
+    >>> with FakeReaperServer():
+    ...     project = reapy.Project()
+    ...     project.add_track(name="Bass").name
+    'Bass'
+    """
+
+    def __init__(self, defer_interval=1 / 30, select_globally=False,
+                 **options):
+        self.select_globally = select_globally
+        script = os.path.join(os.path.dirname(__file__), "fake_reaper.py")
+        options["defer_interval"] = defer_interval
+        self._process = subprocess.Popen(
+            [sys.executable, script, json.dumps(options)],
+            stdout=subprocess.PIPE
+        )
+        try:
+            line = self._process.stdout.readline()
+            if not line:
+                raise RuntimeError("Fake REAPER server failed to start.")
+            self.port = int(line)
+            self.pool = ClientPool(self.port)
+        except BaseException:
+            self._stop()
+            raise
+
+    def __enter__(self):
+        self._token = machines._CONTEXT_CLIENT.set(self.pool)
+        if self.select_globally:
+            self._global_client = machines.CLIENT
+            machines.CLIENT = self.pool
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        machines._CONTEXT_CLIENT.reset(self._token)
+        if self.select_globally:
+            machines.CLIENT = self._global_client
+        self.close()
+
+    def close(self):
+        """Close connections and stop server."""
+        self.pool.close()
+        self._stop()
+
+    def _stop(self):
+        self._process.terminate()
+        self._process.wait()
+        self._process.stdout.close()
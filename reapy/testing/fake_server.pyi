@@ -0,0 +1,84 @@
+"""Define FakeReaperServer class."""
+
+import json
+import os
+import subprocess
+import sys
+import typing as ty
+
+from reapy.tools.network import ClientPool, machines
+
+
+class FakeReaperServer:
+    """
+    ``reapy`` server running on a fake REAPER.
+
+    The server is the real ``reapy`` server. It runs in a subprocess
+    where a ``FakeReaper`` has been installed, and ticks at the rate
+    of REAPER defer loops. This allows to use ``reapy`` (e.g. in
+    tests or benchmarks) without REAPER.
+
+    When used as a context manager, the fake server is selected in
+    the current context (see ``reapy.connect``) and stopped on exit.
+    Threads started inside the ``with`` block don't inherit that
+    selection, unless ``select_globally`` is True.
+
+    The server only accepts connections from the local host.
+
+    Parameters
+    ----------
+    defer_interval : float, optional
+        Time in seconds between two server ticks (default=1/30).
+    select_globally : bool, optional
+        Whether the context manager also selects the fake server for
+        all threads, until exit (default=False).
+    **options
+        Keyword arguments of ``FakeReaper`` (e.g. ``version`` or
+        ``fx_parameters``). They must be JSON serializable.
+
+    Attributes
+    ----------
+    port : int
+        Port of the fake server.
+    pool : ClientPool
+        Connections to the fake server.
+    select_globally : bool
+        Whether the context manager selects the fake server for all
+        threads.
+
+    Examples
+    --------
+    >>> with FakeReaperServer():
+    ...     project = reapy.Project()
+    ...     project.add_track(name="Bass").name
+    'Bass'
+    """
+    port: int
+    pool: ClientPool
+    select_globally: bool
+    _process: subprocess.Popen
+    _global_client: ty.Optional[ClientPool]
+
+    def __init__(
+        self, defer_interval: float = 1 / 30, select_globally: bool = False,
+        **options: ty.Any
+    ) -> None:
+        ...
+
+    def __enter__(self) -> 'FakeReaperServer':
+        ...
+
+    def __exit__(
+        self,
+        exc_type: ty.Optional[ty.Type[BaseException]],
+        exc_value: ty.Optional[BaseException],
+        traceback: ty.Any
+    ) -> None:
+        ...
+
+    def close(self) -> None:
+        """Close connections and stop server."""
+        ...
+
+    def _stop(self) -> None:
+        ...
@@ -0,0 +1,216 @@
+import contextvars
+import traceback
+
+import reapy
+from reapy.errors import DistError
+from .network import machines
+
+
+#: Stack of active batches in current context (thread or ``asyncio``
+#: task), as a tuple.
+_BATCHES = contextvars.ContextVar("reapy_batches", default=())
+
+
+def get_current_batch():
+    """Return innermost active batch, or None outside any batch."""
+    batches = _BATCHES.get()
+    return batches[-1] if batches else None
+
+
+def _resolve(x, values):
+    """Replace references to previous batch results by their values."""
+    if isinstance(x, dict):
+        if "__batch_result__" in x:
+            return values[x["__batch_result__"]]
+        return {k: _resolve(v, values) for k, v in x.items()}
+    if isinstance(x, (list, tuple)):
+        return type(x)(_resolve(y, values) for y in x)
+    return x
+
+
+def run_batch(calls):
+    """
+    Run queued calls inside REAPER.
+
+    Should only be used internally. Execution stops at the first
+    call that raises an error.
+
+    Parameters
+    ----------
+    calls : list of dict
+        Calls with keys ``"function"``, ``"args"`` and ``"kwargs"``.
+
+    Returns
+    -------
+    dict
+        Keys are ``"values"`` (list of results of successful calls)
+        and ``"traceback"`` (traceback of the error that stopped
+        execution, or None).
+    """
+    values = []
+    for call in calls:
+        try:
+            args = _resolve(call["args"], values)
+            kwargs = _resolve(call["kwargs"], values)
+            values.append(call["function"](*args, **kwargs))
+        except Exception:
+            return {"values": values, "traceback": traceback.format_exc()}
+    return {"values": values, "traceback": None}
+
+
+class BatchFuture:
+
+    """
+    Lazy result of a call queued in a batch.
+
+    Futures can be passed as arguments to later calls of the same
+    batch. They are then replaced by the corresponding result inside
+    REAPER.
+    """
+
+    def __init__(self, batch, index):
+        self._batch = batch
+        self.index = index
+
+    def __repr__(self):
+        return "BatchFuture(index={})".format(self.index)
+
+    def _to_dict(self):
+        if self.done():
+            return self.result()
+        if not self._batch._sending:
+            raise ValueError(
+                "Pending futures can only be used in their own batch."
+            )
+        return {"__batch_result__": self.index}
+
+    def done(self):
+        """
+        Whether the batch has been executed.
+
+        :type: bool
+        """
+        return self._batch._executed
+
+    def result(self):
+        """
+        Return result of the call.
+
+        Returns
+        -------
+        object
+            Result of the call.
+
+        Raises
+        ------
+        RuntimeError
+            If the batch has not been executed yet.
+        DistError
+            If the call (or a previous call of the batch) raised an
+            error inside REAPER.
+        """
+        if not self.done():
+            raise RuntimeError("Batch has not been executed yet.")
+        if self.index < len(self._batch._values):
+            return self._batch._values[self.index]
+        raise DistError(self._batch._traceback)
+
+
+class batch:
+
+    """
+    Context manager to send several calls in a single request.
+
+    Inside the context, calls to ``inside_reaper``-decorated
+    functions and to ``reapy.reascript_api`` functions are not sent
+    right away. Each of them returns a ``BatchFuture`` instead, and
+    all queued calls are sent at once when the context exits. Futures
+    can be passed as arguments to later calls of the same batch.
+
+    Only direct calls are deferred: reapy functions that process
+    results of API calls locally must not be used inside a batch.
+    From inside REAPER, calls are run immediately and return their
+    actual results.
+
+    Batches are local to the current thread (or ``asyncio`` task):
+    calls made by other threads meanwhile are not deferred.
+
+    Examples
+    --------
+    >>> with reapy.batch():
+    ...     track_id = RPR.GetTrack(0, 0)
+    ...     RPR.SetMediaTrackInfo_Value(track_id, "D_VOL", 0.5)
+    ...     volume = RPR.GetMediaTrackInfo_Value(track_id, "D_VOL")
+    ...
+    >>> volume.result()
+    0.5
+    """
+
+    def __init__(self):
+        self._calls = []
+        self._executed = False
+        self._sending = False
+        self._values = []
+        self._traceback = None
+
+    def __enter__(self):
+        _BATCHES.set(_BATCHES.get() + (self,))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        _BATCHES.set(tuple(b for b in _BATCHES.get() if b is not self))
+        if exc_type is None:
+            self.execute()
+        return False
+
+    def add(self, function, args, kwargs):
+        """
+        Queue call and return its future.
+
+        Parameters
+        ----------
+        function : callable or dict
+            Function (or encoded function) to call inside REAPER.
+        args : tuple
+            Positional arguments.
+        kwargs : dict
+            Keyword arguments.
+
+        Returns
+        -------
+        BatchFuture
+            Future of the call result.
+        """
+        if self._executed:
+            raise RuntimeError("Batch has already been executed.")
+        call = {"function": function, "args": args, "kwargs": kwargs}
+        self._calls.append(call)
+        return BatchFuture(self, len(self._calls) - 1)
+
+    def execute(self):
+        """
+        Send queued calls and wait for their results.
+
+        It is automatically called when the context exits.
+
+        Raises
+        ------
+        DistError
+            If one of the calls raised an error inside REAPER.
+        """
+        if self._executed:
+            return
+        if self._calls and not reapy.is_inside_reaper():
+            client = machines.get_selected_client()
+            self._sending = True
+            try:
+                output = client.request(
+                    run_batch, {"args": (self._calls,), "kwargs": {}}
+                )
+            finally:
+                self._sending = False
+            self._values = output["values"]
+            self._traceback = output["traceback"]
+        self._executed = True
+        if self._traceback is not None:
+            raise DistError(self._traceback)
@@ -0,0 +1,158 @@
+import contextvars
+import traceback
+import typing as ty
+
+import reapy
+from reapy.errors import DistError
+from .network import machines
+
+
+_BATCHES: contextvars.ContextVar[ty.Tuple['batch', ...]]
+
+
+def get_current_batch() -> ty.Optional['batch']:
+    """Return innermost active batch, or None outside any batch."""
+    ...
+
+
+def _resolve(x: ty.Any, values: ty.List[ty.Any]) -> ty.Any:
+    """Replace references to previous batch results by their values."""
+    ...
+
+
+def run_batch(calls: ty.List[ty.Dict[str, ty.Any]]
+              ) -> ty.Dict[str, ty.Any]:
+    """
+    Run queued calls inside REAPER.
+
+    Should only be used internally. Execution stops at the first
+    call that raises an error.
+
+    Parameters
+    ----------
+    calls : list of dict
+        Calls with keys ``"function"``, ``"args"`` and ``"kwargs"``.
+
+    Returns
+    -------
+    dict
+        Keys are ``"values"`` (list of results of successful calls)
+        and ``"traceback"`` (traceback of the error that stopped
+        execution, or None).
+    """
+    ...
+
+
+class BatchFuture:
+    """
+    Lazy result of a call queued in a batch.
+
+    Futures can be passed as arguments to later calls of the same
+    batch. They are then replaced by the corresponding result inside
+    REAPER.
+    """
+    _batch: 'batch'
+    index: int
+
+    def __init__(self, batch: 'batch', index: int) -> None:
+        ...
+
+    def _to_dict(self) -> ty.Any:
+        ...
+
+    def done(self) -> bool:
+        """
+        Whether the batch has been executed.
+
+        :type: bool
+        """
+        ...
+
+    def result(self) -> ty.Any:
+        """
+        Return result of the call.
+
+        Returns
+        -------
+        object
+            Result of the call.
+
+        Raises
+        ------
+        RuntimeError
+            If the batch has not been executed yet.
+        DistError
+            If the call (or a previous call of the batch) raised an
+            error inside REAPER.
+        """
+        ...
+
+
+class batch:
+    """
+    Context manager to send several calls in a single request.
+
+    Inside the context, calls to ``inside_reaper``-decorated
+    functions and to ``reapy.reascript_api`` functions are not sent
+    right away. Each of them returns a ``BatchFuture`` instead, and
+    all queued calls are sent at once when the context exits. Futures
+    can be passed as arguments to later calls of the same batch.
+
+    Only direct calls are deferred: reapy functions that process
+    results of API calls locally must not be used inside a batch.
+    From inside REAPER, calls are run immediately and return their
+    actual results.
+
+    Batches are local to the current thread (or ``asyncio`` task):
+    calls made by other threads meanwhile are not deferred.
+    """
+    _calls: ty.List[ty.Dict[str, ty.Any]]
+    _executed: bool
+    _sending: bool
+    _values: ty.List[ty.Any]
+    _traceback: ty.Optional[str]
+
+    def __init__(self) -> None:
+        ...
+
+    def __enter__(self) -> 'batch':
+        ...
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> bool:  # type: ignore
+        ...
+
+    def add(self, function: ty.Union[ty.Callable[..., ty.Any],
+                                     ty.Dict[str, object]],
+            args: ty.Tuple[ty.Any, ...],
+            kwargs: ty.Dict[str, ty.Any]) -> BatchFuture:
+        """
+        Queue call and return its future.
+
+        Parameters
+        ----------
+        function : callable or dict
+            Function (or encoded function) to call inside REAPER.
+        args : tuple
+            Positional arguments.
+        kwargs : dict
+            Keyword arguments.
+
+        Returns
+        -------
+        BatchFuture
+            Future of the call result.
+        """
+        ...
+
+    def execute(self) -> None:
+        """
+        Send queued calls and wait for their results.
+
+        It is automatically called when the context exits.
+
+        Raises
+        ------
+        DistError
+            If one of the calls raised an error inside REAPER.
+        """
+        ...
@@ -6,6 +6,7 @@ import reapy
 import reapy.config
 from reapy.errors import DisabledDistAPIError, DisabledDistAPIWarning
 from .network import machines
+from . import _batch
 # if not reapy.is_inside_reaper():
 #     try:
 #         from .network import Client, WebInterface
@@ -65,6 +66,9 @@ class inside_reaper(contextlib.ContextDecorator):
             @functools.wraps(func)
             def wrap(*args, **kwargs):
                 f = func if encoded_func is None else encoded_func
+                batch = _batch.get_current_batch()
+                if batch is not None:
+                    return batch.add(f, args, kwargs)
                 client = machines.get_selected_client()
                 return client.request(f, {"args": args, "kwargs": kwargs})
             return wrap
@@ -0,0 +1,376 @@
+"""Encode and decode ``reapy`` objects in a compact binary format.
+
+Every value is written as a one-byte tag followed by its payload.
+Integers and floats are little-endian, strings are UTF-8, and
+homogeneous lists of floats or integers are written as raw arrays
+so that large numeric payloads are not boxed one value at a time.
+
+Like ``reapy.tools.json``, tuples are decoded as lists and reapy
+objects, methods, callables and slices are rebuilt on decoding.
+NumPy arrays are sent as their raw memory.
+
+JSON is faster for messages without such arrays, so that the dist API
+only uses this format for messages where ``has_arrays`` is True.
+"""
+
+import array
+import importlib
+import inspect
+import operator
+import struct
+import sys
+
+from .json import _CLASS_CACHE
+
+
+MAGIC = b"RPB\x01"
+
+#: Lists shorter than this are never packed as raw arrays.
+MIN_ARRAY_LENGTH = 8
+
+_NONE, _TRUE, _FALSE = b"N", b"T", b"F"
+_INT, _BIG_INT, _FLOAT = b"i", b"L", b"d"
+_STR, _BYTES = b"s", b"y"
+_LIST, _DICT = b"l", b"m"
+_FLOAT_ARRAY, _INT_ARRAY = b"D", b"Q"
+_REAPY_OBJECT, _METHOD, _CALLABLE, _SLICE = b"r", b"M", b"c", b"S"
+_NDARRAY = b"A"
+
+_INT64_MIN, _INT64_MAX = -2 ** 63, 2 ** 63 - 1
+
+_LENGTH = struct.Struct("<I")
+_INT64 = struct.Struct("<q")
+_FLOAT64 = struct.Struct("<d")
+
+_BYTES_TYPES = frozenset((bytes, bytearray, memoryview))
+_CONTAINER_TYPES = frozenset((list, tuple, dict))
+_SCALAR_TYPES = frozenset((type(None), bool, int, float, str))
+
+
+def _is_array_type(t):
+    """Whether values of a type are always sent as raw memory."""
+    if t in _BYTES_TYPES:
+        return True
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and issubclass(t, numpy.ndarray)
+
+
+def _to_array(typecode, values):
+    a = array.array(typecode, values)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a.tobytes()
+
+
+def _from_array(typecode, data):
+    a = array.array(typecode)
+    a.frombytes(data)
+    if sys.byteorder == "big":
+        a.byteswap()
+    return a.tolist()
+
+
+class Encoder:
+
+    """Binary encoder writing into a list of byte chunks."""
+
+    def __init__(self):
+        self.chunks = []
+
+    def encode(self, x):
+        _ENCODERS.get(type(x), Encoder._encode_other)(self, x)
+
+    def _encode_none(self, x):
+        self.chunks.append(_NONE)
+
+    def _encode_bool(self, x):
+        self.chunks.append(_TRUE if x else _FALSE)
+
+    def _encode_int(self, x):
+        if _INT64_MIN <= x <= _INT64_MAX:
+            self.chunks += _INT, _INT64.pack(x)
+        else:
+            self._encode_sized(_BIG_INT, str(x).encode("ascii"))
+
+    def _encode_float(self, x):
+        self.chunks += _FLOAT, _FLOAT64.pack(x)
+
+    def _encode_sized(self, tag, data):
+        self.chunks += tag, _LENGTH.pack(len(data)), data
+
+    def _encode_str(self, x):
+        self._encode_sized(_STR, x.encode("utf-8", "surrogatepass"))
+
+    def _encode_bytes(self, x):
+        self._encode_sized(_BYTES, bytes(x))
+
+    def _encode_list(self, x):
+        if len(x) >= MIN_ARRAY_LENGTH:
+            types = set(map(type, x))
+            if types == {float}:
+                self._encode_sized(_FLOAT_ARRAY, _to_array("d", x))
+                return
+            if (
+                types == {int}
+                and _INT64_MIN <= min(x) and max(x) <= _INT64_MAX
+            ):
+                self._encode_sized(_INT_ARRAY, _to_array("q", x))
+                return
+        self.chunks += _LIST, _LENGTH.pack(len(x))
+        for y in x:
+            self.encode(y)
+
+    def _encode_dict(self, x):
+        if "__reapy__" in x:
+            self._encode_reapy_object(x)
+        elif "__callable__" in x:
+            self._encode_callable(x["module_name"], x["name"])
+        else:
+            self.chunks += _DICT, _LENGTH.pack(len(x))
+            for key, value in x.items():
+                self.encode(key)
+                self.encode(value)
+
+    def _encode_reapy_object(self, x):
+        self.chunks.append(_REAPY_OBJECT)
+        self._encode_str(x["class"])
+        self.encode(x["args"])
+        self.encode(x["kwargs"])
+
+    def _encode_callable(self, module_name, name):
+        self.chunks.append(_CALLABLE)
+        self._encode_str(module_name)
+        self._encode_str(name)
+
+    def _encode_ndarray(self, x):
+        numpy = sys.modules["numpy"]
+        x = numpy.ascontiguousarray(x)
+        self.chunks.append(_NDARRAY)
+        self._encode_str(x.dtype.str)
+        self.encode(x.shape)
+        self._encode_sized(_BYTES, memoryview(x).cast("B"))
+
+    def _encode_other(self, x):
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(x, numpy.ndarray):
+            self._encode_ndarray(x)
+        elif numpy is not None and isinstance(x, numpy.generic):
+            self.encode(x.item())
+        elif hasattr(x, "_to_dict"):
+            self.encode(x._to_dict())
+        elif inspect.ismethod(x):
+            self.chunks.append(_METHOD)
+            self.encode(x.__self__)
+            self._encode_str(x.__name__)
+        elif callable(x):
+            self._encode_callable(x.__module__, x.__qualname__)
+        elif isinstance(x, slice):
+            self.chunks.append(_SLICE)
+            self.encode((x.start, x.stop, x.step))
+        elif isinstance(x, (bytearray, memoryview)):
+            self._encode_bytes(x)
+        elif isinstance(x, int):
+            self._encode_int(int(x))
+        elif isinstance(x, float):
+            self._encode_float(float(x))
+        else:
+            raise TypeError(
+                "Object of type {} is not binary serializable".format(
+                    type(x).__name__
+                )
+            )
+
+
+class Decoder:
+
+    """Binary decoder reading from a bytes-like object."""
+
+    def __init__(self, data):
+        self.data = memoryview(data)
+        self.position = 0
+
+    def decode(self):
+        tag = self.data[self.position]
+        self.position += 1
+        try:
+            method = _DECODERS[tag]
+        except KeyError:
+            raise ValueError("Invalid binary tag {!r}".format(bytes((tag,))))
+        return method(self)
+
+    def _read_length(self):
+        length, = _LENGTH.unpack_from(self.data, self.position)
+        self.position += _LENGTH.size
+        return length
+
+    def _read_sized(self):
+        length = self._read_length()
+        start, self.position = self.position, self.position + length
+        return self.data[start:self.position]
+
+    def _decode_none(self):
+        return None
+
+    def _decode_true(self):
+        return True
+
+    def _decode_false(self):
+        return False
+
+    def _decode_big_int(self):
+        return int(str(self._read_sized(), "ascii"))
+
+    def _decode_int(self):
+        x, = _INT64.unpack_from(self.data, self.position)
+        self.position += _INT64.size
+        return x
+
+    def _decode_float(self):
+        x, = _FLOAT64.unpack_from(self.data, self.position)
+        self.position += _FLOAT64.size
+        return x
+
+    def _decode_str(self):
+        return str(self._read_sized(), "utf-8", "surrogatepass")
+
+    def _decode_bytes(self):
+        return self._read_sized().tobytes()
+
+    def _decode_list(self):
+        return [self.decode() for _ in range(self._read_length())]
+
+    def _decode_float_array(self):
+        return _from_array("d", self._read_sized())
+
+    def _decode_int_array(self):
+        return _from_array("q", self._read_sized())
+
+    def _decode_slice(self):
+        return slice(*self.decode())
+
+    def _decode_dict(self):
+        n = self._read_length()
+        d = {}
+        for _ in range(n):
+            key = self.decode()
+            d[key] = self.decode()
+        return d
+
+    def _decode_ndarray(self):
+        import numpy
+        dtype = self._decode_str_value()
+        shape = self.decode()
+        self.position += 1  # Skip bytes tag
+        array = numpy.frombuffer(self._read_sized(), dtype=dtype)
+        if not array.flags.writeable:
+            array = array.copy()
+        return array.reshape(shape)
+
+    def _decode_reapy_object(self):
+        reapy_class = _CLASS_CACHE[self._decode_str_value()]
+        args = self.decode()
+        kwargs = self.decode()
+        return reapy_class(*args, **kwargs)
+
+    def _decode_method(self):
+        obj = self.decode()
+        return getattr(obj, self._decode_str_value())
+
+    def _decode_callable(self):
+        module_name = self._decode_str_value()
+        name = self._decode_str_value()
+        try:
+            module = sys.modules[module_name]
+        except KeyError:
+            module = importlib.import_module(module_name)
+        return operator.attrgetter(name)(module)
+
+    def _decode_str_value(self):
+        self.position += 1  # Skip str tag
+        return self._decode_str()
+
+
+_ENCODERS = {
+    type(None): Encoder._encode_none,
+    bool: Encoder._encode_bool,
+    int: Encoder._encode_int,
+    float: Encoder._encode_float,
+    str: Encoder._encode_str,
+    bytes: Encoder._encode_bytes,
+    list: Encoder._encode_list,
+    tuple: Encoder._encode_list,
+    dict: Encoder._encode_dict,
+}
+_DECODERS = {
+    tag[0]: method for tag, method in (
+        (_NONE, Decoder._decode_none),
+        (_TRUE, Decoder._decode_true),
+        (_FALSE, Decoder._decode_false),
+        (_INT, Decoder._decode_int),
+        (_BIG_INT, Decoder._decode_big_int),
+        (_FLOAT, Decoder._decode_float),
+        (_STR, Decoder._decode_str),
+        (_BYTES, Decoder._decode_bytes),
+        (_LIST, Decoder._decode_list),
+        (_DICT, Decoder._decode_dict),
+        (_FLOAT_ARRAY, Decoder._decode_float_array),
+        (_INT_ARRAY, Decoder._decode_int_array),
+        (_REAPY_OBJECT, Decoder._decode_reapy_object),
+        (_METHOD, Decoder._decode_method),
+        (_CALLABLE, Decoder._decode_callable),
+        (_SLICE, Decoder._decode_slice),
+        (_NDARRAY, Decoder._decode_ndarray),
+    )
+}
+
+
+def dumps(x):
+    """Encode object as bytes, prefixed with ``MAGIC``."""
+    encoder = Encoder()
+    encoder.chunks.append(MAGIC)
+    encoder.encode(x)
+    return b"".join(encoder.chunks)
+
+
+def loads(data):
+    """Decode bytes produced by ``dumps``."""
+    if bytes(data[:len(MAGIC)]) != MAGIC:
+        raise ValueError("Data is not reapy binary data.")
+    decoder = Decoder(data)
+    decoder.position = len(MAGIC)
+    return decoder.decode()
+
+
+def has_arrays(x):
+    """
+    Whether an object holds values that are sent as raw memory.
+
+    They are NumPy arrays, bytes, and homogeneous lists of at least
+    ``MIN_ARRAY_LENGTH`` floats or integers. Other objects are faster
+    to send as JSON.
+
+    Parameters
+    ----------
+    x : object
+
+    Returns
+    -------
+    bool
+    """
+    t = type(x)
+    if t in _SCALAR_TYPES:
+        return False
+    if t is dict:
+        return any(map(has_arrays, x.values()))
+    if t is list or t is tuple:
+        types = set(map(type, x))
+        if len(x) >= MIN_ARRAY_LENGTH and (types == {float} or types == {int}):
+            return True
+        if types <= _SCALAR_TYPES:
+            return False
+        if any(map(_is_array_type, types)):
+            return True
+        if _CONTAINER_TYPES.isdisjoint(types):
+            return False
+        return any(map(has_arrays, x))
+    return _is_array_type(t)
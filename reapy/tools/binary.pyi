@@ -0,0 +1,89 @@
+"""Encode and decode ``reapy`` objects in a compact binary format.
+
+Every value is written as a one-byte tag followed by its payload.
+Integers and floats are little-endian, strings are UTF-8, and
+homogeneous lists of floats or integers are written as raw arrays
+so that large numeric payloads are not boxed one value at a time.
+
+Like ``reapy.tools.json``, tuples are decoded as lists and reapy
+objects, methods, callables and slices are rebuilt on decoding.
+NumPy arrays are sent as their raw memory.
+
+JSON is faster for messages without such arrays, so that the dist API
+only uses this format for messages where ``has_arrays`` is True.
+"""
+
+import array
+import importlib
+import inspect
+import operator
+import struct
+import sys
+import typing as ty
+
+from .json import _CLASS_CACHE
+
+
+MAGIC: bytes
+MIN_ARRAY_LENGTH: int
+
+
+def _to_array(typecode: str, values: ty.Sequence[ty.Any]) -> bytes:
+    ...
+
+
+def _from_array(typecode: str, data: ty.Union[bytes, memoryview]
+                ) -> ty.List[ty.Any]:
+    ...
+
+
+class Encoder:
+    """Binary encoder writing into a list of byte chunks."""
+    chunks: ty.List[bytes]
+
+    def __init__(self) -> None:
+        ...
+
+    def encode(self, x: ty.Any) -> None:
+        ...
+
+
+class Decoder:
+    """Binary decoder reading from a bytes-like object."""
+    data: memoryview
+    position: int
+
+    def __init__(self, data: ty.Union[bytes, memoryview]) -> None:
+        ...
+
+    def decode(self) -> ty.Any:
+        ...
+
+
+def dumps(x: ty.Any) -> bytes:
+    """Encode object as bytes, prefixed with ``MAGIC``."""
+    ...
+
+
+def loads(data: ty.Union[bytes, memoryview]) -> ty.Any:
+    """Decode bytes produced by ``dumps``."""
+    ...
+
+
+def has_arrays(x: ty.Any) -> bool:
+    """
+    Whether an object holds values that are sent as raw memory.
+
+    They are NumPy arrays, bytes, and homogeneous lists of at least
+    ``MIN_ARRAY_LENGTH`` floats or integers. Other objects are faster
+    to send as JSON.
+
+    Parameters
+    ----------
+    x : object
+
+    Returns
+    -------
+    bool
+    """
+    ...
@@ -1,5 +1,6 @@
 """Encode and decode ``reapy`` objects as JSON."""
 
+import base64
 import importlib
 import inspect
 import json
@@ -26,7 +27,18 @@ _CLASS_CACHE = ClassCache()
 class ReapyEncoder(json.JSONEncoder):
 
     def default(self, x):
-        if hasattr(x, '_to_dict'):
+        numpy = sys.modules.get("numpy")
+        if numpy is not None and isinstance(x, numpy.ndarray):
+            x = numpy.ascontiguousarray(x)
+            return {
+                "__ndarray__": True,
+                "dtype": x.dtype.str,
+                "shape": x.shape,
+                "data": base64.b64encode(x.tobytes()).decode("ascii")
+            }
+        elif numpy is not None and isinstance(x, numpy.generic):
+            return x.item()
+        elif hasattr(x, '_to_dict'):
             return x._to_dict()
         elif inspect.ismethod(x):
             return {
@@ -67,5 +79,10 @@ def object_hook(x):
         return operator.attrgetter(name)(sys.modules[module_name])
     elif "__slice__" in x:
         return slice(*x["args"])
+    elif "__ndarray__" in x:
+        import numpy
+        data = bytearray(base64.b64decode(x["data"]))
+        array = numpy.frombuffer(data, dtype=x["dtype"])
+        return array.reshape(x["shape"])
     else:
         return x
@@ -1,3 +1,4 @@
 from .client import Client
+from .pool import ClientPool
 from .server import Server
 from .web_interface import WebInterface
@@ -1,8 +1,10 @@
 from .client import Client
+from .pool import ClientPool
 from .server import Server
 from .web_interface import WebInterface
 __all__ = [
     'Client',
+    'ClientPool',
     'Server',
     'WebInterface',
 ]
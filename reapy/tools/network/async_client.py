@@ -0,0 +1,240 @@
+"""Define AsyncClient class."""
+
+import asyncio
+
+from reapy.errors import DisconnectedClientError, DistError
+from . import codec
+from .web_interface import WebInterface
+
+import reapy.config
+
+
+def _call_api(name, *args, **kwargs):
+    """Call ``reapy.reascript_api`` function from its name."""
+    return getattr(reapy.reascript_api, name)(*args, **kwargs)
+
+
+class _AsyncAPI:
+
+    """
+    Awaitable counterparts of ``reapy.reascript_api`` functions.
+
+    Attributes are created on demand, so that no API name has to be
+    fetched beforehand.
+    """
+
+    def __init__(self, client):
+        self._client = client
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+
+        async def call(*args, **kwargs):
+            return await self._client.call(_call_api, name, *args, **kwargs)
+        call.__name__ = call.__qualname__ = name
+        setattr(self, name, call)
+        return call
+
+
+class AsyncClient:
+
+    """
+    ``asyncio`` client of the ``reapy`` dist API.
+
+    It speaks the same protocol as ``reapy.tools.network.Client``.
+    Several requests can be awaited concurrently (e.g. with
+    ``asyncio.gather``): they are sent right away on the same
+    connection, and results are dispatched to their callers as they
+    arrive.
+
+    Use ``AsyncClient.open`` (or ``reapy.aio.connect``) to create a
+    connected client.
+
+    Attributes
+    ----------
+    RPR : object
+        Namespace of awaitable ``reapy.reascript_api`` functions.
+    handshake : dict
+        Handshake received from the server. See ``Client.handshake``.
+
+    Examples
+    --------
+    >>> client = await AsyncClient.open(2306)
+    >>> tracks = await asyncio.gather(*(
+    ...     client.RPR.GetTrack(0, i) for i in range(100)
+    ... ))
+    >>> names = await asyncio.gather(*(
+    ...     client.get(reapy.Track(t), "name") for t in tracks
+    ... ))
+    >>> await client.close()
+    """
+
+    def __init__(self, reader, writer, handshake, codec):
+        self._reader, self._writer = reader, writer
+        self.handshake = handshake
+        self.address = handshake["address"]
+        self.codec = codec
+        self.RPR = _AsyncAPI(self)
+        self._next_request_id = 0
+        self._pending = {}
+        self._loop = asyncio.get_event_loop()
+        self._receiving = asyncio.ensure_future(self._receive_results())
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+        return False
+
+    async def _read_message(self):
+        length = int.from_bytes(await self._reader.readexactly(8), "little")
+        return await self._reader.readexactly(length)
+
+    async def _receive_results(self):
+        """Dispatch results to pending requests until disconnection."""
+        try:
+            while True:
+                result, _ = codec.loads(await self._read_message())
+                future = self._pending.pop(result["id"], None)
+                if future is not None and not future.done():
+                    future.set_result(result)
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(DisconnectedClientError())
+            self._pending.clear()
+
+    def _send(self, data):
+        self._writer.write(len(data).to_bytes(8, "little") + data)
+
+    async def call(self, function, *args, **kwargs):
+        """
+        Call a ``reapy`` function inside REAPER.
+
+        Parameters
+        ----------
+        function : callable
+            Function defined in ``reapy`` (e.g. a function of
+            ``reapy.reascript_api``, or a method of a reapy object
+            such as ``track.add_item``).
+        *args, **kwargs
+            Arguments of the call.
+
+        Returns
+        -------
+        object
+            Value returned by the function.
+        """
+        return await self.request(function, {"args": args, "kwargs": kwargs})
+
+    async def close(self):
+        """Close connection."""
+        self._receiving.cancel()
+        try:
+            await self._receiving
+        except asyncio.CancelledError:
+            pass
+        self._writer.close()
+        if hasattr(self._writer, "wait_closed"):
+            try:
+                await self._writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def get(self, obj, name):
+        """
+        Get attribute of a reapy object inside REAPER.
+
+        Parameters
+        ----------
+        obj : ReapyObject
+            Object whose attribute is read (e.g. ``reapy.Track(id)``).
+        name : str
+            Attribute name (e.g. ``"name"``).
+
+        Returns
+        -------
+        object
+            Attribute value.
+        """
+        return await self.call(getattr, obj, name)
+
+    @classmethod
+    async def open(cls, port, host="localhost", codecs=codec.CODECS):
+        """
+        Connect to ``reapy`` server.
+
+        Parameters
+        ----------
+        port : int
+            Port of the ``reapy`` server.
+        host : str, optional
+            Host of the ``reapy`` server (default="localhost").
+        codecs : tuple of str, optional
+            Preferred message codecs, by order of preference. See
+            ``reapy.tools.network.Client``.
+
+        Returns
+        -------
+        AsyncClient
+        """
+        reader, writer = await asyncio.open_connection(host, port)
+        length = int.from_bytes(await reader.readexactly(8), "little")
+        handshake, _ = codec.loads(await reader.readexactly(length))
+        return cls(
+            reader, writer, handshake,
+            codec.negotiate(codecs, handshake["codecs"])
+        )
+
+    async def request(self, function, input=None):
+        """
+        Send request and wait for its result.
+
+        Parameters
+        ----------
+        function : callable or dict
+            Function (or encoded function) to run inside REAPER.
+        input : dict, optional
+            Dict with keys ``"args"`` and ``"kwargs"``.
+
+        Returns
+        -------
+        object
+            Value returned by the requested function.
+
+        Raises
+        ------
+        DistError
+            If an error occurred while running the function inside
+            REAPER.
+        DisconnectedClientError
+            If the connection was closed before the result arrived.
+        """
+        if self._receiving.done():
+            raise DisconnectedClientError()
+        request_id = self._next_request_id
+        self._next_request_id += 1
+        future = self._loop.create_future()
+        self._pending[request_id] = future
+        request = {"id": request_id, "function": function, "input": input}
+        self._send(codec.dumps(request, self.codec, force=request_id == 0))
+        await self._writer.drain()
+        result = await future
+        if result["type"] == "error":
+            raise DistError(result["traceback"])
+        return result["value"]
+
+
+async def get_reapy_server_port(host="localhost"):
+    """
+    Return port of ``reapy`` server, as set in REAPER web interface.
+
+    The blocking HTTP request is run in the default executor.
+    """
+    interface = WebInterface(reapy.config.WEB_INTERFACE_PORT, host)
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(None, interface.get_reapy_server_port)
@@ -0,0 +1,202 @@
+"""Define AsyncClient class."""
+
+import asyncio
+import typing as ty
+
+from reapy.errors import DisconnectedClientError, DistError
+from . import codec
+from .web_interface import WebInterface
+
+import reapy.config
+
+
+def _call_api(name: str, *args: ty.Any, **kwargs: ty.Any) -> ty.Any:
+    """Call ``reapy.reascript_api`` function from its name."""
+    ...
+
+
+class _AsyncAPI:
+    """
+    Awaitable counterparts of ``reapy.reascript_api`` functions.
+
+    Attributes are created on demand, so that no API name has to be
+    fetched beforehand.
+    """
+    _client: AsyncClient
+
+    def __init__(self, client: AsyncClient) -> None:
+        ...
+
+    def __getattr__(
+        self, name: str
+    ) -> ty.Callable[..., ty.Coroutine[ty.Any, ty.Any, ty.Any]]:
+        ...
+
+
+class AsyncClient:
+    """
+    ``asyncio`` client of the ``reapy`` dist API.
+
+    It speaks the same protocol as ``reapy.tools.network.Client``.
+    Several requests can be awaited concurrently (e.g. with
+    ``asyncio.gather``): they are sent right away on the same
+    connection, and results are dispatched to their callers as they
+    arrive.
+
+    Use ``AsyncClient.open`` (or ``reapy.aio.connect``) to create a
+    connected client.
+
+    Attributes
+    ----------
+    RPR : object
+        Namespace of awaitable ``reapy.reascript_api`` functions.
+    handshake : dict
+        Handshake received from the server. See ``Client.handshake``.
+
+    Examples
+    --------
+    >>> client = await AsyncClient.open(2306)
+    >>> tracks = await asyncio.gather(*(
+    ...     client.RPR.GetTrack(0, i) for i in range(100)
+    ... ))
+    >>> names = await asyncio.gather(*(
+    ...     client.get(reapy.Track(t), "name") for t in tracks
+    ... ))
+    >>> await client.close()
+    """
+    RPR: _AsyncAPI
+    address: str
+    handshake: ty.Dict[str, ty.Any]
+    codec: str
+    _reader: asyncio.StreamReader
+    _writer: asyncio.StreamWriter
+    _next_request_id: int
+    _pending: ty.Dict[int, asyncio.Future]
+    _loop: asyncio.AbstractEventLoop
+    _receiving: asyncio.Future
+
+    def __init__(self, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter,
+                 handshake: ty.Dict[str, ty.Any], codec: str) -> None:
+        ...
+
+    async def __aenter__(self) -> AsyncClient:
+        ...
+
+    async def __aexit__(self, exc_type: ty.Any, exc_val: ty.Any,
+                        exc_tb: ty.Any) -> bool:
+        ...
+
+    async def _read_message(self) -> bytes:
+        ...
+
+    async def _receive_results(self) -> None:
+        """Dispatch results to pending requests until disconnection."""
+        ...
+
+    def _send(self, data: bytes) -> None:
+        ...
+
+    async def call(self, function: ty.Callable[..., ty.Any], *args: ty.Any,
+                   **kwargs: ty.Any) -> ty.Any:
+        """
+        Call a ``reapy`` function inside REAPER.
+
+        Parameters
+        ----------
+        function : callable
+            Function defined in ``reapy`` (e.g. a function of
+            ``reapy.reascript_api``, or a method of a reapy object
+            such as ``track.add_item``).
+        *args, **kwargs
+            Arguments of the call.
+
+        Returns
+        -------
+        object
+            Value returned by the function.
+        """
+        ...
+
+    async def close(self) -> None:
+        """Close connection."""
+        ...
+
+    async def get(self, obj: ty.Any, name: str) -> ty.Any:
+        """
+        Get attribute of a reapy object inside REAPER.
+
+        Parameters
+        ----------
+        obj : ReapyObject
+            Object whose attribute is read (e.g. ``reapy.Track(id)``).
+        name : str
+            Attribute name (e.g. ``"name"``).
+
+        Returns
+        -------
+        object
+            Attribute value.
+        """
+        ...
+
+    @classmethod
+    async def open(cls, port: int, host: str = "localhost",
+                   codecs: ty.Sequence[str] = codec.CODECS) -> AsyncClient:
+        """
+        Connect to ``reapy`` server.
+
+        Parameters
+        ----------
+        port : int
+            Port of the ``reapy`` server.
+        host : str, optional
+            Host of the ``reapy`` server (default="localhost").
+        codecs : tuple of str, optional
+            Preferred message codecs, by order of preference. See
+            ``reapy.tools.network.Client``.
+
+        Returns
+        -------
+        AsyncClient
+        """
+        ...
+
+    async def request(
+        self,
+        function: ty.Union[ty.Callable[..., ty.Any], ty.Dict[str, ty.Any]],
+        input: ty.Optional[ty.Dict[str, ty.Any]] = None
+    ) -> ty.Any:
+        """
+        Send request and wait for its result.
+
+        Parameters
+        ----------
+        function : callable or dict
+            Function (or encoded function) to run inside REAPER.
+        input : dict, optional
+            Dict with keys ``"args"`` and ``"kwargs"``.
+
+        Returns
+        -------
+        object
+            Value returned by the requested function.
+
+        Raises
+        ------
+        DistError
+            If an error occurred while running the function inside
+            REAPER.
+        DisconnectedClientError
+            If the connection was closed before the result arrived.
+        """
+        ...
+
+
+async def get_reapy_server_port(host: str = "localhost") -> int:
+    """
+    Return port of ``reapy`` server, as set in REAPER web interface.
+
+    The blocking HTTP request is run in the default executor.
+    """
+    ...
@@ -1,29 +1,290 @@
+import reapy
 from reapy.errors import DisconnectedClientError, DistError
-from reapy.tools import json
+from . import codec, tracing
+from .shared_memory import SharedBuffer
 from .socket import Socket
 
+import collections
+import ipaddress
+import os
+import threading
+import time
+
 
 class Client(Socket):
 
-    def __init__(self, port, host="localhost"):
+    """
+    Client part of the ``reapy`` dist API.
+
+    Requests are tagged with an ID so that several of them can be in
+    flight at the same time (see ``Client.submit``). The server
+    answers them in order of arrival.
+
+    Clients are thread-safe: each request is sent atomically, and
+    results are handed to the thread that waits for them. To issue
+    calls in parallel from several threads, use a ``ClientPool``.
+
+    When ``reapy.config.TRACE_CALLS`` is True, calls are traced (see
+    ``reapy.tools.network.tracing``).
+
+    Parameters
+    ----------
+    port : int
+        Port of the ``reapy`` server.
+    host : str, optional
+        Host of the ``reapy`` server (default="localhost").
+    max_in_flight : int, optional
+        Maximum number of requests that can be sent before waiting
+        for the first result (default=64).
+    codecs : tuple of str, optional
+        Preferred message codecs, by order of preference. The first
+        one supported by the server is used. Defaults to all codecs
+        supported by this version (i.e. binary, with JSON as
+        fallback).
+    connect_timeout : float, optional
+        Time in seconds after which connection and handshake are
+        aborted. If None (default), wait indefinitely.
+    shared_memory_size : int, optional
+        Size in bytes of shared buffers used for large messages when
+        the server runs on the same host (see
+        ``Socket.attach_shared_memory``). Buffers are only allocated
+        once a message of at least ``SHARED_MEMORY_THRESHOLD`` bytes
+        has been sent or received. Defaults to
+        ``reapy.config.SHARED_MEMORY_SIZE``. Set to 0 to only use
+        the socket.
+
+    Attributes
+    ----------
+    handshake : dict
+        Handshake received from the server, with keys
+        ``"reapy_version"``, ``"reaper_version"``, ``"api_key"``,
+        ``"codecs"``, ``"transports"`` and ``"address"``. See
+        ``Server._get_handshake``.
+    """
+
+    def __init__(
+        self, port, host="localhost", max_in_flight=64, codecs=codec.CODECS,
+        connect_timeout=None, shared_memory_size=None
+    ):
         super().__init__()
-        self._connect(port, host)
+        try:
+            self._connect(port, host, codecs, connect_timeout)
+        except BaseException:
+            # Don't leak socket when server can't be reached or sends
+            # an invalid handshake
+            self._socket.close()
+            raise
         self.port, self.host = port, host
+        self.max_in_flight = max_in_flight
+        self._next_request_id = 0
+        self._pending = collections.deque()
+        self._results = {}
+        self._traces = {}
+        self._lock = threading.RLock()
+        self._shared_paths = []
+        if shared_memory_size is None:
+            shared_memory_size = reapy.config.SHARED_MEMORY_SIZE
+        transports = self.handshake.get("transports", ())
+        if "shared_memory" not in transports or not self.is_local:
+            shared_memory_size = 0
+        # Size of shared buffers that are still to be allocated
+        self._shared_memory_size = shared_memory_size
+        self._has_received_large_message = False
 
-    def _connect(self, port, host):
+    def _connect(self, port, host, codecs, timeout=None):
+        self.settimeout(timeout)
         super().connect((host, port))
-        self.address = self.recv(timeout=None).decode("ascii")
+        self.handshake, _ = codec.loads(self.recv(timeout=timeout))
+        self.address = self.handshake["address"]
+        self.codec = codec.negotiate(codecs, self.handshake["codecs"])
+
+    def _enable_shared_memory(self):
+        """
+        Send large messages through shared memory.
+
+        It is called on first large message, so that connections that
+        only exchange small messages don't reserve memory. One buffer
+        of ``_shared_memory_size`` bytes is created for each direction
+        and attached by the server. Buffers are unlinked as soon as
+        both processes have mapped them, so that memory is freed even
+        if one of them crashes (except on Windows, where they are
+        unlinked when the client is closed).
+        """
+        size, self._shared_memory_size = self._shared_memory_size, 0
+        buffers = []
+        try:
+            for _ in range(2):
+                buffers.append(SharedBuffer.create(size))
+            send_buffer, recv_buffer = buffers
+            self._shared_recv = recv_buffer
+            self.request("SHARED_MEMORY", {
+                "args": (recv_buffer.path, send_buffer.path), "kwargs": {}
+            })
+            self._shared_send = send_buffer
+        except (OSError, DistError):  # Fall back to socket only
+            self._shared_recv = None
+            for buffer in buffers:
+                buffer.close()
+        for buffer in buffers:
+            try:
+                buffer.unlink()
+            except OSError:
+                self._shared_paths.append(buffer.path)
 
     def _get_result(self):
-        s = self.recv(timeout=None).decode()
-        return json.loads(s)
+        data = self.recv(timeout=None)
+        start = time.perf_counter()
+        if len(data) >= self.SHARED_MEMORY_THRESHOLD:
+            # Shared memory is enabled on next request
+            self._has_received_large_message = True
+        result = codec.loads(data)[0]
+        if "trace" in result:
+            result["trace"].update(
+                received=start, decode_time=time.perf_counter() - start,
+                result_size=len(data)
+            )
+        return result
 
-    def request(self, function, input=None):
-        request = {"function": function, "input": input}
-        request = json.dumps(request).encode()
-        self.send(request)
+    def _receive_next_result(self):
         result = self._get_result()
+        self._pending.popleft()
+        self._results[result["id"]] = result
+
+    def _record_trace(self, request_id, result_trace):
+        """Record trace of a call once its result is received."""
+        trace = self._traces.pop(request_id, None)
+        if trace is None:
+            return
+        function, start, request_size, encode_time, thread_id = trace
+        queue_time = result_trace["queue_time"]
+        server_time = result_trace["server_time"]
+        network_time = (
+            result_trace["received"] - start - encode_time - queue_time
+            - server_time
+        )
+        tracing.record(tracing.CallTrace(
+            function, start, request_size, result_trace["result_size"],
+            encode_time, max(network_time, 0), queue_time, server_time,
+            result_trace["decode_time"], thread_id
+        ))
+
+    def _submit_traced(self, request):
+        """Send request, asking the server for its timings."""
+        start = time.perf_counter()
+        request["trace"] = True
+        data = codec.dumps(request, self.codec, force=request["id"] == 0)
+        encode_time = time.perf_counter() - start
+        self.send(data)
+        self._traces[request["id"]] = (
+            tracing.get_function_name(request["function"]), start,
+            len(data), encode_time, threading.get_ident()
+        )
+
+    def close(self, *args, **kwargs):
+        super().close(*args, **kwargs)
+        for path in self._shared_paths:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._shared_paths = []
+
+    def get_result(self, request_id):
+        """
+        Wait for the result of a previously submitted request.
+
+        Parameters
+        ----------
+        request_id : int
+            ID returned by ``Client.submit``.
+
+        Returns
+        -------
+        object
+            Value returned by the requested function.
+
+        Raises
+        ------
+        DistError
+            If an error occurred while running the function inside
+            REAPER.
+        """
+        while True:
+            with self._lock:
+                if request_id in self._results:
+                    result = self._results.pop(request_id)
+                    if "trace" in result:
+                        self._record_trace(request_id, result["trace"])
+                    break
+                self._receive_next_result()
         if result["type"] == "result":
             return result["value"]
         elif result["type"] == "error":
             raise DistError(result["traceback"])
+
+    @property
+    def is_local(self):
+        """
+        Whether the server runs on the same host as the client.
+
+        :type: bool
+        """
+        peer_host = self._socket.getpeername()[0]
+        if peer_host == self._socket.getsockname()[0]:
+            return True
+        return ipaddress.ip_address(peer_host).is_loopback
+
+    def request(self, function, input=None):
+        return self.get_result(self.submit(function, input))
+
+    def send(self, data):
+        """Send data, enabling shared memory on first large message."""
+        if self._shared_memory_size and (
+            self._has_received_large_message
+            or len(data) >= self.SHARED_MEMORY_THRESHOLD
+        ):
+            self._enable_shared_memory()
+        super().send(data)
+
+    def submit(self, function, input=None):
+        """
+        Send request without waiting for its result.
+
+        When ``max_in_flight`` requests are already waiting for their
+        results, the oldest result is received first.
+
+        Parameters
+        ----------
+        function : callable or str
+            Function to run inside REAPER.
+        input : dict, optional
+            Dict with keys ``"args"`` and ``"kwargs"``.
+
+        Returns
+        -------
+        request_id : int
+            ID to pass to ``Client.get_result``.
+
+        Examples
+        --------
+        >>> client = reapy.tools.network.machines.get_selected_client()
+        >>> ids = [
+        ...     client.submit(RPR.GetTrack, {"args": (0, i), "kwargs": {}})
+        ...     for i in range(500)
+        ... ]
+        >>> tracks = [client.get_result(i) for i in ids]
+        """
+        with self._lock:
+            while len(self._pending) >= self.max_in_flight:
+                self._receive_next_result()
+            request_id = self._next_request_id
+            self._next_request_id += 1
+            request = {"id": request_id, "function": function, "input": input}
+            if reapy.config.TRACE_CALLS:
+                self._submit_traced(request)
+            else:
+                self.send(codec.dumps(
+                    request, self.codec, force=request_id == 0
+                ))
+            self._pending.append(request_id)
+        return request_id
@@ -1,24 +1,183 @@
+import reapy
 from reapy.errors import DisconnectedClientError, DistError
-from reapy.tools import json
+from . import codec, tracing
+from .shared_memory import SharedBuffer
 from .socket import Socket
+import collections
+import ipaddress
+import os
+import threading
+import time
 import typing as ty
 
 
 class Client(Socket):
+    """
+    Client part of the ``reapy`` dist API.
+
+    Requests are tagged with an ID so that several of them can be in
+    flight at the same time (see ``Client.submit``). The server
+    answers them in order of arrival.
+
+    Clients are thread-safe: each request is sent atomically, and
+    results are handed to the thread that waits for them. To issue
+    calls in parallel from several threads, use a ``ClientPool``.
+
+    When ``reapy.config.TRACE_CALLS`` is True, calls are traced (see
+    ``reapy.tools.network.tracing``).
+
+    Parameters
+    ----------
+    port : int
+        Port of the ``reapy`` server.
+    host : str, optional
+        Host of the ``reapy`` server (default="localhost").
+    max_in_flight : int, optional
+        Maximum number of requests that can be sent before waiting
+        for the first result (default=64).
+    codecs : tuple of str, optional
+        Preferred message codecs, by order of preference. The first
+        one supported by the server is used. Defaults to all codecs
+        supported by this version (i.e. binary, with JSON as
+        fallback).
+    connect_timeout : float, optional
+        Time in seconds after which connection and handshake are
+        aborted. If None (default), wait indefinitely.
+    shared_memory_size : int, optional
+        Size in bytes of shared buffers used for large messages when
+        the server runs on the same host (see
+        ``Socket.attach_shared_memory``). Buffers are only allocated
+        once a message of at least ``SHARED_MEMORY_THRESHOLD`` bytes
+        has been sent or received. Defaults to
+        ``reapy.config.SHARED_MEMORY_SIZE``. Set to 0 to only use
+        the socket.
+
+    Attributes
+    ----------
+    handshake : dict
+        Handshake received from the server, with keys
+        ``"reapy_version"``, ``"reaper_version"``, ``"api_key"``,
+        ``"codecs"``, ``"transports"`` and ``"address"``. See
+        ``Server._get_handshake``.
+    """
     address: str
+    codec: str
+    handshake: ty.Dict[str, ty.Any]
     port: int
     host: str
+    max_in_flight: int
+    _next_request_id: int
+    _pending: ty.Deque[int]
+    _results: ty.Dict[int, ty.Dict[str, ty.Any]]
+    _traces: ty.Dict[int, ty.Tuple[str, float, int, float, int]]
+    _lock: threading.RLock
+    _shared_paths: ty.List[str]
+    _shared_memory_size: int
+    _has_received_large_message: bool
+
+    def __init__(self, port: int, host: str = 'localhost',
+                 max_in_flight: int = 64,
+                 codecs: ty.Sequence[str] = codec.CODECS,
+                 connect_timeout: ty.Optional[float] = None,
+                 shared_memory_size: ty.Optional[int] = None) -> None:
+        ...
 
-    def __init__(self, port: int, host: str = 'localhost') -> None:
+    def _connect(self, port: int, host: str, codecs: ty.Sequence[str],
+                 timeout: ty.Optional[float] = None) -> None:
         ...
 
-    def _connect(self, port: int, host: str) -> None:
+    def _enable_shared_memory(self) -> None:
+        """
+        Send large messages through shared memory.
+
+        It is called on first large message, so that connections that
+        only exchange small messages don't reserve memory. One buffer
+        of ``_shared_memory_size`` bytes is created for each direction
+        and attached by the server. Buffers are unlinked as soon as
+        both processes have mapped them, so that memory is freed even
+        if one of them crashes (except on Windows, where they are
+        unlinked when the client is closed).
+        """
         ...
 
     def _get_result(self) -> ty.Any:
         ...
 
+    def _receive_next_result(self) -> None:
+        ...
+
+    def _record_trace(
+        self, request_id: int, result_trace: ty.Dict[str, float]
+    ) -> None:
+        """Record trace of a call once its result is received."""
+        ...
+
+    def _submit_traced(self, request: ty.Dict[str, ty.Any]) -> None:
+        """Send request, asking the server for its timings."""
+        ...
+
+    def close(self, *args: ty.Any, **kwargs: ty.Any) -> None:
+        ...
+
+    def get_result(self, request_id: int) -> ty.Any:
+        """
+        Wait for the result of a previously submitted request.
+
+        Parameters
+        ----------
+        request_id : int
+            ID returned by ``Client.submit``.
+
+        Returns
+        -------
+        object
+            Value returned by the requested function.
+
+        Raises
+        ------
+        DistError
+            If an error occurred while running the function inside
+            REAPER.
+        """
+        ...
+
+    @property
+    def is_local(self) -> bool:
+        """
+        Whether the server runs on the same host as the client.
+
+        :type: bool
+        """
+        ...
+
     def request(self,
                 function: ty.Callable[..., ty.Any],
                 input: ty.Optional[object] = None) -> ty.Any:
         ...
+
+    def send(self, data: bytes) -> None:
+        """Send data, enabling shared memory on first large message."""
+        ...
+
+    def submit(self,
+               function: ty.Union[ty.Callable[..., ty.Any], str],
+               input: ty.Optional[object] = None) -> int:
+        """
+        Send request without waiting for its result.
+
+        When ``max_in_flight`` requests are already waiting for their
+        results, the oldest result is received first.
+
+        Parameters
+        ----------
+        function : callable or str
+            Function to run inside REAPER.
+        input : dict, optional
+            Dict with keys ``"args"`` and ``"kwargs"``.
+
+        Returns
+        -------
+        request_id : int
+            ID to pass to ``Client.get_result``.
+        """
+        ...
@@ -0,0 +1,76 @@
+"""Select the encoding of messages exchanged by the dist API.
+
+Binary messages start with ``reapy.tools.binary.MAGIC`` while JSON
+messages always start with ``{``, so that the codec of any message
+can be detected on reception.
+
+The binary codec is only faster than JSON for messages holding
+numeric arrays. When it is negotiated, messages without arrays are
+still sent as JSON (see ``dumps``). The first request of a client is
+always sent in binary, which tells the server that the client accepts
+binary results.
+"""
+
+from reapy.tools import binary, json
+
+
+#: Codecs supported by this version, by order of preference.
+CODECS = ("binary", "json")
+
+
+def dumps(x, codec="json", force=False):
+    """
+    Encode message.
+
+    Parameters
+    ----------
+    x : object
+        Message to encode.
+    codec : {"binary", "json"}, optional
+        Codec accepted by the receiver (default="json"). With
+        ``"binary"``, only messages holding numeric arrays (see
+        ``reapy.tools.binary.has_arrays``) are encoded in binary.
+    force : bool, optional
+        Whether to encode message with ``codec`` even if it holds no
+        arrays (default=False).
+
+    Returns
+    -------
+    bytes
+    """
+    if codec == "binary" and (force or binary.has_arrays(x)):
+        return binary.dumps(x)
+    return json.dumps(x).encode()
+
+
+def loads(data):
+    """
+    Decode message and detect its codec.
+
+    Parameters
+    ----------
+    data : bytes
+        Encoded message.
+
+    Returns
+    -------
+    x : object
+        Decoded message.
+    codec : str
+        Name of the codec the message was encoded with.
+    """
+    if data.startswith(binary.MAGIC):
+        return binary.loads(data), "binary"
+    return json.loads(data.decode()), "json"
+
+
+def negotiate(preferred, supported):
+    """
+    Return first codec of ``preferred`` that is in ``supported``.
+
+    Falls back to ``"json"`` which is supported by all versions.
+    """
+    for codec in preferred:
+        if codec in supported:
+            return codec
+    return "json"
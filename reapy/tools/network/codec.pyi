@@ -0,0 +1,70 @@
+"""Select the encoding of messages exchanged by the dist API.
+
+Binary messages start with ``reapy.tools.binary.MAGIC`` while JSON
+messages always start with ``{``, so that the codec of any message
+can be detected on reception.
+
+The binary codec is only faster than JSON for messages holding
+numeric arrays. When it is negotiated, messages without arrays are
+still sent as JSON (see ``dumps``). The first request of a client is
+always sent in binary, which tells the server that the client accepts
+binary results.
+"""
+
+from reapy.tools import binary, json
+import typing as ty
+
+
+CODECS: ty.Tuple[str, ...]
+
+
+def dumps(x: ty.Any, codec: str = "json", force: bool = False) -> bytes:
+    """
+    Encode message.
+
+    Parameters
+    ----------
+    x : object
+        Message to encode.
+    codec : {"binary", "json"}, optional
+        Codec accepted by the receiver (default="json"). With
+        ``"binary"``, only messages holding numeric arrays (see
+        ``reapy.tools.binary.has_arrays``) are encoded in binary.
+    force : bool, optional
+        Whether to encode message with ``codec`` even if it holds no
+        arrays (default=False).
+
+    Returns
+    -------
+    bytes
+    """
+    ...
+
+
+def loads(data: bytes) -> ty.Tuple[ty.Any, str]:
+    """
+    Decode message and detect its codec.
+
+    Parameters
+    ----------
+    data : bytes
+        Encoded message.
+
+    Returns
+    -------
+    x : object
+        Decoded message.
+    codec : str
+        Name of the codec the message was encoded with.
+    """
+    ...
+
+
+def negotiate(preferred: ty.Iterable[str],
+              supported: ty.Iterable[str]) -> str:
+    """
+    Return first codec of ``preferred`` that is in ``supported``.
+
+    Falls back to ``"json"`` which is supported by all versions.
+    """
+    ...
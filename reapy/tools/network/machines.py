@@ -1,19 +1,130 @@
+import contextvars
 import importlib
+import json
+import os
+import re
+import struct
 import sys
 import warnings
 
 import reapy
 import reapy.config
 from reapy import errors
-from . import client, web_interface
+from . import pool, web_interface
+from .client import Client
 
 
+#: Machine selected by default, as a ``ClientPool`` (or None from
+#: inside REAPER).
 CLIENT = None
+#: Client pools of registered machines, by host.
 CLIENTS = {None: None}
+#: Machine selected in current context by ``connect`` used as a
+#: context manager. Overrides ``CLIENT`` when set.
+_CONTEXT_CLIENT = contextvars.ContextVar("reapy_context_client")
+_UNSET = object()
+
+
+def _get_machine_cache_path(host):
+    """Return path of the cached handshake of a machine, or None."""
+    directory = reapy.config.CACHE_DIRECTORY
+    if directory is not None:
+        file_name = re.sub(r"[^\w.-]", "_", host) + ".json"
+        return os.path.join(directory, "machines", file_name)
+
+
+def _read_machine_cache(host):
+    """
+    Return cached ``reapy`` server port and handshake of a machine.
+
+    Returns
+    -------
+    cache : dict or None
+        Dict with keys ``"port"`` and ``"handshake"``, or None if
+        the machine is not cached.
+    """
+    path = _get_machine_cache_path(host)
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, TypeError, ValueError):
+        return None
+
+
+def _remove_machine_cache(host):
+    """Delete cached ``reapy`` server port and handshake of a machine."""
+    path = _get_machine_cache_path(host)
+    if path is not None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _select_pool(client_pool):
+    """Select pool in current context if a context is active."""
+    global CLIENT
+    if _CONTEXT_CLIENT.get(_UNSET) is _UNSET:
+        CLIENT = client_pool
+    else:
+        _CONTEXT_CLIENT.set(client_pool)
+
+
+def _update_api():
+    """Update ``reapy.reascript_api`` after machine selection.
+
+    Outside REAPER, API functions are resolved from the selected
+    machine at call time, so nothing has to be done. Inside REAPER,
+    local functions are module attributes: the module is reloaded to
+    switch between them and functions of a slave machine.
+    """
+    if not hasattr(reapy, 'reascript_api'):  # False during initial import
+        return
+    if hasattr(sys.modules["__main__"], "obj"):
+        importlib.reload(reapy.reascript_api)
+
+
+def _write_machine_cache(host, client_pool):
+    """Cache ``reapy`` server port and handshake of a machine."""
+    path = _get_machine_cache_path(host)
+    if path is None:
+        return
+    handshake = dict(client_pool.handshake)
+    del handshake["address"]
+    cache = {"port": client_pool.port, "handshake": handshake}
+    if _read_machine_cache(host) == cache:
+        return
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        temp_path = "{}.{}.tmp".format(path, os.getpid())
+        with open(temp_path, "w") as f:
+            json.dump(cache, f)
+        os.replace(temp_path, path)
+    except OSError:
+        pass
 
 
 def get_selected_client():
-    return CLIENT
+    """Return connection of current thread to the selected machine.
+
+    Returns
+    -------
+    client : Client or None
+        None is returned when running from inside REAPER and
+        no slave machine is selected.
+    """
+    client_pool = get_selected_pool()
+    return None if client_pool is None else client_pool.get_client()
+
+
+def get_selected_pool():
+    """Return client pool of the selected machine.
+
+    Returns
+    -------
+    client_pool : ClientPool or None
+    """
+    return _CONTEXT_CLIENT.get(CLIENT)
 
 
 def get_selected_machine_host():
@@ -25,7 +136,8 @@ def get_selected_machine_host():
         None is returned when running from inside REAPER and
         no slave machine is selected.
     """
-    return None if CLIENT is None else CLIENT.host
+    client_pool = get_selected_pool()
+    return None if client_pool is None else client_pool.host
 
 
 def reconnect():
@@ -70,7 +182,9 @@ class connect:
 
     reapy instructions will now be run on the selected machine.
     If used as a context manager, the slave machine will only be
-    selected in the corresponding context.
+    selected in the corresponding context. Such contexts are local to
+    the current thread (or ``asyncio`` task), so that other threads
+    keep using their own machine.
 
     Parameters
     ----------
@@ -85,26 +199,26 @@ class connect:
     """
 
     def __init__(self, host=None):
-        global CLIENT
-        self.previous_client = CLIENT
+        self.previous_client = get_selected_pool()
         try:
             if host not in CLIENTS:
                 register_machine(host)
-            CLIENT = CLIENTS[host]
-            if hasattr(reapy, 'reascript_api'):  # False during initial import
-                importlib.reload(reapy.reascript_api)
+            _select_pool(CLIENTS[host])
+            _update_api()
         except errors.DisabledDistAPIError as e:
             if host and host != 'localhost':
                 raise e
             warnings.warn(errors.DisabledDistAPIWarning())
+        self.client = get_selected_pool()
 
     def __enter__(self):
-        pass
+        # Only select machine in current context
+        _select_pool(self.previous_client)
+        self._token = _CONTEXT_CLIENT.set(self.client)
 
     def __exit__(self, exc_type, exc_value, traceback):
-        global CLIENT
-        CLIENT = self.previous_client
-        importlib.reload(reapy.reascript_api)
+        _CONTEXT_CLIENT.reset(self._token)
+        _update_api()
 
 
 class connect_to_default_machine(connect):
@@ -118,6 +232,11 @@ class connect_to_default_machine(connect):
 def register_machine(host):
     """Register a slave machine.
 
+    The ``reapy`` server port and handshake of each machine are cached
+    on disk (see ``reapy.config.CACHE_DIRECTORY``). Next time, the
+    cached port is tried first, so that the web interface is only
+    requested if the server has moved or stopped.
+
     Parameters
     ----------
     host : str
@@ -130,9 +249,26 @@ def register_machine(host):
     if reapy.is_inside_reaper() and host == "localhost":
         msg = "A REAPER instance can not connect to istelf."
         raise errors.InsideREAPERError(msg)
-    interface_port = reapy.config.WEB_INTERFACE_PORT
-    interface = web_interface.WebInterface(interface_port, host)
-    CLIENTS[host] = client.Client(interface.get_reapy_server_port(), host)
+    client_pool = None
+    cache = _read_machine_cache(host)
+    if cache is not None:
+        try:
+            # Same time out as web interface requests. It only applies
+            # to this check, not to connections opened by the pool.
+            client = Client(cache["port"], host, connect_timeout=.5)
+        except (OSError, LookupError, TypeError, ValueError, struct.error):
+            # Server has moved or stopped, or another process answers
+            # on the cached port with an invalid handshake.
+            _remove_machine_cache(host)
+        else:
+            client_pool = pool.ClientPool(cache["port"], host, client=client)
+    if client_pool is None:
+        interface_port = reapy.config.WEB_INTERFACE_PORT
+        interface = web_interface.WebInterface(interface_port, host)
+        port = interface.get_reapy_server_port()
+        client_pool = pool.ClientPool(port, host)
+    CLIENTS[host] = client_pool
+    _write_machine_cache(host, client_pool)
 
 
 if not reapy.is_inside_reaper():
@@ -1,4 +1,9 @@
+import contextvars
 import importlib
+import json
+import os
+import re
+import struct
 import sys
 import warnings
 import typing as ty
@@ -8,14 +13,78 @@ from types import TracebackType
 import reapy
 import reapy.config
 from reapy import errors
-from . import client, web_interface
+from . import client, pool, web_interface
 
 
-CLIENT: ty.Optional[client.Client]
-CLIENTS: ty.Dict[ty.Optional[str], ty.Optional[client.Client]]
+CLIENT: ty.Optional[pool.ClientPool]
+CLIENTS: ty.Dict[ty.Optional[str], ty.Optional[pool.ClientPool]]
+_CONTEXT_CLIENT: contextvars.ContextVar[ty.Optional[pool.ClientPool]]
+_UNSET: object
+
+
+def _get_machine_cache_path(host: str) -> ty.Optional[str]:
+    """Return path of the cached handshake of a machine, or None."""
+    ...
+
+
+def _read_machine_cache(host: str) -> ty.Optional[ty.Dict[str, ty.Any]]:
+    """
+    Return cached ``reapy`` server port and handshake of a machine.
+
+    Returns
+    -------
+    cache : dict or None
+        Dict with keys ``"port"`` and ``"handshake"``, or None if
+        the machine is not cached.
+    """
+    ...
+
+
+def _remove_machine_cache(host: str) -> None:
+    """Delete cached ``reapy`` server port and handshake of a machine."""
+    ...
+
+
+def _select_pool(client_pool: ty.Optional[pool.ClientPool]) -> None:
+    """Select pool in current context if a context is active."""
+    ...
+
+
+def _update_api() -> None:
+    """Update ``reapy.reascript_api`` after machine selection.
+
+    Outside REAPER, API functions are resolved from the selected
+    machine at call time, so nothing has to be done. Inside REAPER,
+    local functions are module attributes: the module is reloaded to
+    switch between them and functions of a slave machine.
+    """
+    ...
+
+
+def _write_machine_cache(host: str, client_pool: pool.ClientPool) -> None:
+    """Cache ``reapy`` server port and handshake of a machine."""
+    ...
 
 
 def get_selected_client() -> ty.Optional[client.Client]:
+    """Return connection of current thread to the selected machine.
+
+    Returns
+    -------
+    client : Client or None
+        None is returned when running from inside REAPER and
+        no slave machine is selected.
+    """
+    ...
+
+
+def get_selected_pool() -> ty.Optional[pool.ClientPool]:
+    """Return client pool of the selected machine.
+
+    Returns
+    -------
+    client_pool : ClientPool or None
+    """
     ...
 
 
@@ -63,7 +132,9 @@ class connect:
 
     reapy instructions will now be run on the selected machine.
     If used as a context manager, the slave machine will only be
-    selected in the corresponding context.
+    selected in the corresponding context. Such contexts are local to
+    the current thread (or ``asyncio`` task), so that other threads
+    keep using their own machine.
 
     Parameters
     ----------
@@ -77,7 +148,9 @@ class connect:
         Connect to default slave machine (i.e. local REAPER instance).
     """
 
-    previous_client: ty.Optional[client.Client]
+    previous_client: ty.Optional[pool.ClientPool]
+    client: ty.Optional[pool.ClientPool]
+    _token: contextvars.Token
 
     def __init__(self, host: ty.Optional[str] = None) -> None:
         ...
@@ -103,6 +176,11 @@ class connect_to_default_machine(connect):
 def register_machine(host: str) -> None:
     """Register a slave machine.
 
+    The ``reapy`` server port and handshake of each machine are cached
+    on disk (see ``reapy.config.CACHE_DIRECTORY``). Next time, the
+    cached port is tried first, so that the web interface is only
+    requested if the server has moved or stopped.
+
     Parameters
     ----------
     host : str
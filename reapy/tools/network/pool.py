@@ -0,0 +1,114 @@
+"""Define ClientPool class."""
+
+import threading
+import weakref
+
+import reapy
+from .client import Client
+
+
+class _Binding:
+
+    """Thread-local reference to the connection of a thread."""
+
+    __slots__ = "client", "__weakref__"
+
+    def __init__(self, client):
+        self.client = client
+
+
+class ClientPool:
+
+    """
+    Pool of connections to a ``reapy`` server.
+
+    Each thread is bound to a connection on its first call and keeps
+    it until it ends, so that requests of a thread (including
+    ``inside_reaper`` contexts) always go through the same connection.
+    Connections are opened on demand, and each new thread is bound to
+    the connection used by the fewest threads. Up to ``size`` threads
+    can thus issue calls in parallel. Beyond that, threads share
+    connections.
+
+    Parameters
+    ----------
+    port : int
+        Port of the ``reapy`` server.
+    host : str, optional
+        Host of the ``reapy`` server (default="localhost").
+    size : int, optional
+        Maximum number of connections. Defaults to
+        ``reapy.config.CLIENT_POOL_SIZE``.
+    client : Client, optional
+        Open connection to the server, used as first connection of
+        the pool. By default, it is opened by the pool.
+
+    Examples
+    --------
+    >>> pool = ClientPool(2306)
+    >>> client = pool.get_client()  # Connection of current thread
+    """
+
+    def __init__(self, port, host="localhost", size=None,
+                 client=None):
+        self.port, self.host = port, host
+        self.size = reapy.config.CLIENT_POOL_SIZE if size is None else size
+        if self.size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._clients = [] if client is None else [client]
+        self._n_threads = [0] * len(self._clients)
+        self.get_client()  # Fail early if server can't be reached
+
+    def _bind(self):
+        with self._lock:
+            if len(self._clients) < self.size and 0 not in self._n_threads:
+                self._clients.append(Client(self.port, self.host))
+                self._n_threads.append(0)
+            index = self._n_threads.index(min(self._n_threads))
+            self._n_threads[index] += 1
+            binding = _Binding(self._clients[index])
+        weakref.finalize(binding, self._unbind, index)
+        return binding
+
+    def _unbind(self, index):
+        with self._lock:
+            self._n_threads[index] -= 1
+
+    def close(self):
+        """Close all connections."""
+        with self._lock:
+            for client in self._clients:
+                client.close()
+
+    def get_client(self):
+        """
+        Return connection of current thread.
+
+        Returns
+        -------
+        Client
+        """
+        binding = getattr(self._local, "binding", None)
+        if binding is None:
+            binding = self._local.binding = self._bind()
+        return binding.client
+
+    @property
+    def handshake(self):
+        """
+        Handshake received from the server. See ``Client.handshake``.
+
+        :type: dict
+        """
+        return self._clients[0].handshake
+
+    @property
+    def n_connections(self):
+        """
+        Number of open connections.
+
+        :type: int
+        """
+        return len(self._clients)
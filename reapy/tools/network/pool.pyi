@@ -0,0 +1,98 @@
+"""Define ClientPool class."""
+
+import threading
+import typing as ty
+import weakref
+
+import reapy
+from .client import Client
+
+
+class _Binding:
+    """Thread-local reference to the connection of a thread."""
+    client: Client
+
+    def __init__(self, client: Client) -> None:
+        ...
+
+
+class ClientPool:
+    """
+    Pool of connections to a ``reapy`` server.
+
+    Each thread is bound to a connection on its first call and keeps
+    it until it ends, so that requests of a thread (including
+    ``inside_reaper`` contexts) always go through the same connection.
+    Connections are opened on demand, and each new thread is bound to
+    the connection used by the fewest threads. Up to ``size`` threads
+    can thus issue calls in parallel. Beyond that, threads share
+    connections.
+
+    Parameters
+    ----------
+    port : int
+        Port of the ``reapy`` server.
+    host : str, optional
+        Host of the ``reapy`` server (default="localhost").
+    size : int, optional
+        Maximum number of connections. Defaults to
+        ``reapy.config.CLIENT_POOL_SIZE``.
+    client : Client, optional
+        Open connection to the server, used as first connection of
+        the pool. By default, it is opened by the pool.
+
+    Examples
+    --------
+    >>> pool = ClientPool(2306)
+    >>> client = pool.get_client()  # Connection of current thread
+    """
+    port: int
+    host: str
+    size: int
+    _lock: threading.Lock
+    _local: threading.local
+    _clients: ty.List[Client]
+    _n_threads: ty.List[int]
+
+    def __init__(self, port: int, host: str = "localhost",
+                 size: ty.Optional[int] = None,
+                 client: ty.Optional[Client] = None) -> None:
+        ...
+
+    def _bind(self) -> _Binding:
+        ...
+
+    def _unbind(self, index: int) -> None:
+        ...
+
+    def close(self) -> None:
+        """Close all connections."""
+        ...
+
+    def get_client(self) -> Client:
+        """
+        Return connection of current thread.
+
+        Returns
+        -------
+        Client
+        """
+        ...
+
+    @property
+    def handshake(self) -> ty.Dict[str, ty.Any]:
+        """
+        Handshake received from the server. See ``Client.handshake``.
+
+        :type: dict
+        """
+        ...
+
+    @property
+    def n_connections(self) -> int:
+        """
+        Number of open connections.
+
+        :type: int
+        """
+        ...
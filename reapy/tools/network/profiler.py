@@ -0,0 +1,285 @@
+"""
+Profile requests processed by the ``reapy`` server.
+
+Client-side tracing (see ``reapy.tools.network.tracing``) only sees
+the requested functions. Functions decorated with
+``reapy.inside_reaper`` run entirely inside REAPER, and the API calls
+or ``reapy`` functions they make there are invisible to the client.
+
+When profiling is enabled, the server times each request it runs and
+aggregates call counts, total and maximum times per function. A
+fraction of requests can also be run under ``cProfile``, so that the
+nested functions blocking REAPER's UI thread show up with their
+cumulative times.
+
+Profiling is controlled and queried from outside REAPER with the
+functions of this module, which act on the server of the selected
+machine.
+
+Examples
+--------
+>>> from reapy.tools.network import profiler
+>>> profiler.enable(sample_rate=.1)
+>>> regions = reapy.Project().regions
+>>> for name, s in profiler.get_stats().items():
+...     print(name, s.n_calls, s.total_time, s.max_time)
+>>> for entry in profiler.get_profile(limit=10):
+...     print(entry.function, entry.n_calls, entry.cumulative_time)
+>>> profiler.disable()
+"""
+
+import collections
+import cProfile
+import os
+import random
+import time
+
+import reapy
+from reapy import errors
+from . import tracing
+
+
+_PACKAGE_DIRECTORY = os.path.dirname(os.path.dirname(reapy.__file__))
+
+
+ProfileEntry = collections.namedtuple("ProfileEntry", (
+    "function", "n_calls", "own_time", "cumulative_time"
+))
+ProfileEntry.__doc__ = """
+Function profiled by ``cProfile`` in sampled requests.
+
+Times are in seconds, summed over sampled requests. ``own_time``
+excludes time spent in subfunctions, whereas ``cumulative_time``
+includes it.
+"""
+
+ServerCallStats = collections.namedtuple("ServerCallStats", (
+    "n_calls", "total_time", "mean_time", "max_time"
+))
+ServerCallStats.__doc__ = """
+Statistics of the requests to a function run by the server.
+
+Times are in seconds, and only account for the execution of the
+function inside REAPER.
+"""
+
+
+class Profiler:
+
+    """
+    Profiler of requests run by a ``Server``.
+
+    Each ``Server`` has its own profiler, shared by all connections.
+    It is disabled by default.
+
+    Attributes
+    ----------
+    is_enabled : bool
+        Whether requests are timed.
+    sample_rate : float
+        Fraction of timed requests that are run under ``cProfile``.
+    """
+
+    _COMMANDS = ("disable", "enable", "get_profile", "get_stats", "reset")
+
+    def __init__(self):
+        self.is_enabled = False
+        self.sample_rate = 0.
+        self.reset()
+
+    def call(self, function, *args, **kwargs):
+        """
+        Run function and record its execution time.
+
+        Parameters
+        ----------
+        function : callable
+        *args, **kwargs
+            Arguments of the function.
+
+        Returns
+        -------
+        object
+            Value returned by the function.
+        """
+        start = time.perf_counter()
+        try:
+            if self.sample_rate and random.random() < self.sample_rate:
+                self._n_sampled += 1
+                return self._profile.runcall(function, *args, **kwargs)
+            return function(*args, **kwargs)
+        finally:
+            duration = time.perf_counter() - start
+            name = tracing.get_function_name(function)
+            stats = self._stats.setdefault(name, [0, 0., 0.])
+            stats[0] += 1
+            stats[1] += duration
+            stats[2] = max(stats[2], duration)
+
+    def disable(self):
+        """Stop timing requests. Recorded statistics are kept."""
+        self.is_enabled = False
+
+    def enable(self, sample_rate=0.):
+        """
+        Start timing requests.
+
+        Parameters
+        ----------
+        sample_rate : float, optional
+            Fraction of requests to run under ``cProfile``
+            (default=0).
+        """
+        self.is_enabled = True
+        self.sample_rate = sample_rate
+
+    def get_profile(self, limit=None):
+        """
+        Return ``cProfile`` statistics aggregated over sampled requests.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Maximum number of functions to return. By default, all
+            profiled functions are returned.
+
+        Returns
+        -------
+        profile : list of list
+            Function name, number of calls, own time and cumulative
+            time of each function, by decreasing cumulative time.
+        """
+        if not self._n_sampled:
+            return []
+        self._profile.create_stats()
+        profile = [
+            [_get_profile_name(key), n_calls, own_time, cumulative_time]
+            for key, (_, n_calls, own_time, cumulative_time, _)
+            in self._profile.stats.items()
+        ]
+        profile.sort(key=lambda entry: entry[3], reverse=True)
+        return profile[:limit]
+
+    def get_stats(self):
+        """
+        Return execution statistics of requests, per function.
+
+        Returns
+        -------
+        stats : dict
+            Keys are function names, and values are lists with the
+            number of calls, total and maximum times.
+        """
+        return {name: list(stats) for name, stats in self._stats.items()}
+
+    def reset(self):
+        """Delete recorded statistics and profile."""
+        self._stats = {}
+        self._profile = cProfile.Profile()
+        self._n_sampled = 0
+
+    def run_command(self, command, *args, **kwargs):
+        """
+        Run a profiler command requested by a client.
+
+        Parameters
+        ----------
+        command : str
+            Name of a public method of ``Profiler`` (except ``call``).
+        *args, **kwargs
+            Arguments of the method.
+
+        Returns
+        -------
+        object
+            Value returned by the method.
+        """
+        if command not in self._COMMANDS:
+            raise ValueError("Unknown profiler command: {}".format(command))
+        return getattr(self, command)(*args, **kwargs)
+
+
+def _get_profile_name(key):
+    """Return name of a function from its ``cProfile`` key."""
+    filename, line, name = key
+    if filename == "~":  # Built-in function
+        return name
+    if filename.startswith(_PACKAGE_DIRECTORY):
+        filename = os.path.relpath(filename, _PACKAGE_DIRECTORY)
+    return "{}:{}({})".format(filename, line, name)
+
+
+def _request(command, *args, **kwargs):
+    """Send profiler command to the server of the selected machine."""
+    client = reapy.tools.network.machines.get_selected_client()
+    if client is None:
+        raise errors.InsideREAPERError(
+            "The reapy server can only be profiled from outside REAPER."
+        )
+    return client.request("PROFILER", {
+        "args": (command, ) + args, "kwargs": kwargs
+    })
+
+
+def disable():
+    """Stop profiling requests. Recorded statistics are kept."""
+    _request("disable")
+
+
+def enable(sample_rate=0.):
+    """
+    Start profiling requests.
+
+    Parameters
+    ----------
+    sample_rate : float, optional
+        Fraction of requests to run under ``cProfile`` (default=0).
+        Profiling adds overhead to sampled requests, so that
+        ``sample_rate`` should be kept low when measuring latency.
+    """
+    _request("enable", sample_rate)
+
+
+def get_profile(limit=None):
+    """
+    Return ``cProfile`` statistics of sampled requests.
+
+    Functions called inside REAPER by requested functions (e.g.
+    ``Project._from_name`` or ``Track._get_project``) are included.
+
+    Parameters
+    ----------
+    limit : int, optional
+        Maximum number of functions to return. By default, all
+        profiled functions are returned.
+
+    Returns
+    -------
+    profile : list of ProfileEntry
+        Profiled functions, by decreasing cumulative time.
+    """
+    return [ProfileEntry(*entry) for entry in _request("get_profile", limit)]
+
+
+def get_stats():
+    """
+    Return execution statistics of requests, per requested function.
+
+    Returns
+    -------
+    stats : dict
+        Keys are function names, and values are ``ServerCallStats``.
+        They are sorted by decreasing total time.
+    """
+    stats = {
+        name: ServerCallStats(n, total, total / n, max_time)
+        for name, (n, total, max_time) in _request("get_stats").items()
+    }
+    return dict(sorted(
+        stats.items(), key=lambda item: item[1].total_time, reverse=True
+    ))
+
+
+def reset():
+    """Delete statistics and profile recorded by the server."""
+    _request("reset")
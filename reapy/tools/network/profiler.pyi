@@ -0,0 +1,255 @@
+"""
+Profile requests processed by the ``reapy`` server.
+
+Client-side tracing (see ``reapy.tools.network.tracing``) only sees
+the requested functions. Functions decorated with
+``reapy.inside_reaper`` run entirely inside REAPER, and the API calls
+or ``reapy`` functions they make there are invisible to the client.
+
+When profiling is enabled, the server times each request it runs and
+aggregates call counts, total and maximum times per function. A
+fraction of requests can also be run under ``cProfile``, so that the
+nested functions blocking REAPER's UI thread show up with their
+cumulative times.
+
+Profiling is controlled and queried from outside REAPER with the
+functions of this module, which act on the server of the selected
+machine.
+
+Examples
+--------
+>>> from reapy.tools.network import profiler
+>>> profiler.enable(sample_rate=.1)
+>>> regions = reapy.Project().regions
+>>> for name, s in profiler.get_stats().items():
+...     print(name, s.n_calls, s.total_time, s.max_time)
+>>> for entry in profiler.get_profile(limit=10):
+...     print(entry.function, entry.n_calls, entry.cumulative_time)
+>>> profiler.disable()
+"""
+
+import collections
+import cProfile
+import os
+import random
+import time
+import typing as ty
+
+import reapy
+from reapy import errors
+from . import tracing
+
+
+_PACKAGE_DIRECTORY: str
+
+
+class ProfileEntry(ty.NamedTuple):
+    """
+    Function profiled by ``cProfile`` in sampled requests.
+
+    Times are in seconds, summed over sampled requests. ``own_time``
+    excludes time spent in subfunctions, whereas ``cumulative_time``
+    includes it.
+    """
+    function: str
+    n_calls: int
+    own_time: float
+    cumulative_time: float
+
+
+class ServerCallStats(ty.NamedTuple):
+    """
+    Statistics of the requests to a function run by the server.
+
+    Times are in seconds, and only account for the execution of the
+    function inside REAPER.
+    """
+    n_calls: int
+    total_time: float
+    mean_time: float
+    max_time: float
+
+
+class Profiler:
+    """
+    Profiler of requests run by a ``Server``.
+
+    Each ``Server`` has its own profiler, shared by all connections.
+    It is disabled by default.
+
+    Attributes
+    ----------
+    is_enabled : bool
+        Whether requests are timed.
+    sample_rate : float
+        Fraction of timed requests that are run under ``cProfile``.
+    """
+    _COMMANDS: ty.Tuple[str, ...]
+    is_enabled: bool
+    sample_rate: float
+    _stats: ty.Dict[str, ty.List[float]]
+    _profile: cProfile.Profile
+    _n_sampled: int
+
+    def __init__(self) -> None:
+        ...
+
+    def call(
+        self, function: ty.Callable[..., ty.Any], *args: ty.Any,
+        **kwargs: ty.Any
+    ) -> ty.Any:
+        """
+        Run function and record its execution time.
+
+        Parameters
+        ----------
+        function : callable
+        *args, **kwargs
+            Arguments of the function.
+
+        Returns
+        -------
+        object
+            Value returned by the function.
+        """
+        ...
+
+    def disable(self) -> None:
+        """Stop timing requests. Recorded statistics are kept."""
+        ...
+
+    def enable(self, sample_rate: float = 0.) -> None:
+        """
+        Start timing requests.
+
+        Parameters
+        ----------
+        sample_rate : float, optional
+            Fraction of requests to run under ``cProfile``
+            (default=0).
+        """
+        ...
+
+    def get_profile(
+        self, limit: ty.Optional[int] = None
+    ) -> ty.List[ty.List[ty.Any]]:
+        """
+        Return ``cProfile`` statistics aggregated over sampled requests.
+
+        Parameters
+        ----------
+        limit : int, optional
+            Maximum number of functions to return. By default, all
+            profiled functions are returned.
+
+        Returns
+        -------
+        profile : list of list
+            Function name, number of calls, own time and cumulative
+            time of each function, by decreasing cumulative time.
+        """
+        ...
+
+    def get_stats(self) -> ty.Dict[str, ty.List[float]]:
+        """
+        Return execution statistics of requests, per function.
+
+        Returns
+        -------
+        stats : dict
+            Keys are function names, and values are lists with the
+            number of calls, total and maximum times.
+        """
+        ...
+
+    def reset(self) -> None:
+        """Delete recorded statistics and profile."""
+        ...
+
+    def run_command(
+        self, command: str, *args: ty.Any, **kwargs: ty.Any
+    ) -> ty.Any:
+        """
+        Run a profiler command requested by a client.
+
+        Parameters
+        ----------
+        command : str
+            Name of a public method of ``Profiler`` (except ``call``).
+        *args, **kwargs
+            Arguments of the method.
+
+        Returns
+        -------
+        object
+            Value returned by the method.
+        """
+        ...
+
+
+def _get_profile_name(key: ty.Tuple[str, int, str]) -> str:
+    """Return name of a function from its ``cProfile`` key."""
+    ...
+
+
+def _request(command: str, *args: ty.Any, **kwargs: ty.Any) -> ty.Any:
+    """Send profiler command to the server of the selected machine."""
+    ...
+
+
+def disable() -> None:
+    """Stop profiling requests. Recorded statistics are kept."""
+    ...
+
+
+def enable(sample_rate: float = 0.) -> None:
+    """
+    Start profiling requests.
+
+    Parameters
+    ----------
+    sample_rate : float, optional
+        Fraction of requests to run under ``cProfile`` (default=0).
+        Profiling adds overhead to sampled requests, so that
+        ``sample_rate`` should be kept low when measuring latency.
+    """
+    ...
+
+
+def get_profile(limit: ty.Optional[int] = None) -> ty.List[ProfileEntry]:
+    """
+    Return ``cProfile`` statistics of sampled requests.
+
+    Functions called inside REAPER by requested functions (e.g.
+    ``Project._from_name`` or ``Track._get_project``) are included.
+
+    Parameters
+    ----------
+    limit : int, optional
+        Maximum number of functions to return. By default, all
+        profiled functions are returned.
+
+    Returns
+    -------
+    profile : list of ProfileEntry
+        Profiled functions, by decreasing cumulative time.
+    """
+    ...
+
+
+def get_stats() -> ty.Dict[str, ServerCallStats]:
+    """
+    Return execution statistics of requests, per requested function.
+
+    Returns
+    -------
+    stats : dict
+        Keys are function names, and values are ``ServerCallStats``.
+        They are sorted by decreasing total time.
+    """
+    ...
+
+
+def reset() -> None:
+    """Delete statistics and profile recorded by the server."""
+    ...
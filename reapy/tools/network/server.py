@@ -1,10 +1,15 @@
 """Define Server class."""
 
 import reapy
-from reapy.tools import json
+from . import codec
+from .profiler import Profiler
 from .socket import Socket
 
+import collections
+import functools
+import selectors
 import socket
+import time
 import traceback
 
 
@@ -14,58 +19,156 @@ class Server(Socket):
     Server part of the ``reapy`` dist API.
 
     It is instantiated inside REAPER. It receives and processes API
-    call requests coming from the outside.
+    call requests coming from the outside. Sockets are watched with a
+    selector, so that only connections with pending data are read.
+
+    Each connection has its own request queue. Queues are processed
+    in round-robin, one request at a time, so that a client sending
+    many requests does not delay the others. A client that sends HOLD
+    (see ``reapy.inside_reaper``) is served exclusively until it sends
+    RELEASE, but only for ``hold_time_budget`` seconds per tick when
+    other clients are connected.
+
+    ``Server.run_tick`` is meant to be called once per defer tick. It
+    keeps reading and processing requests as long as some are pending
+    and ``tick_time_budget`` is not exhausted.
+
+    Execution of requests can be profiled from the clients (see
+    ``reapy.tools.network.profiler``).
+
+    Parameters
+    ----------
+    port : int
+        Port to listen on.
+    host : str, optional
+        Address to bind to (default="0.0.0.0", i.e. all interfaces, so
+        that slave machines can connect).
+    hold_time_budget : float, optional
+        Maximum time in seconds spent serving a held connection in a
+        single tick when other clients are connected. Defaults to
+        ``reapy.config.SERVER_HOLD_TIME_BUDGET``.
+    tick_time_budget : float, optional
+        Time in seconds after which ``Server.run_tick`` stops
+        processing new requests. Defaults to
+        ``reapy.config.SERVER_TICK_TIME_BUDGET``.
+
+    Attributes
+    ----------
+    handshake : dict
+        Message sent to each new connection. See
+        ``Server._get_handshake``.
+    profiler : Profiler
+        Profiler of requests.
     """
 
-    def __init__(self, port):
+    def __init__(self, port, host="0.0.0.0", hold_time_budget=None,
+                 tick_time_budget=None):
         super().__init__()
         self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.bind(("0.0.0.0", port))
+        self.bind((host, port))
         self.listen()
         self.connections = {}
-        self.settimeout(.0001)
+        self.queues = {}
+        self.held_connections = []
+        if hold_time_budget is None:
+            hold_time_budget = reapy.config.SERVER_HOLD_TIME_BUDGET
+        self.hold_time_budget = hold_time_budget
+        if tick_time_budget is None:
+            tick_time_budget = reapy.config.SERVER_TICK_TIME_BUDGET
+        self.tick_time_budget = tick_time_budget
+        self._round_robin_start = 0
+        self.profiler = Profiler()
+        self.handshake = self._get_handshake()
+        self._socket.setblocking(False)
+        self._selector = selectors.DefaultSelector()
+        self._selector.register(self, selectors.EVENT_READ)
 
-    @Socket._non_blocking
-    def _get_request(self, connection, address):
+    def _get_connection_requests(self, connection, address):
+        """
+        Return requests received from a readable connection, in order.
+
+        When the client has disconnected, the last request is a
+        disconnection request.
+        """
         try:
-            request = connection.recv()
-            request = json.loads(request.decode())
+            messages = connection.recv_messages()
         except (ConnectionAbortedError, ConnectionResetError):
             # Client has disconnected
             # Pretend client has nicely requested to disconnect
             input = {"args": (address, ), "kwargs": {}}
-            request = {
-                "function": self.disconnect,
-                "input": input
-            }
-        return request
+            return [{"function": self.disconnect, "input": input}]
+        received = time.perf_counter()
+        requests = []
+        for message in messages:
+            request, message_codec = codec.loads(message)
+            if message_codec == "binary":
+                # Client accepts binary results from now on
+                connection.codec = "binary"
+            if request.get("trace"):
+                request["received"] = received
+            requests.append(request)
+        return requests
 
-    def _hold_connection(self, address):
-        connection = self.connections[address]
-        result = {"type": "result", "value": None}
-        self._send_result(connection, result)
-        request = self._get_request(connection, address)
-        while request is None or request["function"] != "RELEASE":
-            if request is None:
-                request = self._get_request(connection, address)
-                continue
-            result = self._process_request(request, address)
-            try:
-                self._send_result(connection, result)
-                request = self._get_request(connection, address)
-            except (ConnectionAbortedError, ConnectionResetError):
-                # request was to disconnect
-                request = {"function": "RELEASE"}
-        result = {"type": "result", "value": None}
-        return result
+    def _get_handshake(self):
+        """
+        Return handshake sent to new connections.
+
+        It holds ``reapy`` and REAPER versions, the key of ReaScript
+        API names (see ``reapy.reascript_api._get_api_key``),
+        supported codecs and transports. REAPER fields are None
+        outside REAPER.
+        """
+        handshake = {
+            "reapy_version": reapy.__version__,
+            "reaper_version": None,
+            "api_key": None,
+            "codecs": codec.CODECS,
+            "transports": ("socket", "shared_memory"),
+        }
+        if reapy.is_inside_reaper():
+            RPR = reapy.reascript_api
+            handshake["reaper_version"] = RPR.GetAppVersion()
+            handshake["api_key"] = RPR._get_api_key()
+        return handshake
 
     def _process_request(self, request, address):
-        if request["function"] == "HOLD":
-            return self._hold_connection(address)
+        """
+        Run requested function and return result message.
+
+        When the request is traced (see
+        ``reapy.tools.network.tracing``), the result holds the time
+        spent by the request in queue and the execution time.
+        """
+        start = time.perf_counter()
+        result = self._run_request(request, address)
+        result["id"] = request.get("id")
+        if request.get("trace"):
+            result["trace"] = {
+                "queue_time": start - request.get("received", start),
+                "server_time": time.perf_counter() - start,
+            }
+        return result
+
+    def _run_request(self, request, address):
+        if request["function"] in ("HOLD", "RELEASE"):
+            if request["function"] == "HOLD":
+                self.held_connections.append(address)
+            elif address in self.held_connections:
+                self.held_connections.remove(address)
+            return {"type": "result", "value": None}
+        function = request["function"]
+        if function == "SHARED_MEMORY":
+            # Local client sends paths of its shared buffers
+            function = self.connections[address].attach_shared_memory
+        elif function == "PROFILER":
+            # Client controls or queries the profiler
+            function = self.profiler.run_command
+        elif self.profiler.is_enabled:
+            function = functools.partial(self.profiler.call, function)
         args, kwargs = request["input"]["args"], request["input"]["kwargs"]
         result = {}
         try:
-            result["value"] = request["function"](*args, **kwargs)
+            result["value"] = function(*args, **kwargs)
             result["type"] = "result"
         except Exception:
             # Errors are sent back to the client instead of raised in REAPER
@@ -75,42 +178,170 @@ class Server(Socket):
         return result
 
     def _send_result(self, connection, result):
-        result = json.dumps(result).encode()
+        result = codec.dumps(result, connection.codec)
         connection.send(result)
 
-    @Socket._non_blocking
+    def _serve_held_connection(self, address):
+        """
+        Process requests of a held connection as they arrive.
+
+        Stops at RELEASE, or when ``hold_time_budget`` is exhausted
+        and other clients are connected.
+        """
+        queue = self.queues[address]
+        deadline = time.perf_counter() + self.hold_time_budget
+        while address in self.held_connections:
+            remaining = deadline - time.perf_counter()
+            has_others = len(self.connections) > 1
+            if has_others and remaining <= 0:
+                return
+            if not queue:
+                # Wait for next request (or a new connection)
+                self.get_requests(remaining if has_others else None)
+                continue
+            request = queue.popleft()
+            result = self._process_request(request, address)
+            if request["function"] == self.disconnect:
+                return
+            self.send_results({address: [result]})
+
     def accept(self, *args, **kwargs):
-        connection, address = super().accept()
+        try:
+            connection, address = super().accept()
+        except BlockingIOError:
+            return None
+        connection._socket.setblocking(True)
         self.connections[address] = connection
-        connection.send("{}".format(address).encode("ascii"))
+        self.queues[address] = collections.deque()
+        self._selector.register(connection, selectors.EVENT_READ, address)
+        # Results are sent in JSON until the client sends a binary
+        # request (see ``reapy.tools.network.codec``).
+        connection.codec = "json"
+        handshake = dict(self.handshake, address="{}".format(address))
+        connection.send(codec.dumps(handshake))
         return connection, address
 
     def disconnect(self, address):
         connection = self.connections[address]
+        self._selector.unregister(connection)
         connection.shutdown(socket.SHUT_RDWR)
         connection.close()
         del self.connections[address]
+        del self.queues[address]
+        if address in self.held_connections:
+            self.held_connections.remove(address)
 
-    def get_requests(self):
-        requests = {}
-        for address, connection in self.connections.items():
-            request = self._get_request(connection, address)
-            if request is not None:
-                requests[address] = request
-        return requests
+    def get_requests(self, timeout=0):
+        """
+        Accept new connections and read requests into queues.
 
-    def process_requests(self, requests):
-        results = {}
-        for address, request in requests.items():
-            result = self._process_request(request, address)
-            results[address] = result
+        Only sockets with pending data are read.
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            Maximum time in seconds to wait for a socket to be ready
+            (default=0, i.e. don't wait). None means no time limit.
+
+        Returns
+        -------
+        requests : dict
+            Keys are addresses of connections with pending requests,
+            and values are their request queues.
+        """
+        if timeout is not None:
+            timeout = max(timeout, 0)
+        for key, _ in self._selector.select(timeout):
+            if key.data is None:  # Listening socket
+                self.accept()
+                continue
+            address = key.data
+            self.queues[address].extend(self._get_connection_requests(
+                self.connections[address], address
+            ))
+        return {
+            address: queue for address, queue in self.queues.items()
+            if queue
+        }
+
+    def process_requests(self, requests, deadline=None):
+        """
+        Process queued requests in round-robin, then held connections.
+
+        Parameters
+        ----------
+        requests : dict
+            Request queues, as returned by ``Server.get_requests``.
+            Processed requests are removed from them.
+        deadline : float, optional
+            Value of ``time.perf_counter()`` after which no new
+            round-robin pass is started. Requests that are left in
+            queues are processed on next call. By default, all
+            requests are processed.
+
+        Returns
+        -------
+        results : dict
+            Keys are addresses and values are lists of results, to be
+            sent with ``Server.send_results``.
+        """
+        addresses = list(requests)
+        if addresses:
+            # Rotate first served connection from one tick to the next
+            start = self._round_robin_start % len(addresses)
+            addresses = addresses[start:] + addresses[:start]
+            self._round_robin_start += 1
+        results = {address: [] for address in addresses}
+        n_passes = 0
+        while addresses:
+            # At least one pass is done so that all clients progress
+            if n_passes and deadline and time.perf_counter() > deadline:
+                break
+            n_passes += 1
+            for address in list(addresses):
+                queue = requests[address]
+                request = queue.popleft()
+                results[address].append(
+                    self._process_request(request, address)
+                )
+                if not queue or request["function"] == self.disconnect:
+                    addresses.remove(address)
+        for address in list(self.held_connections):
+            # Results of previous requests must be sent first to
+            # preserve ordering.
+            self.send_results({address: results.pop(address, [])})
+            self._serve_held_connection(address)
         return results
 
+    def run_tick(self):
+        """
+        Accept connections and process requests for one defer tick.
+
+        Once a request has been received, the server waits for
+        follow-up requests until ``tick_time_budget`` is exhausted, so
+        that clients waiting for results before sending their next
+        request are not limited to one request per tick. When the
+        server is idle, it only checks sockets once.
+        """
+        deadline = time.perf_counter() + self.tick_time_budget
+        requests = self.get_requests()
+        if not requests and not self.held_connections:
+            return
+        while True:
+            if requests or self.held_connections:
+                results = self.process_requests(requests, deadline)
+                self.send_results(results)
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return
+            requests = self.get_requests(remaining)
+
     def send_results(self, results):
-        for address, result in results.items():
+        for address, connection_results in results.items():
             try:
                 connection = self.connections[address]
-                self._send_result(connection, result)
+                for result in connection_results:
+                    self._send_result(connection, result)
             except (
                 KeyError, BrokenPipeError, ConnectionAbortedError, ConnectionResetError
             ):
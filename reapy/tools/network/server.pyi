@@ -1,10 +1,15 @@
 """Define Server class."""
 
 import reapy
-from reapy.tools import json
+from . import codec
+from .profiler import Profiler
 from .socket import Socket
 
+import collections
+import functools
+import selectors
 import socket
+import time
 import traceback
 import typing as ty
 
@@ -14,46 +19,193 @@ class Server(Socket):
     Server part of the ``reapy`` dist API.
 
     It is instantiated inside REAPER. It receives and processes API
-    call requests coming from the outside.
+    call requests coming from the outside. Sockets are watched with a
+    selector, so that only connections with pending data are read.
+
+    Each connection has its own request queue. Queues are processed
+    in round-robin, one request at a time, so that a client sending
+    many requests does not delay the others. A client that sends HOLD
+    (see ``reapy.inside_reaper``) is served exclusively until it sends
+    RELEASE, but only for ``hold_time_budget`` seconds per tick when
+    other clients are connected.
+
+    ``Server.run_tick`` is meant to be called once per defer tick. It
+    keeps reading and processing requests as long as some are pending
+    and ``tick_time_budget`` is not exhausted.
+
+    Execution of requests can be profiled from the clients (see
+    ``reapy.tools.network.profiler``).
+
+    Parameters
+    ----------
+    port : int
+        Port to listen on.
+    host : str, optional
+        Address to bind to (default="0.0.0.0", i.e. all interfaces, so
+        that slave machines can connect).
+    hold_time_budget : float, optional
+        Maximum time in seconds spent serving a held connection in a
+        single tick when other clients are connected. Defaults to
+        ``reapy.config.SERVER_HOLD_TIME_BUDGET``.
+    tick_time_budget : float, optional
+        Time in seconds after which ``Server.run_tick`` stops
+        processing new requests. Defaults to
+        ``reapy.config.SERVER_TICK_TIME_BUDGET``.
+
+    Attributes
+    ----------
+    handshake : dict
+        Message sent to each new connection. See
+        ``Server._get_handshake``.
+    profiler : Profiler
+        Profiler of requests.
     """
     connections: ty.Dict[ty.Union[ty.Tuple[str, ...], str], Socket]
+    queues: ty.Dict[
+        ty.Union[ty.Tuple[str, ...], str],
+        ty.Deque[ty.Dict[str, ty.Any]]
+    ]
+    held_connections: ty.List[ty.Union[ty.Tuple[str, ...], str]]
+    hold_time_budget: float
+    tick_time_budget: float
+    handshake: ty.Dict[str, ty.Any]
+    profiler: Profiler
+    _round_robin_start: int
+    _selector: selectors.BaseSelector
 
-    def __init__(self, port: int) -> None:
+    def __init__(
+        self,
+        port: int,
+        host: str = "0.0.0.0",
+        hold_time_budget: ty.Optional[float] = None,
+        tick_time_budget: ty.Optional[float] = None
+    ) -> None:
         ...
 
-    @Socket._non_blocking
-    def _get_request(self, connection: Socket,
-                     address: ty.Union[ty.Tuple[str, ...], str]
-                     ) -> ty.Dict[str, object]:
+    def _get_connection_requests(
+        self, connection: Socket, address: ty.Union[ty.Tuple[str, ...], str]
+    ) -> ty.List[ty.Dict[str, object]]:
+        """
+        Return requests received from a readable connection, in order.
+
+        When the client has disconnected, the last request is a
+        disconnection request.
+        """
         ...
 
-    def _hold_connection(self, address: ty.Union[ty.Tuple[str, ...], str]
-                         ) -> ty.Dict[str, ty.Optional[str]]:
+    def _get_handshake(self) -> ty.Dict[str, ty.Any]:
+        """
+        Return handshake sent to new connections.
+
+        It holds ``reapy`` and REAPER versions, the key of ReaScript
+        API names (see ``reapy.reascript_api._get_api_key``),
+        supported codecs and transports. REAPER fields are None
+        outside REAPER.
+        """
         ...
 
     def _process_request(self, request: ty.Dict[str, object],
                          address: ty.Union[ty.Tuple[str, ...], str]
                          ) -> ty.Dict[str, ty.Any]:
+        """
+        Run requested function and return result message.
+
+        When the request is traced (see
+        ``reapy.tools.network.tracing``), the result holds the time
+        spent by the request in queue and the execution time.
+        """
+        ...
+
+    def _run_request(self, request: ty.Dict[str, object],
+                     address: ty.Union[ty.Tuple[str, ...], str]
+                     ) -> ty.Dict[str, ty.Any]:
         ...
 
     def _send_result(self, connection: Socket,
                      result: ty.Dict[str, ty.Any]) -> None:
         ...
 
-    @Socket._non_blocking
-    def accept(self, *args: ty.Any, **kwargs: ty.Any
-               ) -> ty.Tuple['Socket', ty.Union[str, ty.Tuple[str, ...]]]:
+    def _serve_held_connection(
+        self, address: ty.Union[ty.Tuple[str, ...], str]
+    ) -> None:
+        """
+        Process requests of a held connection as they arrive.
+
+        Stops at RELEASE, or when ``hold_time_budget`` is exhausted
+        and other clients are connected.
+        """
+        ...
+
+    def accept(
+        self, *args: ty.Any, **kwargs: ty.Any
+    ) -> ty.Optional[
+        ty.Tuple['Socket', ty.Union[str, ty.Tuple[str, ...]]]
+    ]:
         ...
 
     def disconnect(self, address: ty.Union[ty.Tuple[str, ...], str]) -> None:
         ...
 
-    def get_requests(self) -> ty.Dict[str, ty.Any]:
+    def get_requests(
+        self, timeout: ty.Optional[float] = 0
+    ) -> ty.Dict[str, ty.Deque[ty.Any]]:
+        """
+        Accept new connections and read requests into queues.
+
+        Only sockets with pending data are read.
+
+        Parameters
+        ----------
+        timeout : float or None, optional
+            Maximum time in seconds to wait for a socket to be ready
+            (default=0, i.e. don't wait). None means no time limit.
+
+        Returns
+        -------
+        requests : dict
+            Keys are addresses of connections with pending requests,
+            and values are their request queues.
+        """
+        ...
+
+    def process_requests(
+        self,
+        requests: ty.Dict[str, ty.Deque[ty.Any]],
+        deadline: ty.Optional[float] = None
+    ) -> ty.Dict[str, ty.List[ty.Any]]:
+        """
+        Process queued requests in round-robin, then held connections.
+
+        Parameters
+        ----------
+        requests : dict
+            Request queues, as returned by ``Server.get_requests``.
+            Processed requests are removed from them.
+        deadline : float, optional
+            Value of ``time.perf_counter()`` after which no new
+            round-robin pass is started. Requests that are left in
+            queues are processed on next call. By default, all
+            requests are processed.
+
+        Returns
+        -------
+        results : dict
+            Keys are addresses and values are lists of results, to be
+            sent with ``Server.send_results``.
+        """
         ...
 
-    def process_requests(self, requests: ty.Dict[str, ty.Any]
-                         ) -> ty.Dict[str, ty.Any]:
+    def run_tick(self) -> None:
+        """
+        Accept connections and process requests for one defer tick.
+
+        Once a request has been received, the server waits for
+        follow-up requests until ``tick_time_budget`` is exhausted, so
+        that clients waiting for results before sending their next
+        request are not limited to one request per tick. When the
+        server is idle, it only checks sockets once.
+        """
         ...
 
-    def send_results(self, results: ty.Dict[str, ty.Any]) -> None:
+    def send_results(self, results: ty.Dict[str, ty.List[ty.Any]]) -> None:
         ...
@@ -0,0 +1,108 @@
+"""Share memory between processes running on the same host.
+
+Buffers are memory-mapped files created in ``/dev/shm`` when it
+exists (i.e. RAM-backed on Linux), or in the temporary directory
+otherwise. Unlike ``multiprocessing.shared_memory``, attaching to a
+buffer does not involve a resource tracker process, which can not
+be spawned from inside REAPER.
+"""
+
+import mmap
+import os
+import tempfile
+import uuid
+
+
+def _get_directory():
+    if os.path.isdir("/dev/shm"):
+        return "/dev/shm"
+    return tempfile.gettempdir()
+
+
+class SharedBuffer:
+
+    """
+    Memory buffer shared between processes of the same host.
+
+    Use ``SharedBuffer.create`` to allocate a new buffer, and
+    instantiate ``SharedBuffer`` with its path to attach to it from
+    another process. The creator is responsible for calling
+    ``SharedBuffer.unlink`` once all processes have closed it.
+
+    Parameters
+    ----------
+    path : str
+        Path of the buffer, as given by ``SharedBuffer.path``.
+
+    Examples
+    --------
+    >>> buffer = SharedBuffer.create(1024)
+    >>> other = SharedBuffer(buffer.path)  # In another process
+    >>> other.buf[:5] = b"hello"
+    >>> other.close()
+    >>> bytes(buffer.buf[:5])
+    b'hello'
+    >>> buffer.close()
+    >>> buffer.unlink()
+    """
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, "r+b") as f:
+            self.size = os.fstat(f.fileno()).st_size
+            self._mmap = mmap.mmap(f.fileno(), self.size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
+    @property
+    def buf(self):
+        """
+        Writable view on buffer memory.
+
+        :type: memoryview
+        """
+        return memoryview(self._mmap)
+
+    def close(self):
+        """Close buffer in current process."""
+        self._mmap.close()
+
+    @classmethod
+    def create(cls, size):
+        """
+        Allocate new buffer.
+
+        Where supported, memory is reserved upfront, so that a full
+        ``/dev/shm`` raises an error here instead of crashing the
+        process that writes to the buffer.
+
+        Parameters
+        ----------
+        size : int
+            Buffer size in bytes.
+
+        Returns
+        -------
+        SharedBuffer
+        """
+        name = "reapy-{}".format(uuid.uuid4().hex)
+        path = os.path.join(_get_directory(), name)
+        with open(path, "wb") as f:
+            f.truncate(max(size, 1))  # Empty files can't be mapped
+            if hasattr(os, "posix_fallocate"):
+                try:
+                    os.posix_fallocate(f.fileno(), 0, max(size, 1))
+                except OSError:
+                    f.close()
+                    os.remove(path)
+                    raise
+        return cls(path)
+
+    def unlink(self):
+        """Free buffer. It must have been closed in all processes."""
+        os.remove(self.path)
@@ -0,0 +1,87 @@
+"""Share memory between processes running on the same host.
+
+Buffers are memory-mapped files created in ``/dev/shm`` when it
+exists (i.e. RAM-backed on Linux), or in the temporary directory
+otherwise. Unlike ``multiprocessing.shared_memory``, attaching to a
+buffer does not involve a resource tracker process, which can not
+be spawned from inside REAPER.
+"""
+
+import mmap
+import os
+import tempfile
+import uuid
+import typing as ty
+from types import TracebackType
+
+
+def _get_directory() -> str:
+    ...
+
+
+class SharedBuffer:
+    """
+    Memory buffer shared between processes of the same host.
+
+    Use ``SharedBuffer.create`` to allocate a new buffer, and
+    instantiate ``SharedBuffer`` with its path to attach to it from
+    another process. The creator is responsible for calling
+    ``SharedBuffer.unlink`` once all processes have closed it.
+
+    Parameters
+    ----------
+    path : str
+        Path of the buffer, as given by ``SharedBuffer.path``.
+    """
+    path: str
+    size: int
+    _mmap: mmap.mmap
+
+    def __init__(self, path: str) -> None:
+        ...
+
+    def __enter__(self) -> 'SharedBuffer':
+        ...
+
+    def __exit__(self,
+                 exc_type: ty.Optional[ty.Type[BaseException]],
+                 exc_val: ty.Optional[BaseException],
+                 exc_tb: ty.Optional[TracebackType]) -> bool:
+        ...
+
+    @property
+    def buf(self) -> memoryview:
+        """
+        Writable view on buffer memory.
+
+        :type: memoryview
+        """
+        ...
+
+    def close(self) -> None:
+        """Close buffer in current process."""
+        ...
+
+    @classmethod
+    def create(cls, size: int) -> 'SharedBuffer':
+        """
+        Allocate new buffer.
+
+        Where supported, memory is reserved upfront, so that a full
+        ``/dev/shm`` raises an error here instead of crashing the
+        process that writes to the buffer.
+
+        Parameters
+        ----------
+        size : int
+            Buffer size in bytes.
+
+        Returns
+        -------
+        SharedBuffer
+        """
+        ...
+
+    def unlink(self) -> None:
+        """Free buffer. It must have been closed in all processes."""
+        ...
@@ -1,15 +1,36 @@
 import socket
 
+from .shared_memory import SharedBuffer
+
 
 class Socket:
 
     """
     Wrapped `socket` that can send and receive data of any length.
+
+    Each message is prefixed with its length as an 8-byte
+    little-endian integer. Received bytes are buffered, so that
+    ``Socket.recv_messages`` can return all complete messages read
+    with a single system call.
+
+    When both ends run on the same host, shared buffers can be
+    attached to the socket (see ``Socket.attach_shared_memory``).
+    Large messages are then written to shared memory, and only a
+    short reference message goes through the socket.
     """
 
+    #: Maximum number of bytes read by ``Socket.recv_messages``.
+    RECV_SIZE = 1024 ** 2
+    #: Prefix of messages that refer to a shared buffer.
+    SHARED_MEMORY_MAGIC = b"RSM\x01"
+    #: Size from which messages are sent through shared memory.
+    SHARED_MEMORY_THRESHOLD = 64 * 1024
+
     def __init__(self, s=None):
         self._socket = socket.socket() if s is None else s
         self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._buffer = bytearray()
+        self._shared_send = self._shared_recv = None
 
     @staticmethod
     def _non_blocking(f):
@@ -24,37 +45,142 @@ class Socket:
                 pass
         return g
 
+    def _read_shared(self, message):
+        """Return message, reading it from shared memory if needed."""
+        magic = self.SHARED_MEMORY_MAGIC
+        if self._shared_recv is None or not message.startswith(magic):
+            return message
+        length = int.from_bytes(message[len(magic):], "little")
+        with self._shared_recv.buf as buffer:
+            message = bytes(buffer[8:8 + length])
+            buffer[0] = 0  # Sender can reuse buffer
+        return message
+
+    def _recv_exactly(self, n):
+        """Receive exactly n bytes, starting with buffered ones."""
+        data = self._buffer[:n]
+        del self._buffer[:n]
+        try:
+            while len(data) < n:
+                chunk = self._socket.recv(n - len(data), socket.MSG_WAITALL)
+                if not chunk:
+                    raise ConnectionAbortedError
+                data += chunk
+        except socket.timeout:
+            self._buffer[:0] = data  # Keep partial data for next call
+            raise
+        return bytes(data)
+
     def accept(self, *args, **kwargs):
         connection, address = self._socket.accept(*args, **kwargs)
         connection = Socket(connection)
         return connection, address
 
+    def attach_shared_memory(self, send_path=None, recv_path=None):
+        """
+        Attach shared buffers used for large messages.
+
+        Each buffer holds a single message at a time: its first byte
+        is set by the sender when a message is written, and reset by
+        the receiver once the message is read. Messages that don't
+        fit, or that are sent while the buffer is in use, go through
+        the socket.
+
+        Parameters
+        ----------
+        send_path : str, optional
+            Path of the ``SharedBuffer`` used to send messages.
+        recv_path : str, optional
+            Path of the ``SharedBuffer`` used to receive messages.
+        """
+        if send_path is not None:
+            self._shared_send = SharedBuffer(send_path)
+        if recv_path is not None:
+            self._shared_recv = SharedBuffer(recv_path)
+
     def bind(self, *args, **kwargs):
         return self._socket.bind(*args, **kwargs)
 
     def close(self, *args, **kwargs):
+        for shared in (self._shared_send, self._shared_recv):
+            if shared is not None:
+                shared.close()
+        self._shared_send = self._shared_recv = None
         return self._socket.close(*args, **kwargs)
 
     def connect(self, *args, **kwargs):
         return self._socket.connect(*args, **kwargs)
 
+    def fileno(self):
+        return self._socket.fileno()
+
     def listen(self, *args, **kwargs):
         return self._socket.listen(*args, **kwargs)
 
     def recv(self, timeout=.0001):
         """Receive data of arbitrary length."""
         # First get data length
-        self.settimeout(timeout)
-        length = self._socket.recv(8)
-        length = int.from_bytes(length, "little")
+        if not self._buffer and timeout != self._socket.gettimeout():
+            self.settimeout(timeout)
+        length = int.from_bytes(self._recv_exactly(8), "little")
         if length == 0:
             raise ConnectionAbortedError
         # Then receive data
-        self.settimeout(None)
-        return self._socket.recv(length, socket.MSG_WAITALL)
+        if self._socket.gettimeout() is not None:
+            self.settimeout(None)
+        return self._read_shared(self._recv_exactly(length))
+
+    def recv_messages(self):
+        """
+        Read available data and return all complete messages.
+
+        It performs a single read, which only blocks if no data is
+        available (use a selector to check the socket is readable
+        first). Incomplete messages are kept in buffer until next
+        call.
+
+        Returns
+        -------
+        messages : list of bytes
+
+        Raises
+        ------
+        ConnectionAbortedError
+            If the connection was closed by peer.
+        """
+        data = self._socket.recv(self.RECV_SIZE)
+        if not data:
+            raise ConnectionAbortedError
+        self._buffer += data
+        buffer = self._buffer
+        messages, start, n = [], 0, len(buffer)
+        while n - start >= 8:
+            length = int.from_bytes(buffer[start:start + 8], "little")
+            if length == 0:
+                raise ConnectionAbortedError
+            end = start + 8 + length
+            if end > n:
+                break
+            messages.append(self._read_shared(bytes(buffer[start + 8:end])))
+            start = end
+        del self._buffer[:start]
+        return messages
 
     def send(self, data):
         """Send data."""
+        shared = self._shared_send
+        if (
+            shared is not None
+            and self.SHARED_MEMORY_THRESHOLD <= len(data) <= shared.size - 8
+        ):
+            with shared.buf as buffer:
+                if not buffer[0]:
+                    buffer[8:8 + len(data)] = data
+                    buffer[0] = 1
+                    data = (
+                        self.SHARED_MEMORY_MAGIC
+                        + len(data).to_bytes(8, "little")
+                    )
         # First send data length
         length = len(data).to_bytes(8, "little")
         self._socket.sendall(length)
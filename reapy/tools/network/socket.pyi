@@ -1,5 +1,7 @@
 import socket
 import typing as ty
+
+from .shared_memory import SharedBuffer
 FuncType = ty.Callable[..., ty.Any]
 F = ty.TypeVar('F', bound=FuncType)
 T = ty.TypeVar('T')
@@ -8,8 +10,24 @@ T = ty.TypeVar('T')
 class Socket:
     """
     Wrapped `socket` that can send and receive data of any length.
+
+    Each message is prefixed with its length as an 8-byte
+    little-endian integer. Received bytes are buffered, so that
+    ``Socket.recv_messages`` can return all complete messages read
+    with a single system call.
+
+    When both ends run on the same host, shared buffers can be
+    attached to the socket (see ``Socket.attach_shared_memory``).
+    Large messages are then written to shared memory, and only a
+    short reference message goes through the socket.
     """
+    RECV_SIZE: int
+    SHARED_MEMORY_MAGIC: bytes
+    SHARED_MEMORY_THRESHOLD: int
     _socket: socket.socket
+    _buffer: bytearray
+    _shared_send: ty.Optional[SharedBuffer]
+    _shared_recv: ty.Optional[SharedBuffer]
 
     def __init__(self, s: ty.Optional['Socket'] = None) -> None:
         ...
@@ -22,10 +40,38 @@ class Socket:
         """
         ...
 
+    def _read_shared(self, message: bytes) -> bytes:
+        """Return message, reading it from shared memory if needed."""
+        ...
+
+    def _recv_exactly(self, n: int) -> bytes:
+        """Receive exactly n bytes, starting with buffered ones."""
+        ...
+
     def accept(self, *args: ty.Any, **kwargs: ty.Any
                ) -> ty.Tuple['Socket', ty.Union[str, ty.Tuple[str, ...]]]:
         ...
 
+    def attach_shared_memory(self, send_path: ty.Optional[str] = None,
+                             recv_path: ty.Optional[str] = None) -> None:
+        """
+        Attach shared buffers used for large messages.
+
+        Each buffer holds a single message at a time: its first byte
+        is set by the sender when a message is written, and reset by
+        the receiver once the message is read. Messages that don't
+        fit, or that are sent while the buffer is in use, go through
+        the socket.
+
+        Parameters
+        ----------
+        send_path : str, optional
+            Path of the ``SharedBuffer`` used to send messages.
+        recv_path : str, optional
+            Path of the ``SharedBuffer`` used to receive messages.
+        """
+        ...
+
     def bind(self, *args: ty.Any, **kwargs: ty.Any) -> None:
         ...
 
@@ -35,6 +81,9 @@ class Socket:
     def connect(self, *args: ty.Any, **kwargs: ty.Any) -> None:
         ...
 
+    def fileno(self) -> int:
+        ...
+
     def listen(self, *args: ty.Any, **kwargs: ty.Any) -> None:
         ...
 
@@ -42,6 +91,26 @@ class Socket:
         """Receive data of arbitrary length."""
         ...
 
+    def recv_messages(self) -> ty.List[bytes]:
+        """
+        Read available data and return all complete messages.
+
+        It performs a single read, which only blocks if no data is
+        available (use a selector to check the socket is readable
+        first). Incomplete messages are kept in buffer until next
+        call.
+
+        Returns
+        -------
+        messages : list of bytes
+
+        Raises
+        ------
+        ConnectionAbortedError
+            If the connection was closed by peer.
+        """
+        ...
+
     def send(self, data: bytes) -> None:
         """Send data."""
         ...
@@ -0,0 +1,248 @@
+"""
+Trace dist API calls.
+
+Tracing is disabled by default. When ``reapy.config.TRACE_CALLS`` is
+True, each call made through a ``Client`` is recorded as a
+``CallTrace``: function name, message sizes, and the time spent
+encoding the request, in the network, waiting in the server queue,
+running inside REAPER and decoding the result. Server timings are
+measured by the server and sent back with the result.
+
+Traces are summarized per function by ``stats`` (also available as
+``reapy.stats``), and can be exported to the Chrome trace format
+with ``export_chrome_trace`` (open the file in ``chrome://tracing``
+or https://ui.perfetto.dev).
+
+Examples
+--------
+>>> reapy.config.TRACE_CALLS = True
+>>> tracks = list(reapy.Project().tracks)
+>>> s = reapy.stats()["GetTrack"]
+>>> print(s.n_calls, s.median_time, s.network_time, s.server_time)
+>>> reapy.tools.network.tracing.export_chrome_trace("trace.json")
+"""
+
+import collections
+import json
+import os
+import threading
+
+import reapy
+
+
+#: Upper bounds in seconds of latency histogram bins (see ``stats``).
+HISTOGRAM_BINS = (
+    1e-5, 3e-5, 1e-4, 3e-4, 1e-3, 3e-3, .01, .03, .1, .3, 1., float("inf")
+)
+
+_LOCK = threading.Lock()
+_MEAN_FIELDS = (
+    "encode_time", "network_time", "queue_time", "server_time",
+    "decode_time", "request_size", "result_size"
+)
+_TRACES = collections.deque()
+
+
+class CallTrace(collections.namedtuple("CallTrace", (
+    "function", "start", "request_size", "result_size", "encode_time",
+    "network_time", "queue_time", "server_time", "decode_time",
+    "thread_id"
+))):
+
+    """
+    Timings of a dist API call.
+
+    Times are in seconds, and sizes in bytes. ``start`` is the value
+    of ``time.perf_counter()`` when the call started.
+    ``network_time`` is the time not accounted for by the other
+    phases: sending and receiving messages, and waiting for the
+    server to read the request (e.g. until next defer tick).
+    ``queue_time`` is the time between reception of the request by
+    the server and the start of its execution.
+    """
+
+    __slots__ = ()
+
+    @property
+    def total_time(self):
+        """
+        Total time of the call.
+
+        :type: float
+        """
+        return (
+            self.encode_time + self.network_time + self.queue_time
+            + self.server_time + self.decode_time
+        )
+
+
+CallStats = collections.namedtuple("CallStats", (
+    "n_calls", "total_time", "mean_time", "median_time", "p90_time",
+    "p99_time", "max_time", "encode_time", "network_time", "queue_time",
+    "server_time", "decode_time", "request_size", "result_size",
+    "histogram"
+))
+CallStats.__doc__ = """
+Statistics of the traced calls of a function.
+
+Times are in seconds. ``total_time`` is the sum of call times, and
+``mean_time``, ``median_time``, ``p90_time``, ``p99_time`` and
+``max_time`` are statistics of call times. Phase times (e.g.
+``network_time``) and sizes are means per call (see ``CallTrace``).
+``histogram`` holds the numbers of calls in each bin of
+``HISTOGRAM_BINS``.
+"""
+
+
+def _get_percentile(sorted_values, percent):
+    index = round(percent / 100 * (len(sorted_values) - 1))
+    return sorted_values[index]
+
+
+def clear():
+    """Delete all traces."""
+    with _LOCK:
+        _TRACES.clear()
+
+
+def export_chrome_trace(path, traces=None):
+    """
+    Export traces to a Chrome trace file.
+
+    Each call is a complete event on the track of its thread, with
+    its phases as nested events. Phases are laid out in order, with
+    network time as a single block before server phases.
+
+    Parameters
+    ----------
+    path : str
+        Path of JSON file.
+    traces : list of CallTrace, optional
+        Traces to export. Defaults to all recorded traces.
+    """
+    if traces is None:
+        traces = get_traces()
+    events, pid = [], os.getpid()
+    phases = ("encode", "network", "queue", "server", "decode")
+    for trace in traces:
+        start = trace.start * 1e6
+        events.append({
+            "name": trace.function, "cat": "call", "ph": "X", "ts": start,
+            "dur": trace.total_time * 1e6, "pid": pid,
+            "tid": trace.thread_id, "args": {
+                "request_size": trace.request_size,
+                "result_size": trace.result_size,
+            }
+        })
+        for phase in phases:
+            duration = getattr(trace, phase + "_time") * 1e6
+            events.append({
+                "name": phase, "cat": "phase", "ph": "X", "ts": start,
+                "dur": duration, "pid": pid, "tid": trace.thread_id
+            })
+            start += duration
+    with open(path, "w") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+
+def get_function_name(function):
+    """
+    Return name of a requested function, as used in traces.
+
+    Parameters
+    ----------
+    function : callable, dict or str
+        Function, encoded function or special request (e.g. "HOLD").
+
+    Returns
+    -------
+    str
+    """
+    if isinstance(function, str):
+        return function
+    if isinstance(function, dict):  # Encoded function (e.g. property)
+        return function.get("name", "?")
+    return getattr(function, "__qualname__", repr(function))
+
+
+def get_traces():
+    """
+    Return recorded traces.
+
+    At most ``reapy.config.TRACE_BUFFER_SIZE`` traces are kept (the
+    most recent ones).
+
+    Returns
+    -------
+    traces : list of CallTrace
+        Traces in order of completion.
+    """
+    with _LOCK:
+        return list(_TRACES)
+
+
+def record(trace):
+    """
+    Record trace of a call.
+
+    Parameters
+    ----------
+    trace : CallTrace
+    """
+    with _LOCK:
+        _TRACES.append(trace)
+        while len(_TRACES) > reapy.config.TRACE_BUFFER_SIZE:
+            _TRACES.popleft()
+
+
+def stats(traces=None):
+    """
+    Return statistics of traced calls, per function.
+
+    Calls are only traced when ``reapy.config.TRACE_CALLS`` is True.
+
+    Parameters
+    ----------
+    traces : list of CallTrace, optional
+        Traces to summarize. Defaults to all recorded traces.
+
+    Returns
+    -------
+    stats : dict
+        Keys are function names, and values are ``CallStats``. They
+        are sorted by decreasing total time.
+
+    Examples
+    --------
+    >>> reapy.config.TRACE_CALLS = True
+    >>> tracks = list(reapy.Project().tracks)
+    >>> for name, s in reapy.stats().items():
+    ...     print(name, s.n_calls, s.mean_time, s.server_time)
+    """
+    if traces is None:
+        traces = get_traces()
+    traces_by_name = collections.defaultdict(list)
+    for trace in traces:
+        traces_by_name[trace.function].append(trace)
+    results = {}
+    for name, function_traces in traces_by_name.items():
+        n = len(function_traces)
+        times = sorted(t.total_time for t in function_traces)
+        histogram = [0] * len(HISTOGRAM_BINS)
+        bin_index = 0
+        for time in times:
+            while time > HISTOGRAM_BINS[bin_index]:
+                bin_index += 1
+            histogram[bin_index] += 1
+        means = [
+            sum(getattr(t, field) for t in function_traces) / n
+            for field in _MEAN_FIELDS
+        ]
+        results[name] = CallStats(
+            n, sum(times), sum(times) / n, _get_percentile(times, 50),
+            _get_percentile(times, 90), _get_percentile(times, 99),
+            times[-1], *means, histogram
+        )
+    return dict(sorted(
+        results.items(), key=lambda item: item[1].total_time, reverse=True
+    ))
@@ -0,0 +1,203 @@
+"""
+Trace dist API calls.
+
+Tracing is disabled by default. When ``reapy.config.TRACE_CALLS`` is
+True, each call made through a ``Client`` is recorded as a
+``CallTrace``: function name, message sizes, and the time spent
+encoding the request, in the network, waiting in the server queue,
+running inside REAPER and decoding the result. Server timings are
+measured by the server and sent back with the result.
+
+Traces are summarized per function by ``stats`` (also available as
+``reapy.stats``), and can be exported to the Chrome trace format
+with ``export_chrome_trace`` (open the file in ``chrome://tracing``
+or https://ui.perfetto.dev).
+
+Examples
+--------
+>>> reapy.config.TRACE_CALLS = True
+>>> tracks = list(reapy.Project().tracks)
+>>> s = reapy.stats()["GetTrack"]
+>>> print(s.n_calls, s.median_time, s.network_time, s.server_time)
+>>> reapy.tools.network.tracing.export_chrome_trace("trace.json")
+"""
+
+import collections
+import json
+import os
+import threading
+import typing as ty
+
+import reapy
+
+
+HISTOGRAM_BINS: ty.Tuple[float, ...]
+
+_LOCK: threading.Lock
+_MEAN_FIELDS: ty.Tuple[str, ...]
+_TRACES: ty.Deque['CallTrace']
+
+
+class CallTrace(ty.NamedTuple):
+    """
+    Timings of a dist API call.
+
+    Times are in seconds, and sizes in bytes. ``start`` is the value
+    of ``time.perf_counter()`` when the call started.
+    ``network_time`` is the time not accounted for by the other
+    phases: sending and receiving messages, and waiting for the
+    server to read the request (e.g. until next defer tick).
+    ``queue_time`` is the time between reception of the request by
+    the server and the start of its execution.
+    """
+    function: str
+    start: float
+    request_size: int
+    result_size: int
+    encode_time: float
+    network_time: float
+    queue_time: float
+    server_time: float
+    decode_time: float
+    thread_id: int
+
+    @property
+    def total_time(self) -> float:
+        """
+        Total time of the call.
+
+        :type: float
+        """
+        ...
+
+
+class CallStats(ty.NamedTuple):
+    """
+    Statistics of the traced calls of a function.
+
+    Times are in seconds. ``total_time`` is the sum of call times, and
+    ``mean_time``, ``median_time``, ``p90_time``, ``p99_time`` and
+    ``max_time`` are statistics of call times. Phase times (e.g.
+    ``network_time``) and sizes are means per call (see ``CallTrace``).
+    ``histogram`` holds the numbers of calls in each bin of
+    ``HISTOGRAM_BINS``.
+    """
+    n_calls: int
+    total_time: float
+    mean_time: float
+    median_time: float
+    p90_time: float
+    p99_time: float
+    max_time: float
+    encode_time: float
+    network_time: float
+    queue_time: float
+    server_time: float
+    decode_time: float
+    request_size: float
+    result_size: float
+    histogram: ty.List[int]
+
+
+def _get_percentile(
+    sorted_values: ty.Sequence[float], percent: float
+) -> float:
+    ...
+
+
+def clear() -> None:
+    """Delete all traces."""
+    ...
+
+
+def export_chrome_trace(
+    path: str, traces: ty.Optional[ty.Iterable[CallTrace]] = None
+) -> None:
+    """
+    Export traces to a Chrome trace file.
+
+    Each call is a complete event on the track of its thread, with
+    its phases as nested events. Phases are laid out in order, with
+    network time as a single block before server phases.
+
+    Parameters
+    ----------
+    path : str
+        Path of JSON file.
+    traces : list of CallTrace, optional
+        Traces to export. Defaults to all recorded traces.
+    """
+    ...
+
+
+def get_function_name(
+    function: ty.Union[ty.Callable[..., ty.Any], ty.Dict[str, ty.Any], str]
+) -> str:
+    """
+    Return name of a requested function, as used in traces.
+
+    Parameters
+    ----------
+    function : callable, dict or str
+        Function, encoded function or special request (e.g. "HOLD").
+
+    Returns
+    -------
+    str
+    """
+    ...
+
+
+def get_traces() -> ty.List[CallTrace]:
+    """
+    Return recorded traces.
+
+    At most ``reapy.config.TRACE_BUFFER_SIZE`` traces are kept (the
+    most recent ones).
+
+    Returns
+    -------
+    traces : list of CallTrace
+        Traces in order of completion.
+    """
+    ...
+
+
+def record(trace: CallTrace) -> None:
+    """
+    Record trace of a call.
+
+    Parameters
+    ----------
+    trace : CallTrace
+    """
+    ...
+
+
+def stats(
+    traces: ty.Optional[ty.Iterable[CallTrace]] = None
+) -> ty.Dict[str, CallStats]:
+    """
+    Return statistics of traced calls, per function.
+
+    Calls are only traced when ``reapy.config.TRACE_CALLS`` is True.
+
+    Parameters
+    ----------
+    traces : list of CallTrace, optional
+        Traces to summarize. Defaults to all recorded traces.
+
+    Returns
+    -------
+    stats : dict
+        Keys are function names, and values are ``CallStats``. They
+        are sorted by decreasing total time.
+
+    Examples
+    --------
+    >>> reapy.config.TRACE_CALLS = True
+    >>> tracks = list(reapy.Project().tracks)
+    >>> for name, s in reapy.stats().items():
+    ...     print(name, s.n_calls, s.mean_time, s.server_time)
+    """
+    ...
@@ -42,5 +42,8 @@ setup(
         'psutil',
         'typing_extensions'
     ],
-    python_requires=">=3.0"
+    extras_require={
+        'numpy': ['numpy']
+    },
+    python_requires=">=3.7"
 )
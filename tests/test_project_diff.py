@@ -0,0 +1,25 @@
+"""Tests of ``Project.diff_since``, run against a fake REAPER."""
+
+import pytest
+
+import reapy
+from reapy import reascript_api as RPR
+from reapy.testing import FakeReaperServer
+
+
+@pytest.fixture(scope="module")
+def server():
+    with FakeReaperServer(defer_interval=.005, select_globally=True) as s:
+        yield s
+
+
+def test_moved_item_is_reported(server):
+    project = reapy.Project()
+    source, destination = project.add_track(0), project.add_track(1)
+    item = source.add_midi_item(0, 1)
+    diff = project.diff_since()
+    assert not project.diff_since(diff.token)
+    RPR.MoveMediaItemToTrack(item.id, destination.id)
+    diff = project.diff_since(diff.token)
+    assert [record.id for record in diff.items] == [item.id]
+    assert diff.parents[diff.items[0].guid] == destination.GUID